@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any
+
+import msgpack
+from fastapi import Request
+
+JSON = "json"
+JSON_GZIP = "json+gzip"
+MSGPACK = "msgpack"
+
+MEDIA_TYPES = {
+    JSON: "application/json",
+    JSON_GZIP: "application/json",
+    MSGPACK: "application/x-msgpack",
+}
+# Accept values that select msgpack; anything else (including */*) gets JSON.
+_MSGPACK_ACCEPT = ("application/x-msgpack", "application/msgpack")
+_JSON_ACCEPT = ("application/json", "application/*", "*/*")
+
+_json_encoder = json.JSONEncoder(separators=(",", ":"))
+
+
+def _qualities(header: str) -> dict[str, float]:
+    """``{token: q}`` for an ``Accept``-style header; a malformed q counts as 0."""
+    qualities: dict[str, float] = {}
+    for part in header.split(","):
+        token, *params = (piece.strip() for piece in part.split(";"))
+        if not token:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[token.lower()] = q
+    return qualities
+
+
+def _first_quality(qualities: dict[str, float], tokens: tuple[str, ...]) -> float | None:
+    """q of the most specific of ``tokens`` the header lists, None when it lists none."""
+    return next((qualities[token] for token in tokens if token in qualities), None)
+
+
+def negotiate(request: Request, gzip_enabled: bool = False) -> str:
+    """Pick the representation of a read response from ``Accept``/``Accept-Encoding``.
+
+    msgpack is only chosen when asked for by name with q > 0, and not ranked below
+    JSON; gzip likewise needs q > 0 (by name or ``*``) and ``identity`` not ranked above.
+    """
+    accept = _qualities(request.headers.get("accept", ""))
+    msgpack_q = max((accept.get(media_type, 0.0) for media_type in _MSGPACK_ACCEPT), default=0.0)
+    if msgpack_q > 0 and msgpack_q >= (_first_quality(accept, _JSON_ACCEPT) or 0.0):
+        return MSGPACK
+    if gzip_enabled:
+        encodings = _qualities(request.headers.get("accept-encoding", ""))
+        gzip_q = _first_quality(encodings, ("gzip", "*")) or 0.0
+        identity_q = _first_quality(encodings, ("identity", "*"))
+        # Unlisted, identity stays acceptable but ranks below anything the client named.
+        if gzip_q > 0 and (identity_q is None or gzip_q >= identity_q):
+            return JSON_GZIP
+    return JSON
+
+
+def encode(payload: Any, representation: str) -> bytes:
+    """Encode plain read DTOs (dicts, lists, scalars) as ``representation``."""
+    if representation == MSGPACK:
+        return msgpack.packb(payload, use_bin_type=True)
+    body = _json_encoder.encode(payload).encode()
+    return gzip.compress(body) if representation == JSON_GZIP else body
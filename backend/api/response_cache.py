@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import gzip
+import math
+from collections.abc import Mapping
+from typing import Any, TypedDict
+
+from application.mediator.behaviors import CacheableQuery, fresh_seconds
+from application.read_models.ttl_config import response_cache_key
+from fastapi import Request, Response
+from infrastructure.cache.cache_provider import AsyncCacheBackend
+
+from api.representations import JSON, JSON_GZIP, MEDIA_TYPES, MSGPACK, encode, negotiate
+
+
+class CachedResponse(TypedDict):
+    """A response body exactly as it goes on the wire, with its cacheable headers."""
+
+    body: bytes
+    headers: dict[str, str]
+
+
+class ResponseCache:
+    """Opt-in store of fully encoded read responses, one entry per query and representation.
+
+    A hit is one cache read handed to ``Response`` as-is: no per-item decode, no
+    pydantic validation, no JSON encoding. Entries use the query's TTL and key
+    (generation included), and detail entries are deleted with the detail key
+    (see ``InvalidationService``).
+
+    With ``follow_source_freshness`` (set when ``CacheBehavior`` serves stale entries)
+    an encoded entry never outlives the freshness of the query entry it came from, so
+    a value served during a stale-while-revalidate window is not kept for a full TTL.
+    """
+
+    def __init__(
+        self,
+        cache: AsyncCacheBackend,
+        gzip_enabled: bool = True,
+        follow_source_freshness: bool = False,
+    ) -> None:
+        self.cache = cache
+        self.gzip_enabled = gzip_enabled
+        self.follow_source_freshness = follow_source_freshness
+
+    def representation(self, request: Request) -> str:
+        return negotiate(request, self.gzip_enabled)
+
+    async def key_for(self, query: CacheableQuery) -> str:
+        key = query.cache_key
+        namespace = getattr(query, "cache_namespace", None)
+        if namespace is not None:
+            key = f"{key}:g{await self.cache.get_generation(namespace)}"
+        return key
+
+    async def get(self, key: str, representation: str) -> CachedResponse | None:
+        return await self.cache.get(response_cache_key(key, representation))
+
+    async def ttl_for(self, key: str, ttl_seconds: int) -> int:
+        """TTL for the entries of ``key``: ``ttl_seconds``, capped at the source's freshness."""
+        if not self.follow_source_freshness:
+            return ttl_seconds
+        fresh = fresh_seconds(await self.cache.get(key))
+        return ttl_seconds if fresh is None else max(min(ttl_seconds, math.ceil(fresh)), 0)
+
+    async def put(
+        self, key: str, payload: Any, headers: Mapping[str, str], ttl_seconds: int
+    ) -> dict[str, CachedResponse]:
+        """Encode ``payload`` in every representation, store them in one round-trip.
+
+        Nothing is stored when ``ttl_seconds`` is 0 (e.g. the payload was already stale).
+        """
+        body = encode(payload, JSON)
+        bodies = {JSON: body, MSGPACK: encode(payload, MSGPACK)}
+        if self.gzip_enabled:
+            bodies[JSON_GZIP] = gzip.compress(body)
+        entries = {
+            rep: CachedResponse(body=rep_body, headers=dict(headers))
+            for rep, rep_body in bodies.items()
+        }
+        if ttl_seconds > 0:
+            await self.cache.set_many(
+                {response_cache_key(key, rep): entry for rep, entry in entries.items()},
+                ttl_seconds,
+            )
+        return entries
+
+    def to_response(
+        self,
+        entry: CachedResponse,
+        representation: str,
+        headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        response = Response(
+            content=entry["body"],
+            media_type=MEDIA_TYPES[representation],
+            headers={**entry["headers"], **(headers or {})},
+        )
+        response.headers["Vary"] = "Accept, Accept-Encoding" if self.gzip_enabled else "Accept"
+        if representation == JSON_GZIP:
+            response.headers["Content-Encoding"] = "gzip"
+        return response
+
+
+def get_response_cache(request: Request) -> ResponseCache | None:
+    # Built in the app lifespan when RESPONSE_CACHE_ENABLED is set.
+    return getattr(request.app.state, "response_cache", None)
@@ -1,77 +1,257 @@
 from __future__ import annotations
 
-import hashlib
-from collections.abc import Sequence
-from typing import Any
+import json
+import struct
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import Any, Literal
 
 import msgpack
 from app import models, schemas
-from app.dependencies import get_db
+from app.dependencies import get_async_db, get_async_read_db, get_async_session_factory
 from application.commands.employees import (
+    BulkCreateEmployeesCommand,
+    BulkDeleteEmployeesCommand,
+    BulkUpdateEmployeesCommand,
     CreateEmployeeCommand,
     DeleteEmployeeCommand,
     UpdateEmployeeCommand,
 )
-from application.mediator.mediator import Mediator
-from application.mediator.registry import create_mediator
+from application.mediator.mediator import MediatorScope
 from application.queries.employees import GetEmployeeByIdQuery, GetEmployeesQuery
-from fastapi import APIRouter, Depends, HTTPException, Request, Response
-from sqlalchemy.orm import Session
+from application.read_models.employees import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from application.read_models.etag import ETaggedDTO
+from config import EXPORT_CHUNK_SIZE
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from infrastructure.read_repository.employees_read_repository import (
+    AsyncEmployeesReadRepository,
+)
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from api import representations
+from api.response_cache import ResponseCache, get_response_cache
 
 router = APIRouter(prefix="/employees", tags=["employees"])
 
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "msgpack": "application/x-msgpack"}
+_json_encoder = json.JSONEncoder(separators=(",", ":"))
 
-def get_mediator(db: Session = Depends(get_db)) -> Mediator:
-    mediator = create_mediator(db)
-    return mediator
+ChunkEncoder = Callable[[Sequence[Row[Any]]], bytes]
 
 
-def _compute_etag(payload: Sequence[Any]) -> str:
-    packed = msgpack.packb(payload, use_bin_type=True)
-    # BLAKE2b is fast and suitable for non-cryptographic content hashing (ETag).
-    return hashlib.blake2b(packed, digest_size=16).hexdigest()
+async def get_mediator(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    read_db: AsyncSession = Depends(get_async_read_db),
+) -> MediatorScope:
+    # The container is built once in the app lifespan; per request we only bind the sessions.
+    return request.app.state.container.scope(async_db=db, async_read_db=read_db)
 
 
 @router.get("", response_model=list[schemas.Employee])
-def list_employees(
-    request: Request, response: Response, mediator: Mediator = Depends(get_mediator)
-) -> list[models.Employee]:
-    employees = mediator.send(GetEmployeesQuery())
-    etag = _compute_etag(employees)
-    if request.headers.get("if-none-match") == etag:
+async def list_employees(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: int | None = Query(None, ge=0),
+    mediator: MediatorScope = Depends(get_mediator),
+    response_cache: ResponseCache | None = Depends(get_response_cache),
+) -> Response:
+    # The body stays a plain array; the cursor travels in headers so clients that
+    # read a single page keep working unchanged.
+    if_none_match = request.headers.get("if-none-match")
+    query = GetEmployeesQuery(limit=limit, after=after, if_none_match=if_none_match)
+    if response_cache is not None:
+        return await _cached_list_response(request, query, mediator, response_cache)
+    result: ETaggedDTO = await mediator.send_async(query)
+    # The ETag was computed when the page was cached; a match never touches the payload.
+    etag = result["etag"]
+    if if_none_match == etag:
         return Response(status_code=304, headers={"ETag": etag})
-    response.headers["ETag"] = etag
-    return employees
+    page = result["value"]
+    headers = {"ETag": etag, **_next_page_headers(request, page["next_cursor"], limit)}
+    return _dto_response(request, page["items"], headers)
+
+
+async def _cached_list_response(
+    request: Request,
+    query: GetEmployeesQuery,
+    mediator: MediatorScope,
+    response_cache: ResponseCache,
+) -> Response:
+    representation = response_cache.representation(request)
+    key = await response_cache.key_for(query)
+    entry = await response_cache.get(key, representation)
+    if entry is None:
+        result: ETaggedDTO = await mediator.send_async(query)
+        if query.if_none_match == result["etag"]:
+            return Response(status_code=304, headers={"ETag": result["etag"]})
+        page = result["value"]
+        headers = {"ETag": result["etag"]}
+        if page["next_cursor"] is not None:
+            headers["X-Next-Cursor"] = str(page["next_cursor"])
+        ttl = await response_cache.ttl_for(key, query.cache_ttl_seconds)
+        entries = await response_cache.put(key, page["items"], headers, ttl)
+        entry = entries[representation]
+    elif query.if_none_match == entry["headers"]["ETag"]:
+        return Response(status_code=304, headers={"ETag": entry["headers"]["ETag"]})
+    next_cursor = entry["headers"].get("X-Next-Cursor")
+    return response_cache.to_response(
+        entry,
+        representation,
+        _next_page_headers(request, None if next_cursor is None else int(next_cursor), query.limit),
+    )
+
+
+def _dto_response(
+    request: Request,
+    payload: Any,
+    headers: dict[str, str] | None = None,
+    status_code: int = 200,
+) -> Response:
+    # Read DTOs come from typed columns and already match the response schemas, so
+    # they skip ``response_model`` validation and go straight to bytes (JSON, or
+    # msgpack when the client asks for it). The models stay on the decorators for
+    # the OpenAPI docs.
+    representation = representations.negotiate(request)
+    response = Response(
+        representations.encode(payload, representation),
+        status_code=status_code,
+        media_type=representations.MEDIA_TYPES[representation],
+        headers=headers,
+    )
+    response.headers["Vary"] = "Accept"
+    return response
+
+
+def _next_page_headers(request: Request, next_cursor: int | None, limit: int) -> dict[str, str]:
+    if next_cursor is None:
+        return {}
+    # Built per request: the Link URL depends on the host the client used.
+    next_url = request.url.include_query_params(after=next_cursor, limit=limit)
+    return {"X-Next-Cursor": str(next_cursor), "Link": f'<{next_url}>; rel="next"'}
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_employees(
+    format: Literal["ndjson", "msgpack"] = Query("ndjson"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
+) -> StreamingResponse:
+    """Stream every employee for bulk consumers (nightly syncs, exports).
+
+    ``ndjson`` writes one JSON object per line; ``msgpack`` writes one frame per
+    chunk: a 4-byte big-endian length followed by a msgpack array of employee maps.
+    Bypasses the mediator on purpose: nothing in the query pipeline (cache, ETag,
+    pydantic validation) makes sense for an unbounded stream.
+    """
+    encode: ChunkEncoder = _ndjson_chunk if format == "ndjson" else _msgpack_frame
+    return StreamingResponse(
+        _export_chunks(session_factory, encode), media_type=EXPORT_MEDIA_TYPES[format]
+    )
+
+
+async def _export_chunks(
+    session_factory: async_sessionmaker[AsyncSession],
+    encode: ChunkEncoder,
+) -> AsyncIterator[bytes]:
+    async with session_factory() as db:
+        async for rows in AsyncEmployeesReadRepository(db).stream_rows(EXPORT_CHUNK_SIZE):
+            yield encode(rows)
+
+
+def _ndjson_chunk(rows: Sequence[Row[Any]]) -> bytes:
+    encode = _json_encoder.encode
+    return "".join(f"{encode(row._asdict())}\n" for row in rows).encode()
+
+
+def _msgpack_frame(rows: Sequence[Row[Any]]) -> bytes:
+    packed = msgpack.packb([row._asdict() for row in rows], use_bin_type=True)
+    return struct.pack(">I", len(packed)) + packed
+
+
+@router.post("/bulk", response_model=list[schemas.Employee], status_code=201)
+async def bulk_create_employees(
+    request: Request,
+    payloads: list[schemas.EmployeeCreate],
+    mediator: MediatorScope = Depends(get_mediator),
+) -> Response:
+    """Create many employees in one transaction, with one outbox insert and one invalidation."""
+    created = await mediator.send_async(BulkCreateEmployeesCommand(payloads))
+    return _dto_response(request, created, status_code=201)
+
+
+@router.put("/bulk", response_model=list[schemas.Employee])
+async def bulk_update_employees(
+    request: Request,
+    payloads: list[schemas.EmployeeBulkUpdate],
+    mediator: MediatorScope = Depends(get_mediator),
+) -> Response:
+    """Replace many employees at once; unknown ids are skipped and left out of the result."""
+    updated = await mediator.send_async(BulkUpdateEmployeesCommand(payloads))
+    return _dto_response(request, updated)
+
+
+@router.delete("/bulk", response_model=schemas.EmployeeBulkDeleteResult)
+async def bulk_delete_employees(
+    payload: schemas.EmployeeBulkDelete,
+    mediator: MediatorScope = Depends(get_mediator),
+) -> schemas.EmployeeBulkDeleteResult:
+    deleted = await mediator.send_async(BulkDeleteEmployeesCommand(payload.ids))
+    return schemas.EmployeeBulkDeleteResult(deleted=deleted)
 
 
 @router.get("/{employee_id}", response_model=schemas.Employee)
-def read_employee(employee_id: int, mediator: Mediator = Depends(get_mediator)) -> models.Employee:
-    employee: models.Employee | None = mediator.send(GetEmployeeByIdQuery(employee_id))
+async def read_employee(
+    employee_id: int,
+    request: Request,
+    mediator: MediatorScope = Depends(get_mediator),
+    response_cache: ResponseCache | None = Depends(get_response_cache),
+) -> Response:
+    query = GetEmployeeByIdQuery(employee_id)
+    if response_cache is not None:
+        representation = response_cache.representation(request)
+        key = await response_cache.key_for(query)
+        entry = await response_cache.get(key, representation)
+        if entry is None:
+            employee = await mediator.send_async(query)
+            if not employee:
+                raise HTTPException(status_code=404, detail="Employee not found")
+            ttl = await response_cache.ttl_for(key, query.cache_ttl_seconds)
+            entries = await response_cache.put(key, employee, {}, ttl)
+            entry = entries[representation]
+        return response_cache.to_response(entry, representation)
+    employee = await mediator.send_async(query)
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
-    return employee
+    return _dto_response(request, employee)
 
 
 @router.post("", response_model=schemas.Employee, status_code=201)
-def create_new_employee(
-    payload: schemas.EmployeeCreate, mediator: Mediator = Depends(get_mediator)
+async def create_new_employee(
+    payload: schemas.EmployeeCreate, mediator: MediatorScope = Depends(get_mediator)
 ) -> models.Employee:
-    return mediator.send(CreateEmployeeCommand(payload))
+    return await mediator.send_async(CreateEmployeeCommand(payload))
 
 
 @router.put("/{employee_id}", response_model=schemas.Employee)
-def update_existing_employee(
-    employee_id: int, payload: schemas.EmployeeUpdate, mediator: Mediator = Depends(get_mediator)
+async def update_existing_employee(
+    employee_id: int,
+    payload: schemas.EmployeeUpdate,
+    mediator: MediatorScope = Depends(get_mediator),
 ) -> models.Employee:
-    employee: models.Employee | None = mediator.send(UpdateEmployeeCommand(employee_id, payload))
+    employee: models.Employee | None = await mediator.send_async(
+        UpdateEmployeeCommand(employee_id, payload)
+    )
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     return employee
 
 
 @router.delete("/{employee_id}", status_code=204, response_class=Response)
-def delete_employee(employee_id: int, mediator: Mediator = Depends(get_mediator)) -> Response:
-    employee: models.Employee | None = mediator.send(DeleteEmployeeCommand(employee_id))
+async def delete_employee(
+    employee_id: int, mediator: MediatorScope = Depends(get_mediator)
+) -> Response:
+    employee: models.Employee | None = await mediator.send_async(DeleteEmployeeCommand(employee_id))
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     return Response(status_code=204)
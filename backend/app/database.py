@@ -1,15 +1,222 @@
 from __future__ import annotations
 
+import itertools
 import os
-from typing import Final
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Final
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from config import (
+    READ_MODEL_DB_NAME,
+    READ_MODEL_MAX_OVERFLOW,
+    READ_MODEL_POOL_SIZE,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CACHE_SIZE,
+    SQLITE_MMAP_SIZE,
+    SQLITE_PROFILE,
+    SQLITE_SYNCHRONOUS,
+    SQLITE_TEMP_STORE,
+    WRITE_DB_MAX_OVERFLOW,
+    WRITE_DB_POOL_SIZE,
+)
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, declarative_base, scoped_session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 DB_DIR: Final = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
 os.makedirs(DB_DIR, exist_ok=True)
 DATABASE_URL: Final = f"sqlite:///{os.path.join(DB_DIR, 'employees.db')}"
+ASYNC_DATABASE_URL: Final = f"sqlite+aiosqlite:///{os.path.join(DB_DIR, 'employees.db')}"
+READ_MODEL_DATABASE_URL: Final = f"sqlite:///{os.path.join(DB_DIR, READ_MODEL_DB_NAME)}"
+ASYNC_READ_MODEL_DATABASE_URL: Final = (
+    f"sqlite+aiosqlite:///{os.path.join(DB_DIR, READ_MODEL_DB_NAME)}"
+)
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker[Session](autocommit=False, autoflush=False, bind=engine)
+SQLITE_PROFILES: Final[dict[str, dict[str, str | int]]] = {
+    "wal": {
+        # Readers no longer wait behind writers (and vice versa) on the file lock.
+        "journal_mode": "WAL",
+        "synchronous": SQLITE_SYNCHRONOUS,
+        "mmap_size": SQLITE_MMAP_SIZE,
+        "cache_size": SQLITE_CACHE_SIZE,
+        "busy_timeout": SQLITE_BUSY_TIMEOUT_MS,
+        "temp_store": SQLITE_TEMP_STORE,
+    },
+    "default": {},
+}
+
+
+def sqlite_pragmas(profile: str = SQLITE_PROFILE, read_only: bool = False) -> dict[str, str | int]:
+    """Pragmas for ``profile``; ``read_only`` connections also refuse any write."""
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLITE_PROFILE {profile!r}; expected {sorted(SQLITE_PROFILES)}")
+    pragmas = dict(SQLITE_PROFILES[profile])
+    if read_only:
+        pragmas["query_only"] = "ON"
+    return pragmas
+
+
+def configure_sqlite(engine: Engine | AsyncEngine, pragmas: Mapping[str, str | int]) -> None:
+    """Run ``PRAGMA name=value`` on every new DBAPI connection of ``engine``."""
+    if not pragmas:
+        return
+    target = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    @event.listens_for(target, "connect")
+    def _apply_pragmas(dbapi_connection: Any, _record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+# Write model (employees, outbox) and read model (projections) have separate
+# metadata so each can live in its own database.
 Base = declarative_base()
+ReadBase = declarative_base()
+
+
+class PartitionedSession(Session):
+    """Session spanning both stores: read-model tables go to ``read_model_bind``.
+
+    The projector and the outbox relay keep using one session for the outbox and the
+    projections. Its commit commits each database in turn, not two-phase: a crash
+    in between can leave the read model one batch ahead of (replayed harmlessly,
+    projections are upserts) or behind the outbox. Tables are bound per session so
+    Core statements on them route too, not just ORM entities.
+    """
+
+    def __init__(self, *args: Any, read_model_bind: Engine | AsyncEngine | None = None, **kw: Any):
+        if read_model_bind is not None:
+            bind = (
+                read_model_bind.sync_engine
+                if isinstance(read_model_bind, AsyncEngine)
+                else read_model_bind
+            )
+            tables = dict.fromkeys(ReadBase.metadata.tables.values(), bind)
+            kw["binds"] = {ReadBase: bind, **tables, **(kw.get("binds") or {})}
+        super().__init__(*args, **kw)
+
+
+# aiosqlite would default to NullPool (a new connection, and pragmas, per session).
+def _pool_args(pool_size: int, max_overflow: int) -> dict[str, Any]:
+    return {"pool_size": pool_size, "max_overflow": max_overflow}
+
+
+_write_pool = _pool_args(WRITE_DB_POOL_SIZE, WRITE_DB_MAX_OVERFLOW)
+_read_pool = _pool_args(READ_MODEL_POOL_SIZE, READ_MODEL_MAX_OVERFLOW)
+
+engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False}, **_write_pool)
+configure_sqlite(engine, sqlite_pragmas())
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, poolclass=AsyncAdaptedQueuePool, **_write_pool
+)
+configure_sqlite(async_engine, sqlite_pragmas())
+# Writable read-model engines, used by projections (inline or through the relay).
+read_model_engine = create_engine(
+    READ_MODEL_DATABASE_URL, connect_args={"check_same_thread": False}, **_write_pool
+)
+configure_sqlite(read_model_engine, sqlite_pragmas())
+async_read_model_engine = create_async_engine(
+    ASYNC_READ_MODEL_DATABASE_URL, poolclass=AsyncAdaptedQueuePool, **_write_pool
+)
+configure_sqlite(async_read_model_engine, sqlite_pragmas())
+
+SessionLocal = sessionmaker[Session](
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    class_=PartitionedSession,
+    read_model_bind=read_model_engine,
+)
+# expire_on_commit=False: async code cannot lazy-load expired attributes after commit.
+AsyncSessionLocal = async_sessionmaker[AsyncSession](
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    sync_session_class=PartitionedSession,
+    read_model_bind=async_read_model_engine,
+)
+
+# Separate pools of query_only connections to the read model: queries never queue
+# for a connection behind projections or commands, and cannot write by accident.
+read_engine = create_engine(
+    READ_MODEL_DATABASE_URL, connect_args={"check_same_thread": False}, **_read_pool
+)
+configure_sqlite(read_engine, sqlite_pragmas(read_only=True))
+ReadSessionLocal = sessionmaker[Session](autocommit=False, autoflush=False, bind=read_engine)
+async_read_engine = create_async_engine(
+    ASYNC_READ_MODEL_DATABASE_URL, poolclass=AsyncAdaptedQueuePool, **_read_pool
+)
+configure_sqlite(async_read_engine, sqlite_pragmas(read_only=True))
+AsyncReadSessionLocal = async_sessionmaker[AsyncSession](
+    async_read_engine, autoflush=False, expire_on_commit=False
+)
+
+
+def create_schema(write_bind: Engine = engine, read_model_bind: Engine | None = None) -> None:
+    """Create missing write-model tables and read-model tables (same engine by default)."""
+    Base.metadata.create_all(bind=write_bind)
+    ReadBase.metadata.create_all(bind=read_model_bind or write_bind)
+
+
+_scope_ids = itertools.count()
+_current_scope: ContextVar[int | None] = ContextVar("session_scope", default=None)
+
+
+def _scope_id() -> int:
+    scope = _current_scope.get()
+    if scope is None:
+        raise RuntimeError("No database session bound; wrap the call in bind_session()")
+    return scope
+
+
+# Process-wide proxy handed to long-lived repositories and handlers; it resolves to
+# whichever session the current request (or worker) bound with ``bind_session``.
+ScopedSession = scoped_session(SessionLocal, scopefunc=_scope_id)
+AsyncScopedSession = async_scoped_session(AsyncSessionLocal, scopefunc=_scope_id)
+# Same, for query-side repositories; falls back to the write session when no read
+# session is bound (workers, CLIs, tests).
+ReadScopedSession = scoped_session(ReadSessionLocal, scopefunc=_scope_id)
+AsyncReadScopedSession = async_scoped_session(AsyncReadSessionLocal, scopefunc=_scope_id)
+
+
+@contextmanager
+def bind_session(db: Session, read_db: Session | None = None) -> Iterator[Session]:
+    """Route ``ScopedSession`` to ``db`` (and ``ReadScopedSession`` to ``read_db``)."""
+    token = _current_scope.set(next(_scope_ids))
+    ScopedSession.registry.set(db)
+    ReadScopedSession.registry.set(read_db or db)
+    try:
+        yield db
+    finally:
+        ReadScopedSession.registry.clear()
+        ScopedSession.registry.clear()
+        _current_scope.reset(token)
+
+
+@contextmanager
+def bind_async_session(
+    db: AsyncSession, read_db: AsyncSession | None = None
+) -> Iterator[AsyncSession]:
+    """Async counterpart of ``bind_session`` for ``AsyncScopedSession``.
+
+    Context variables follow the awaiting task, so the binding holds across awaits.
+    """
+    token = _current_scope.set(next(_scope_ids))
+    AsyncScopedSession.registry.set(db)
+    AsyncReadScopedSession.registry.set(read_db or db)
+    try:
+        yield db
+    finally:
+        AsyncReadScopedSession.registry.clear()
+        AsyncScopedSession.registry.clear()
+        _current_scope.reset(token)
@@ -1,8 +1,9 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session
 
-from .database import SessionLocal
+from .database import AsyncReadSessionLocal, AsyncSessionLocal, SessionLocal
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -11,3 +12,19 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    # Sessions connect lazily: requests that never query never check out a connection.
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    # Streaming responses outlive yield-dependencies, so they open their own session.
+    return AsyncReadSessionLocal
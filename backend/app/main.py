@@ -1,10 +1,23 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
+from api.response_cache import ResponseCache
 from api.routes import employees
+from application.mediator.registry import create_container
+from config import (
+    CACHE_STALE_TTL_SECONDS,
+    OUTBOX_RELAY_EXTERNAL,
+    OUTBOX_RELAY_IN_PROCESS,
+    OUTBOX_RETENTION_IN_PROCESS,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_GZIP,
+)
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from infrastructure.outbox.outbox_repository import ensure_outbox_indexes
 
-from .database import Base, engine
+from .database import create_schema, engine, read_model_engine
 from .dependencies import get_db
 
 # Structured logging (JSON-like) so behavior logs quedan parseables.
@@ -18,9 +31,49 @@ logging.basicConfig(level=logging.INFO, handlers=[handler], force=True)
 # Show per-query timings in console for the read-side behaviors (DEBUG for timing).
 logging.getLogger("mediator.timing").setLevel(logging.DEBUG)
 
-Base.metadata.create_all(bind=engine)
+create_schema(engine, read_model_engine)
+ensure_outbox_indexes(engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Build cache backend, Redis pool, behaviors and handlers once per process.
+    container = create_container()
+    if not container.inline_dispatch and not (OUTBOX_RELAY_IN_PROCESS or OUTBOX_RELAY_EXTERNAL):
+        await container.aclose()
+        # Nothing would ever project the outbox: reads would silently stop following writes.
+        raise RuntimeError(
+            "OUTBOX_DISPATCH_MODE=relay needs OUTBOX_RELAY_IN_PROCESS=true or a "
+            "`python -m cli.outbox_relay` process declared with OUTBOX_RELAY_EXTERNAL=true"
+        )
+    app.state.container = container
+    app.state.response_cache = (
+        ResponseCache(
+            container.async_cache,
+            gzip_enabled=RESPONSE_CACHE_GZIP,
+            follow_source_freshness=CACHE_STALE_TTL_SECONDS > 0,
+        )
+        if RESPONSE_CACHE_ENABLED
+        else None
+    )
+    relay = None
+    if not container.inline_dispatch and OUTBOX_RELAY_IN_PROCESS:
+        relay = container.create_relay()
+        relay.start()
+    retention = container.create_retention() if OUTBOX_RETENTION_IN_PROCESS else None
+    if retention is not None:
+        retention.start()
+    try:
+        yield
+    finally:
+        if retention is not None:
+            retention.stop()
+        if relay is not None:
+            relay.stop()
+        await container.aclose()
+
 
-app = FastAPI(title="Employee CRUD API")
+app = FastAPI(title="Employee CRUD API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -28,6 +81,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Browsers hide non-safelisted response headers unless they are exposed explicitly.
+    expose_headers=["ETag", "X-Next-Cursor", "Link"],
 )
 
 app.include_router(employees.router)
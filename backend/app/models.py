@@ -1,6 +1,6 @@
 from sqlalchemy import Boolean, Column, Float, Integer, String
 
-from .database import Base
+from .database import Base, ReadBase
 
 
 class Employee(Base):
@@ -14,7 +14,7 @@ class Employee(Base):
     in_vacation = Column(Boolean, default=False, nullable=False)
 
 
-class ReadEmployee(Base):
+class ReadEmployee(ReadBase):
     __tablename__ = "read_employees"
 
     id = Column(Integer, primary_key=True, index=True)
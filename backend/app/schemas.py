@@ -22,3 +22,15 @@ class EmployeeUpdate(EmployeeBase):
 
 class Employee(EmployeeBase):
     id: int
+
+
+class EmployeeBulkUpdate(EmployeeUpdate):
+    id: int
+
+
+class EmployeeBulkDelete(BaseModel):
+    ids: list[int] = Field(..., min_items=1)
+
+
+class EmployeeBulkDeleteResult(BaseModel):
+    deleted: list[int]
@@ -20,3 +20,12 @@ class ICommandHandler(Generic[CommandType, ResultType], ABC):
     def handle(self, command: CommandType) -> ResultType:
         """Handle a command instance."""
         raise NotImplementedError
+
+
+class IAsyncCommandHandler(Generic[CommandType, ResultType], ABC):
+    """Interface for command handlers on the async (``send_async``) path."""
+
+    @abstractmethod
+    async def handle(self, command: CommandType) -> ResultType:
+        """Handle a command instance without blocking the event loop."""
+        raise NotImplementedError
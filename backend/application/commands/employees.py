@@ -1,13 +1,59 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, cast
 
 from app import models, schemas
 from domain.events.employees import EmployeeCreated, EmployeeDeleted, EmployeeUpdated
-from infrastructure.outbox.outbox_repository import OutboxRepository
+from infrastructure.outbox.outbox_repository import AsyncOutboxRepository, OutboxRepository
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from application.commands.base import ICommand, ICommandHandler
+from application.commands.base import IAsyncCommandHandler, ICommand, ICommandHandler
+from application.read_models.employees import EmployeeListDTO
+
+_employees = models.Employee.__table__
+_EMPLOYEE_FIELDS = ("name", "lastname", "salary", "address", "in_vacation")
+# Ids per IN (...) list; keeps bound parameters well under SQLite's limit.
+_BULK_CHUNK_SIZE = 500
+# Returns whole rows so results need no correlation with parameter order: asking
+# for that order makes SQLAlchemy fall back to one INSERT per row on SQLite.
+_INSERT_EMPLOYEES = insert(_employees).returning(*_employees.c)
+# Run as one executemany; bind names must not collide with column names.
+_UPDATE_EMPLOYEE = (
+    update(_employees)
+    .where(_employees.c.id == bindparam("_id"))
+    .values({field: bindparam(f"_{field}") for field in _EMPLOYEE_FIELDS})
+)
+
+
+def _created_event(employee: models.Employee) -> EmployeeCreated:
+    return EmployeeCreated(
+        id=employee.id,
+        name=employee.name,
+        lastname=employee.lastname,
+        salary=employee.salary,
+        address=employee.address,
+        in_vacation=employee.in_vacation,
+    )
+
+
+def _chunks(ids: list[int], size: int = _BULK_CHUNK_SIZE) -> Iterator[list[int]]:
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
+
+def _apply_changes(employee: models.Employee, payload: schemas.EmployeeUpdate) -> dict[str, object]:
+    """Copy the payload onto the entity and return only the fields that changed."""
+    fields_changed: dict[str, object] = {}
+    for field, value in payload.dict().items():
+        if getattr(employee, field) != value:
+            fields_changed[field] = value
+            setattr(employee, field, value)
+    return fields_changed
 
 
 @dataclass
@@ -25,20 +71,30 @@ class CreateEmployeeCommandHandler(ICommandHandler[CreateEmployeeCommand, models
         self.db.add(db_employee)
         self.db.flush()
 
-        event = EmployeeCreated(
-            id=db_employee.id,
-            name=db_employee.name,
-            lastname=db_employee.lastname,
-            salary=db_employee.salary,
-            address=db_employee.address,
-            in_vacation=db_employee.in_vacation,
-        )
-        self.outbox_repository.add_event(event)
+        self.outbox_repository.add_event(_created_event(db_employee))
         self.db.commit()
         self.db.refresh(db_employee)
         return db_employee
 
 
+class AsyncCreateEmployeeCommandHandler(
+    IAsyncCommandHandler[CreateEmployeeCommand, models.Employee]
+):
+    def __init__(self, db: AsyncSession, outbox_repository: AsyncOutboxRepository):
+        self.db = db
+        self.outbox_repository = outbox_repository
+
+    async def handle(self, command: CreateEmployeeCommand) -> models.Employee:
+        db_employee = models.Employee(**command.payload.dict())
+        self.db.add(db_employee)
+        await self.db.flush()
+
+        self.outbox_repository.add_event(_created_event(db_employee))
+        await self.db.commit()
+        await self.db.refresh(db_employee)
+        return db_employee
+
+
 @dataclass
 class UpdateEmployeeCommand(ICommand):
     employee_id: int
@@ -57,13 +113,7 @@ class UpdateEmployeeCommandHandler(ICommandHandler[UpdateEmployeeCommand, models
         if not employee:
             return None
 
-        payload = command.payload.dict()
-        fields_changed: dict[str, object] = {}
-        for field, value in payload.items():
-            if getattr(employee, field) != value:
-                fields_changed[field] = value
-                setattr(employee, field, value)
-
+        fields_changed = _apply_changes(employee, command.payload)
         if fields_changed:
             event = EmployeeUpdated(id=employee.id, fields_changed=fields_changed)
             self.outbox_repository.add_event(event)
@@ -73,6 +123,30 @@ class UpdateEmployeeCommandHandler(ICommandHandler[UpdateEmployeeCommand, models
         return employee
 
 
+class AsyncUpdateEmployeeCommandHandler(
+    IAsyncCommandHandler[UpdateEmployeeCommand, models.Employee | None]
+):
+    def __init__(self, db: AsyncSession, outbox_repository: AsyncOutboxRepository):
+        self.db = db
+        self.outbox_repository = outbox_repository
+
+    async def handle(self, command: UpdateEmployeeCommand) -> models.Employee | None:
+        employee = await self.db.scalar(
+            select(models.Employee).where(models.Employee.id == command.employee_id)
+        )
+        if not employee:
+            return None
+
+        fields_changed = _apply_changes(employee, command.payload)
+        if fields_changed:
+            event = EmployeeUpdated(id=employee.id, fields_changed=fields_changed)
+            self.outbox_repository.add_event(event)
+
+        await self.db.commit()
+        await self.db.refresh(employee)
+        return employee
+
+
 @dataclass
 class DeleteEmployeeCommand(ICommand):
     employee_id: int
@@ -95,3 +169,202 @@ class DeleteEmployeeCommandHandler(ICommandHandler[DeleteEmployeeCommand, models
         self.outbox_repository.add_event(event)
         self.db.commit()
         return employee
+
+
+class AsyncDeleteEmployeeCommandHandler(
+    IAsyncCommandHandler[DeleteEmployeeCommand, models.Employee | None]
+):
+    def __init__(self, db: AsyncSession, outbox_repository: AsyncOutboxRepository):
+        self.db = db
+        self.outbox_repository = outbox_repository
+
+    async def handle(self, command: DeleteEmployeeCommand) -> models.Employee | None:
+        employee = await self.db.scalar(
+            select(models.Employee).where(models.Employee.id == command.employee_id)
+        )
+        if not employee:
+            return None
+
+        await self.db.delete(employee)
+        event = EmployeeDeleted(id=employee.id)
+        self.outbox_repository.add_event(event)
+        await self.db.commit()
+        return employee
+
+
+@dataclass
+class BulkCreateEmployeesCommand(ICommand):
+    payloads: list[schemas.EmployeeCreate]
+
+
+def _created(rows: Sequence[Mapping[str, Any]]) -> list[EmployeeListDTO]:
+    return sorted((cast(EmployeeListDTO, dict(row)) for row in rows), key=itemgetter("id"))
+
+
+class BulkCreateEmployeesCommandHandler(
+    ICommandHandler[BulkCreateEmployeesCommand, list[EmployeeListDTO]]
+):
+    """Insert every employee with one executemany and enqueue all events in one insert.
+
+    No ORM objects are built: one transaction, one outbox write, and the caller
+    (``CommandInvalidationBehavior``) invalidates the cache once for the batch.
+    """
+
+    def __init__(self, db: Session, outbox_repository: OutboxRepository):
+        self.db = db
+        self.outbox_repository = outbox_repository
+
+    def handle(self, command: BulkCreateEmployeesCommand) -> list[EmployeeListDTO]:
+        rows = [payload.dict() for payload in command.payloads]
+        if not rows:
+            return []
+        created = _created(self.db.execute(_INSERT_EMPLOYEES, rows).mappings().all())
+        self.outbox_repository.add_events([EmployeeCreated(**employee) for employee in created])
+        self.db.commit()
+        return created
+
+
+class AsyncBulkCreateEmployeesCommandHandler(
+    IAsyncCommandHandler[BulkCreateEmployeesCommand, list[EmployeeListDTO]]
+):
+    def __init__(self, db: AsyncSession, outbox_repository: AsyncOutboxRepository):
+        self.db = db
+        self.outbox_repository = outbox_repository
+
+    async def handle(self, command: BulkCreateEmployeesCommand) -> list[EmployeeListDTO]:
+        rows = [payload.dict() for payload in command.payloads]
+        if not rows:
+            return []
+        created = _created((await self.db.execute(_INSERT_EMPLOYEES, rows)).mappings().all())
+        await self.outbox_repository.add_events(
+            [EmployeeCreated(**employee) for employee in created]
+        )
+        await self.db.commit()
+        return created
+
+
+@dataclass
+class BulkUpdateEmployeesCommand(ICommand):
+    payloads: list[schemas.EmployeeBulkUpdate]
+
+    @property
+    def employee_ids(self) -> list[int]:
+        return list(dict.fromkeys(payload.id for payload in self.payloads))
+
+
+def _current_rows_statement(ids: list[int]) -> Any:
+    return select(_employees).where(_employees.c.id.in_(ids))
+
+
+def _plan_updates(
+    command: BulkUpdateEmployeesCommand, current: Mapping[int, Mapping[str, Any]]
+) -> tuple[list[dict[str, Any]], list[EmployeeUpdated], list[EmployeeListDTO]]:
+    """Diff payloads against stored rows: UPDATE parameters, events and the results.
+
+    Unknown ids are skipped; when an id repeats, its last payload wins.
+    """
+    latest = {payload.id: payload.dict(exclude={"id"}) for payload in command.payloads}
+    params: list[dict[str, Any]] = []
+    events: list[EmployeeUpdated] = []
+    updated: list[EmployeeListDTO] = []
+    for employee_id, values in latest.items():
+        row = current.get(employee_id)
+        if row is None:
+            continue
+        updated.append(EmployeeListDTO(id=employee_id, **values))  # type: ignore[typeddict-item]
+        fields_changed = {field: value for field, value in values.items() if row[field] != value}
+        if fields_changed:
+            params.append({"_id": employee_id, **{f"_{k}": v for k, v in values.items()}})
+            events.append(EmployeeUpdated(id=employee_id, fields_changed=fields_changed))
+    return params, events, updated
+
+
+class BulkUpdateEmployeesCommandHandler(
+    ICommandHandler[BulkUpdateEmployeesCommand, list[EmployeeListDTO]]
+):
+    """Diff against the stored rows, then one executemany UPDATE for the changed ones."""
+
+    def __init__(self, db: Session, outbox_repository: OutboxRepository):
+        self.db = db
+        self.outbox_repository = outbox_repository
+
+    def handle(self, command: BulkUpdateEmployeesCommand) -> list[EmployeeListDTO]:
+        current = {
+            row["id"]: row
+            for ids in _chunks(command.employee_ids)
+            for row in self.db.execute(_current_rows_statement(ids)).mappings()
+        }
+        params, events, updated = _plan_updates(command, current)
+        if params:
+            self.db.execute(_UPDATE_EMPLOYEE, params)
+        self.outbox_repository.add_events(events)
+        self.db.commit()
+        return updated
+
+
+class AsyncBulkUpdateEmployeesCommandHandler(
+    IAsyncCommandHandler[BulkUpdateEmployeesCommand, list[EmployeeListDTO]]
+):
+    def __init__(self, db: AsyncSession, outbox_repository: AsyncOutboxRepository):
+        self.db = db
+        self.outbox_repository = outbox_repository
+
+    async def handle(self, command: BulkUpdateEmployeesCommand) -> list[EmployeeListDTO]:
+        current: dict[int, Mapping[str, Any]] = {}
+        for ids in _chunks(command.employee_ids):
+            result = await self.db.execute(_current_rows_statement(ids))
+            current.update((row["id"], row) for row in result.mappings())
+        params, events, updated = _plan_updates(command, current)
+        if params:
+            await self.db.execute(_UPDATE_EMPLOYEE, params)
+        await self.outbox_repository.add_events(events)
+        await self.db.commit()
+        return updated
+
+
+@dataclass
+class BulkDeleteEmployeesCommand(ICommand):
+    employee_ids: list[int]
+
+
+def _delete_statement(ids: list[int]) -> Any:
+    # RETURNING reports which ids actually existed, without a prior SELECT.
+    return delete(_employees).where(_employees.c.id.in_(ids)).returning(_employees.c.id)
+
+
+class BulkDeleteEmployeesCommandHandler(ICommandHandler[BulkDeleteEmployeesCommand, list[int]]):
+    """Delete with ``DELETE ... RETURNING`` per chunk; return the ids that existed."""
+
+    def __init__(self, db: Session, outbox_repository: OutboxRepository):
+        self.db = db
+        self.outbox_repository = outbox_repository
+
+    def handle(self, command: BulkDeleteEmployeesCommand) -> list[int]:
+        deleted = [
+            employee_id
+            for ids in _chunks(list(dict.fromkeys(command.employee_ids)))
+            for employee_id in self.db.scalars(_delete_statement(ids))
+        ]
+        self.outbox_repository.add_events(
+            [EmployeeDeleted(id=employee_id) for employee_id in deleted]
+        )
+        self.db.commit()
+        return deleted
+
+
+class AsyncBulkDeleteEmployeesCommandHandler(
+    IAsyncCommandHandler[BulkDeleteEmployeesCommand, list[int]]
+):
+    def __init__(self, db: AsyncSession, outbox_repository: AsyncOutboxRepository):
+        self.db = db
+        self.outbox_repository = outbox_repository
+
+    async def handle(self, command: BulkDeleteEmployeesCommand) -> list[int]:
+        deleted: list[int] = []
+        for ids in _chunks(list(dict.fromkeys(command.employee_ids))):
+            deleted += (await self.db.scalars(_delete_statement(ids))).all()
+        await self.outbox_repository.add_events(
+            [EmployeeDeleted(id=employee_id) for employee_id in deleted]
+        )
+        await self.db.commit()
+        return deleted
@@ -1,30 +1,72 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+import random
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import fields, is_dataclass
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol, cast, runtime_checkable
 
+from app.database import bind_session
 from domain.events.invalidation_service import InvalidationService
-from infrastructure.cache.cache_provider import CacheBackend
+from infrastructure.cache.cache_provider import (
+    AsyncCacheBackend,
+    AsyncLoadLock,
+    CacheBackend,
+    CacheMetrics,
+    LoadLock,
+)
+from infrastructure.cache.single_flight import AsyncSingleFlight, SingleFlight
 from infrastructure.outbox.outbox_processor import OutboxProcessor
+from infrastructure.read_repository.employee_read_replica import EmployeeReadReplica
+from infrastructure.write.group_commit import GroupCommitWriter
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from application.queries.base import IQuery
+from application.read_models.etag import ETaggedDTO, compute_etag
 
 QueryHandler = Callable[[IQuery], Any]
 CommandHandler = Callable[[Any], Any]
+AsyncQueryHandler = Callable[[IQuery], Awaitable[Any]]
+AsyncCommandHandler = Callable[[Any], Awaitable[Any]]
+
+# Marks values stored with freshness metadata (stale-while-revalidate / early expiry).
+_ENVELOPE_MARKER = "__swr__"
+_LOCK_POLL_SECONDS = 0.025
+# Side entry holding just the ETag of a conditional query's cached value.
+_ETAG_KEY = "{}:etag"
 
 
 class QueryBehavior(Protocol):
-    """Middleware-style behavior that wraps query handlers."""
+    """Middleware-style behavior that wraps query handlers.
+
+    Behaviors may also define ``applies_to(message_type) -> bool``; the mediator
+    calls it once per registered message type and leaves non-applicable behaviors
+    out of that type's compiled pipeline.
+    """
 
     def handle(self, query: IQuery, next_handler: QueryHandler) -> Any: ...
 
 
+class AsyncQueryBehavior(Protocol):
+    """Async counterpart of ``QueryBehavior``, compiled into ``send_async`` pipelines.
+
+    Behaviors implement it next to ``handle`` so one object serves both paths.
+    """
+
+    async def handle_async(self, query: IQuery, next_handler: AsyncQueryHandler) -> Any: ...
+
+
 @runtime_checkable
 class CacheableQuery(Protocol):
-    """Queries that can be cached expose a key and TTL."""
+    """Queries that can be cached expose a key and TTL.
+
+    They may also expose ``cache_namespace``: the stored key then embeds that
+    namespace's current generation, and bumping it invalidates the whole family.
+    """
 
     @property
     def cache_key(self) -> str: ...
@@ -33,33 +75,224 @@ class CacheableQuery(Protocol):
     def cache_ttl_seconds(self) -> int: ...
 
 
+@runtime_checkable
+class ConditionalQuery(Protocol):
+    """Cacheable queries that take the client's ``If-None-Match``.
+
+    ``CacheBehavior`` answers them with an ``ETaggedDTO``; the ETag is hashed once
+    when the entry is filled, never on a hit.
+    """
+
+    if_none_match: str | None
+
+
+def fresh_seconds(cached: Any) -> float | None:
+    """Seconds until a stored ``CacheBehavior`` entry goes stale (<= 0 once it has).
+
+    None for plain entries, which are never served past their TTL.
+    """
+    if isinstance(cached, dict) and _ENVELOPE_MARKER in cached:
+        return cached["fresh_until"] - time.time()
+    return None
+
+
+def is_cacheable_query_type(message_type: type[Any]) -> bool:
+    """Class-level counterpart of ``isinstance(query, CacheableQuery)`` (checked once)."""
+    return hasattr(message_type, "cache_key") and hasattr(message_type, "cache_ttl_seconds")
+
+
 class CacheBehavior:
-    """Intercept cacheable queries to serve hot responses without hitting the DB."""
+    """Intercept cacheable queries to serve hot responses without hitting the DB.
 
-    def __init__(self, cache: CacheBackend, logger: logging.Logger | None = None):
-        self.cache = cache
-        self.logger = logger or logging.getLogger("mediator.cache")
+    Misses are single-flighted per key (one handler call per process; across
+    workers too when a ``load_lock`` is given). With ``stale_ttl_seconds`` an entry
+    outlives its TTL by that window and, once past its TTL, is still served while
+    one caller refreshes it. ``early_expiration_beta`` > 0 adds probabilistic early
+    refresh (XFetch), so hot keys are usually reloaded before they ever go stale.
+    Explicit invalidation deletes the entry, so writes are never masked by SWR.
 
-    def handle(self, query: IQuery, next_handler: QueryHandler) -> Any:
-        if not isinstance(query, CacheableQuery):
-            return next_handler(query)
+    ``ConditionalQuery`` results are stored with their ETag, which is also kept
+    under a small side key for the entry's TTL: a matching ``If-None-Match`` is
+    answered from that key alone, without reading or decoding the payload.
+    """
 
-        cached = self.cache.get(query.cache_key)
+    def __init__(
+        self,
+        cache: CacheBackend,
+        logger: logging.Logger | None = None,
+        async_cache: AsyncCacheBackend | None = None,
+        stale_ttl_seconds: float = 0.0,
+        early_expiration_beta: float = 0.0,
+        load_lock: LoadLock | None = None,
+        async_load_lock: AsyncLoadLock | None = None,
+        lock_timeout_seconds: float = 5.0,
+    ):
+        self.cache = cache
+        self.async_cache = async_cache
+        self.logger = logger or logging.getLogger("mediator.cache")
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.early_expiration_beta = early_expiration_beta
+        self.load_lock = load_lock
+        self.async_load_lock = async_load_lock
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self._flights = SingleFlight()
+        self._async_flights = AsyncSingleFlight()
+
+    def applies_to(self, message_type: type[Any]) -> bool:
+        return is_cacheable_query_type(message_type)
+
+    def handle(self, query: CacheableQuery, next_handler: QueryHandler) -> Any:
+        key = query.cache_key
+        namespace = getattr(query, "cache_namespace", None)
+        if namespace is not None:
+            key = f"{key}:g{self.cache.get_generation(namespace)}"
+        if_none_match = getattr(query, "if_none_match", None)
+        if if_none_match is not None and self.cache.get(_ETAG_KEY.format(key)) == if_none_match:
+            return self._not_modified(query, key, if_none_match)
+        cached = self.cache.get(key)
+        if cached is not None:
+            value, refresh = self._unwrap(cached)
+            # Past (or probabilistically near) its TTL: one caller refreshes, the
+            # rest keep serving the cached value meanwhile.
+            if not refresh or self._flights.is_running(key):
+                self.logger.info("cache_hit query=%s key=%s", type(query).__name__, key)
+                return value
+            return self._flights.do(key, lambda: self._load(key, query, next_handler, stale=value))
+        return self._flights.do(key, lambda: self._load(key, query, next_handler))
+
+    async def handle_async(self, query: CacheableQuery, next_handler: AsyncQueryHandler) -> Any:
+        if self.async_cache is None:
+            raise RuntimeError("CacheBehavior needs an async_cache to run on send_async")
+        key = query.cache_key
+        namespace = getattr(query, "cache_namespace", None)
+        if namespace is not None:
+            key = f"{key}:g{await self.async_cache.get_generation(namespace)}"
+        if_none_match = getattr(query, "if_none_match", None)
+        if (
+            if_none_match is not None
+            and await self.async_cache.get(_ETAG_KEY.format(key)) == if_none_match
+        ):
+            return self._not_modified(query, key, if_none_match)
+        cached = await self.async_cache.get(key)
         if cached is not None:
-            self.logger.info("cache_hit query=%s key=%s", type(query).__name__, query.cache_key)
-            return cached
-
-        result = self._normalize(next_handler(query))
-        if query.cache_ttl_seconds > 0:
-            self.cache.set(query.cache_key, result, query.cache_ttl_seconds)
-            self.logger.info(
-                "cache_set query=%s key=%s ttl=%s bytes=%s",
-                type(query).__name__,
-                query.cache_key,
-                query.cache_ttl_seconds,
-                getattr(self.cache.metrics, "dto_size_bytes", 0),
+            value, refresh = self._unwrap(cached)
+            if not refresh or self._async_flights.is_running(key):
+                self.logger.info("cache_hit query=%s key=%s", type(query).__name__, key)
+                return value
+            return await self._async_flights.do(
+                key, lambda: self._load_async(key, query, next_handler, stale=value)
             )
-        return result
+        return await self._async_flights.do(key, lambda: self._load_async(key, query, next_handler))
+
+    def _load(
+        self, key: str, query: CacheableQuery, next_handler: QueryHandler, stale: Any = None
+    ) -> Any:
+        token = None
+        if self.load_lock is not None:
+            token = self.load_lock.acquire(key, self.lock_timeout_seconds)
+            if token is None:
+                # Another worker is loading: keep serving stale, or wait for its result.
+                if stale is not None:
+                    return stale
+                deadline = time.monotonic() + self.lock_timeout_seconds
+                while time.monotonic() < deadline:
+                    time.sleep(_LOCK_POLL_SECONDS)
+                    cached = self.cache.get(key)
+                    if cached is not None:
+                        return self._unwrap(cached)[0]
+        try:
+            start = time.perf_counter()
+            result = self._tag(query, self._plain(query, next_handler(query)))
+            if query.cache_ttl_seconds > 0:
+                entry, ttl = self._wrap(query, result, time.perf_counter() - start)
+                self.cache.set(key, entry, ttl)
+                if isinstance(query, ConditionalQuery):
+                    self.cache.set(_ETAG_KEY.format(key), result["etag"], query.cache_ttl_seconds)
+                self._log_set(query, key, ttl, self.cache.metrics)
+            return result
+        finally:
+            if self.load_lock is not None and token is not None:
+                self.load_lock.release(key, token)
+
+    async def _load_async(
+        self,
+        key: str,
+        query: CacheableQuery,
+        next_handler: AsyncQueryHandler,
+        stale: Any = None,
+    ) -> Any:
+        cache = cast(AsyncCacheBackend, self.async_cache)  # checked in handle_async
+        token = None
+        if self.async_load_lock is not None:
+            token = await self.async_load_lock.acquire(key, self.lock_timeout_seconds)
+            if token is None:
+                if stale is not None:
+                    return stale
+                deadline = time.monotonic() + self.lock_timeout_seconds
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(_LOCK_POLL_SECONDS)
+                    cached = await cache.get(key)
+                    if cached is not None:
+                        return self._unwrap(cached)[0]
+        try:
+            start = time.perf_counter()
+            result = self._tag(query, self._plain(query, await next_handler(query)))
+            if query.cache_ttl_seconds > 0:
+                entry, ttl = self._wrap(query, result, time.perf_counter() - start)
+                await cache.set(key, entry, ttl)
+                if isinstance(query, ConditionalQuery):
+                    await cache.set(_ETAG_KEY.format(key), result["etag"], query.cache_ttl_seconds)
+                self._log_set(query, key, ttl, cache.metrics)
+            return result
+        finally:
+            if self.async_load_lock is not None and token is not None:
+                await self.async_load_lock.release(key, token)
+
+    def _plain(self, query: CacheableQuery, result: Any) -> Any:
+        # DTO-returning handlers opt out of the recursive walk (``IQuery.plain_result``).
+        return result if getattr(query, "plain_result", False) else self._normalize(result)
+
+    def _tag(self, query: CacheableQuery, result: Any) -> Any:
+        if not isinstance(query, ConditionalQuery):
+            return result
+        return ETaggedDTO(etag=compute_etag(result), value=result)
+
+    def _not_modified(self, query: CacheableQuery, key: str, etag: str) -> ETaggedDTO:
+        self.logger.info("cache_not_modified query=%s key=%s", type(query).__name__, key)
+        return ETaggedDTO(etag=etag, value=None)
+
+    def _wrap(self, query: CacheableQuery, value: Any, cost_seconds: float) -> tuple[Any, int]:
+        """Return the stored form of ``value`` and its physical TTL in the backend."""
+        ttl = query.cache_ttl_seconds
+        if not self.stale_ttl_seconds and not self.early_expiration_beta:
+            return value, ttl
+        envelope = {
+            _ENVELOPE_MARKER: 1,
+            "value": value,
+            "fresh_until": time.time() + ttl,
+            "cost": cost_seconds,
+        }
+        return envelope, ttl + math.ceil(self.stale_ttl_seconds)
+
+    def _unwrap(self, cached: Any) -> tuple[Any, bool]:
+        """Return ``(value, needs_refresh)`` for a stored entry."""
+        if not (isinstance(cached, dict) and _ENVELOPE_MARKER in cached):
+            return cached, False
+        remaining = cached["fresh_until"] - time.time()
+        if self.early_expiration_beta > 0:
+            # XFetch: log(u) < 0, so refresh odds grow as expiry nears and cost rises.
+            u = 1.0 - random.random()  # noqa: S311 - jitter, not security
+            remaining += cached["cost"] * self.early_expiration_beta * math.log(u)
+        return cached["value"], remaining <= 0
+
+    def _log_set(self, query: CacheableQuery, key: str, ttl: int, metrics: CacheMetrics) -> None:
+        self.logger.info(
+            "cache_set query=%s key=%s ttl=%s bytes=%s",
+            type(query).__name__,
+            key,
+            ttl,
+            getattr(metrics, "dto_size_bytes", 0),
+        )
 
     def _normalize(self, value: Any) -> Any:
         """Convert dataclasses and nested collections into msgpack-friendly shapes."""
@@ -74,6 +307,34 @@ class CacheBehavior:
         return value
 
 
+class ReplicaETagBehavior:
+    """Stands in for ``CacheBehavior`` when queries are answered by the in-memory replica.
+
+    Nothing is cached: the replica answers faster than a cache round-trip. Conditional
+    queries still get an ``ETaggedDTO``; the ETag comes from the replica's version
+    and is taken before the read, so it can only be older than the data it labels,
+    never newer (a stale tag costs a 200, a premature one would be a wrong 304).
+    """
+
+    def __init__(self, replica: EmployeeReadReplica):
+        self.replica = replica
+
+    def applies_to(self, message_type: type[Any]) -> bool:
+        return is_cacheable_query_type(message_type) and hasattr(message_type, "if_none_match")
+
+    def handle(self, query: ConditionalQuery, next_handler: QueryHandler) -> Any:
+        etag = self.replica.etag(cast(CacheableQuery, query).cache_key)
+        if query.if_none_match == etag:
+            return ETaggedDTO(etag=etag, value=None)
+        return ETaggedDTO(etag=etag, value=next_handler(query))
+
+    async def handle_async(self, query: ConditionalQuery, next_handler: AsyncQueryHandler) -> Any:
+        etag = self.replica.etag(cast(CacheableQuery, query).cache_key)
+        if query.if_none_match == etag:
+            return ETaggedDTO(etag=etag, value=None)
+        return ETaggedDTO(etag=etag, value=await next_handler(query))
+
+
 class LoggingBehavior:
     """Structured logging around queries to expose duration and payload size."""
 
@@ -83,7 +344,19 @@ class LoggingBehavior:
     def handle(self, query: IQuery, next_handler: QueryHandler) -> Any:
         start = time.perf_counter()
         result = next_handler(query)
+        self._log(query, start, result)
+        return result
+
+    async def handle_async(self, query: IQuery, next_handler: AsyncQueryHandler) -> Any:
+        start = time.perf_counter()
+        result = await next_handler(query)
+        self._log(query, start, result)
+        return result
+
+    def _log(self, query: IQuery, start: float, result: Any) -> None:
         duration_ms = (time.perf_counter() - start) * 1000
+        if isinstance(result, dict) and "items" in result:
+            result = result["items"]
         result_count = len(result) if isinstance(result, list) else (1 if result is not None else 0)
         self.logger.info(
             "query=%s duration_ms=%.2f items=%s",
@@ -91,7 +364,6 @@ class LoggingBehavior:
             duration_ms,
             result_count,
         )
-        return result
 
 
 class TimingBehavior:
@@ -107,13 +379,26 @@ class TimingBehavior:
         self.logger.debug("timing query=%s latency_ms=%.2f", type(query).__name__, latency_ms)
         return result
 
+    async def handle_async(self, query: IQuery, next_handler: AsyncQueryHandler) -> Any:
+        start = time.perf_counter()
+        result = await next_handler(query)
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.logger.debug("timing query=%s latency_ms=%.2f", type(query).__name__, latency_ms)
+        return result
+
 
 class CommandBehavior(Protocol):
-    """Middleware-style behavior that wraps command handlers."""
+    """Middleware-style behavior that wraps command handlers (``applies_to`` optional)."""
 
     def handle(self, command: Any, next_handler: CommandHandler) -> Any: ...
 
 
+class AsyncCommandBehavior(Protocol):
+    """Async counterpart of ``CommandBehavior`` for ``send_async`` pipelines."""
+
+    async def handle_async(self, command: Any, next_handler: AsyncCommandHandler) -> Any: ...
+
+
 class CommandInvalidationBehavior:
     """After a successful command, invalidate read-side cache entries."""
 
@@ -129,18 +414,55 @@ class CommandInvalidationBehavior:
         self.logger.info("cache_invalidate command=%s", type(command).__name__)
         return result
 
+    async def handle_async(self, command: Any, next_handler: AsyncCommandHandler) -> Any:
+        result = await next_handler(command)
+        await self.invalidation_service.invalidate_for_async(command)
+        self.logger.info("cache_invalidate command=%s", type(command).__name__)
+        return result
+
 
 class OutboxDispatchBehavior:
-    """After the write transaction commits, fan out domain events to projectors."""
+    """After the write transaction commits, fan out domain events to projectors.
+
+    Pending events are drained in ``batch_size`` batches until the outbox is empty,
+    so a bulk command is fully projected before it returns. Draining stops at the
+    first batch that could not all be marked processed, so events that keep failing
+    are left for the next command instead of spinning inside this one.
+    """
 
-    def __init__(self, processor: OutboxProcessor):
+    def __init__(
+        self,
+        processor: OutboxProcessor,
+        async_session: Callable[[], AsyncSession] | None = None,
+        batch_size: int = 500,
+    ):
         self.processor = processor
+        # Returns the AsyncSession bound to the current request (e.g. AsyncScopedSession).
+        self.async_session = async_session
+        self.batch_size = batch_size
 
     def handle(self, command: Any, next_handler: CommandHandler) -> Any:
         result = next_handler(command)
-        self.processor.process_pending_events()
+        self._drain()
         return result
 
+    async def handle_async(self, command: Any, next_handler: AsyncCommandHandler) -> Any:
+        if self.async_session is None:
+            raise RuntimeError("OutboxDispatchBehavior needs async_session to run on send_async")
+        result = await next_handler(command)
+        # The processor is sync; run_sync drives it over the request's async connection.
+        await self.async_session().run_sync(self._process_with)
+        return result
+
+    def _process_with(self, db: Session) -> None:
+        with bind_session(db):
+            self._drain()
+
+    def _drain(self) -> None:
+        # Counts records marked processed, not fetched: failures end the loop.
+        while self.processor.process_pending_events(self.batch_size) >= self.batch_size:
+            pass
+
 
 class CommandLoggingBehavior:
     """Structured logging around commands to expose duration and outcomes."""
@@ -154,3 +476,55 @@ class CommandLoggingBehavior:
         duration_ms = (time.perf_counter() - start) * 1000
         self.logger.info("command=%s duration_ms=%.2f", type(command).__name__, duration_ms)
         return result
+
+    async def handle_async(self, command: Any, next_handler: AsyncCommandHandler) -> Any:
+        start = time.perf_counter()
+        result = await next_handler(command)
+        duration_ms = (time.perf_counter() - start) * 1000
+        self.logger.info("command=%s duration_ms=%.2f", type(command).__name__, duration_ms)
+        return result
+
+
+class GroupCommitBehavior:
+    """Hand commands to the single ``GroupCommitWriter`` instead of the request session.
+
+    Sits innermost and replaces the handler call: the command runs on the writer
+    thread, grouped with whatever else arrived in the same window, and the caller
+    resumes with its own result or error once that group has committed. Outer
+    behaviors (invalidation, inline outbox dispatch) therefore see committed data.
+    Waits are bounded by ``writer.result_timeout``: past it, a command still queued
+    is cancelled and the caller gets ``TimeoutError``, but one whose group already
+    started cannot be withdrawn, so the caller waits for its real outcome instead of
+    reporting a failure for a write that then commits.
+    """
+
+    def __init__(self, writer: GroupCommitWriter):
+        self.writer = writer
+
+    def applies_to(self, message_type: type[Any]) -> bool:
+        return self.writer.handles(message_type)
+
+    def handle(self, command: Any, next_handler: CommandHandler) -> Any:
+        future = self.writer.submit(command)
+        try:
+            return future.result(self.writer.result_timeout)
+        except TimeoutError:
+            # Cancel only succeeds while the command is queued; once its group runs,
+            # the outcome is coming and a retry after a timeout would duplicate it.
+            if future.cancel():
+                raise
+        return future.result()
+
+    async def handle_async(self, command: Any, next_handler: AsyncCommandHandler) -> Any:
+        future = self.writer.submit(command)
+        outcome = asyncio.wrap_future(future)
+        try:
+            # Shielded so the timeout does not cancel a group that is already running.
+            return await asyncio.wait_for(asyncio.shield(outcome), self.writer.result_timeout)
+        except TimeoutError:
+            if future.cancel():
+                raise
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        return await outcome
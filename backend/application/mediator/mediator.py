@@ -1,15 +1,63 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
 from typing import Any
 
+from app.database import bind_async_session, bind_session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
 from application.commands.base import ICommand
 from application.mediator.behaviors import CommandBehavior, QueryBehavior
 from application.queries.base import IQuery
 
+Pipeline = Callable[[Any], Any]
+AsyncPipeline = Callable[[Any], Awaitable[Any]]
+
+
+def _applies_to(behavior: QueryBehavior | CommandBehavior, message_type: type[Any]) -> bool:
+    """Behaviors may expose ``applies_to(message_type)``; without it they wrap everything."""
+    applies_to = getattr(behavior, "applies_to", None)
+    return applies_to is None or bool(applies_to(message_type))
+
+
+def compile_pipeline(
+    message_type: type[Any],
+    handler: Callable[[Any], Any],
+    behaviors: Sequence[QueryBehavior | CommandBehavior],
+) -> Pipeline:
+    """Pre-bind the applicable behaviors around ``handler`` into a flat callable chain."""
+    pipeline: Pipeline = handler
+    for behavior in reversed(behaviors):
+        if _applies_to(behavior, message_type):
+            pipeline = partial(behavior.handle, next_handler=pipeline)
+    return pipeline
+
+
+def compile_async_pipeline(
+    message_type: type[Any],
+    handler: Callable[[Any], Awaitable[Any]],
+    behaviors: Sequence[QueryBehavior | CommandBehavior],
+) -> AsyncPipeline:
+    """Same as ``compile_pipeline`` but chains each behavior's ``handle_async``."""
+    pipeline: AsyncPipeline = handler
+    for behavior in reversed(behaviors):
+        if not _applies_to(behavior, message_type):
+            continue
+        handle_async = getattr(behavior, "handle_async", None)
+        if handle_async is None:
+            raise TypeError(f"{type(behavior).__name__} does not support send_async")
+        pipeline = partial(handle_async, next_handler=pipeline)
+    return pipeline
+
 
 class Mediator:
-    """Minimal mediator that routes commands and queries to their handlers."""
+    """Minimal mediator that routes commands and queries to their handlers.
+
+    Each ``register_handler`` call compiles the behavior pipeline for that message
+    type once, so ``send`` is a single dict lookup plus the pre-bound call chain.
+    """
 
     def __init__(
         self,
@@ -18,47 +66,85 @@ class Mediator:
     ) -> None:
         self._query_handlers: dict[type[Any], Callable[[Any], Any]] = {}
         self._command_handlers: dict[type[Any], Callable[[Any], Any]] = {}
+        self._pipelines: dict[type[Any], Pipeline] = {}
+        self._async_pipelines: dict[type[Any], AsyncPipeline] = {}
         self._behaviors = behaviors or []
         self._command_behaviors = command_behaviors or []
 
     def register_handler(self, message_type: type[Any], handler: Callable[[Any], Any]) -> None:
         if issubclass(message_type, IQuery):
             self._query_handlers[message_type] = handler
+            self._pipelines[message_type] = compile_pipeline(message_type, handler, self._behaviors)
             return
         if issubclass(message_type, ICommand):
             self._command_handlers[message_type] = handler
+            self._pipelines[message_type] = compile_pipeline(
+                message_type, handler, self._command_behaviors
+            )
             return
         raise ValueError(f"Unknown message type {message_type}")
 
+    def register_async_handler(
+        self, message_type: type[Any], handler: Callable[[Any], Awaitable[Any]]
+    ) -> None:
+        if issubclass(message_type, IQuery):
+            behaviors: Sequence[QueryBehavior | CommandBehavior] = self._behaviors
+        elif issubclass(message_type, ICommand):
+            behaviors = self._command_behaviors
+        else:
+            raise ValueError(f"Unknown message type {message_type}")
+        self._async_pipelines[message_type] = compile_async_pipeline(
+            message_type, handler, behaviors
+        )
+
     def send(self, message: Any) -> Any:
-        if isinstance(message, IQuery):
-            return self._send_query(message)
-        if isinstance(message, ICommand):
-            return self._send_command(message)
+        pipeline = self._pipelines.get(type(message))
+        if pipeline is not None:
+            return pipeline(message)
+        if isinstance(message, IQuery | ICommand):
+            raise ValueError(f"No handler registered for {type(message).__name__}")
         raise ValueError(f"Unsupported message type {type(message).__name__}")
 
-    def _send_command(self, command: ICommand) -> Any:
-        handler = self._command_handlers.get(type(command))
-        if handler is None:
-            raise ValueError(f"No handler registered for {type(command).__name__}")
+    async def send_async(self, message: Any) -> Any:
+        pipeline = self._async_pipelines.get(type(message))
+        if pipeline is not None:
+            return await pipeline(message)
+        if isinstance(message, IQuery | ICommand):
+            raise ValueError(f"No async handler registered for {type(message).__name__}")
+        raise ValueError(f"Unsupported message type {type(message).__name__}")
 
-        def execute_pipeline(index: int, current_command: ICommand) -> Any:
-            if index >= len(self._command_behaviors):
-                return handler(current_command)
-            behavior = self._command_behaviors[index]
-            return behavior.handle(current_command, lambda c: execute_pipeline(index + 1, c))
 
-        return execute_pipeline(0, command)
+class MediatorScope:
+    """Per-request handle on the shared mediator that only binds the caller's sessions.
 
-    def _send_query(self, query: IQuery) -> Any:
-        handler = self._query_handlers.get(type(query))
-        if handler is None:
-            raise ValueError(f"No handler registered for {type(query).__name__}")
+    ``read_db``/``async_read_db`` (read-only engine) serve the query repositories;
+    without them queries run on the write session.
+    """
 
-        def execute_pipeline(index: int, current_query: IQuery) -> Any:
-            if index >= len(self._behaviors):
-                return handler(current_query)
-            behavior = self._behaviors[index]
-            return behavior.handle(current_query, lambda q: execute_pipeline(index + 1, q))
+    __slots__ = ("_mediator", "_db", "_async_db", "_read_db", "_async_read_db")
+
+    def __init__(
+        self,
+        mediator: Mediator,
+        db: Session | None = None,
+        async_db: AsyncSession | None = None,
+        read_db: Session | None = None,
+        async_read_db: AsyncSession | None = None,
+    ) -> None:
+        self._mediator = mediator
+        self._db = db
+        self._async_db = async_db
+        self._read_db = read_db
+        self._async_read_db = async_read_db
+
+    def send(self, message: Any) -> Any:
+        if self._db is None:
+            raise RuntimeError("MediatorScope has no sync session; use send_async")
+        with bind_session(self._db, self._read_db):
+            return self._mediator.send(message)
 
-        return execute_pipeline(0, query)
+    async def send_async(self, message: Any) -> Any:
+        if self._async_db is None:
+            raise RuntimeError("MediatorScope has no async session; use send")
+        with bind_async_session(self._async_db, self._async_read_db):
+            return await self._mediator.send_async(message)
@@ -1,18 +1,111 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any, cast
 
-from config import REDIS_DB, REDIS_HOST, REDIS_PASSWORD, REDIS_PORT
+from app.database import (
+    DATABASE_URL,
+    AsyncReadScopedSession,
+    AsyncScopedSession,
+    ReadScopedSession,
+    ReadSessionLocal,
+    ScopedSession,
+    SessionLocal,
+)
+from config import (
+    API_WORKERS,
+    CACHE_DISTRIBUTED_LOCK,
+    CACHE_EARLY_EXPIRATION_BETA,
+    CACHE_INVALIDATION_CHANNEL,
+    CACHE_L1_ENABLED,
+    CACHE_L1_MAX_BYTES,
+    CACHE_L1_MAX_ENTRIES,
+    CACHE_L1_TTL_SECONDS,
+    CACHE_LOCK_TIMEOUT_SECONDS,
+    CACHE_MAX_BYTES,
+    CACHE_MAX_ENTRIES,
+    CACHE_STALE_TTL_SECONDS,
+    CACHE_SWEEP_INTERVAL_SECONDS,
+    OUTBOX_BATCH_COMMIT,
+    OUTBOX_DISPATCH_MODE,
+    OUTBOX_RELAY_BATCH_SIZE,
+    OUTBOX_RELAY_IN_PROCESS,
+    OUTBOX_RELAY_POLL_INTERVAL,
+    OUTBOX_RETENTION_ARCHIVE,
+    OUTBOX_RETENTION_CHUNK_SIZE,
+    OUTBOX_RETENTION_INTERVAL_SECONDS,
+    OUTBOX_RETENTION_MAX_AGE_HOURS,
+    READ_REPLICA_ENABLED,
+    REDIS_DB,
+    REDIS_HOST,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_PASSWORD,
+    REDIS_PORT,
+    REDIS_SOCKET_TIMEOUT,
+    WRITE_COORDINATOR_ENABLED,
+    WRITE_COORDINATOR_MAX_BATCH,
+    WRITE_COORDINATOR_TIMEOUT_SECONDS,
+    WRITE_COORDINATOR_WINDOW_MS,
+)
+from domain.events.base import DomainEvent
 from domain.events.invalidation_service import InvalidationService
-from infrastructure.cache.cache_provider import CacheBackend, CacheProvider
-from infrastructure.cache.redis_cache_provider import RedisCacheProvider
-from infrastructure.outbox.outbox_processor import OutboxProcessor
-from infrastructure.outbox.outbox_repository import OutboxRepository
-from infrastructure.read_repository.employees_read_repository import EmployeesReadRepository
-from redis import Redis
+from infrastructure.cache.cache_provider import (
+    AsyncCacheAdapter,
+    AsyncCacheBackend,
+    AsyncLoadLock,
+    CacheBackend,
+    CacheProvider,
+    LoadLock,
+)
+from infrastructure.cache.redis_cache_provider import (
+    AsyncRedisCacheProvider,
+    AsyncRedisLoadLock,
+    RedisCacheProvider,
+    RedisLoadLock,
+)
+from infrastructure.cache.tiered_cache_provider import (
+    AsyncTieredCacheProvider,
+    InvalidationBroker,
+    RedisInvalidationBroker,
+    TieredCacheProvider,
+)
+from infrastructure.outbox.outbox_processor import OutboxProcessor, ProjectedCallback
+from infrastructure.outbox.outbox_repository import AsyncOutboxRepository, OutboxRepository
+from infrastructure.outbox.relay import OutboxRelay
+from infrastructure.outbox.retention import OutboxRetention
+from infrastructure.read_repository.employee_read_replica import (
+    AsyncMemoryEmployeesReadRepository,
+    EmployeeReadReplica,
+    MemoryEmployeesReadRepository,
+    ReplicaDiff,
+)
+from infrastructure.read_repository.employees_read_repository import (
+    AsyncEmployeesReadRepository,
+    EmployeesReadRepository,
+)
+from infrastructure.write.group_commit import GroupCommitWriter, create_writer_engine
+from redis import ConnectionPool, Redis
+from redis.asyncio import ConnectionPool as AsyncConnectionPool
+from redis.asyncio import Redis as AsyncRedis
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from application.commands.employees import (
+    AsyncBulkCreateEmployeesCommandHandler,
+    AsyncBulkDeleteEmployeesCommandHandler,
+    AsyncBulkUpdateEmployeesCommandHandler,
+    AsyncCreateEmployeeCommandHandler,
+    AsyncDeleteEmployeeCommandHandler,
+    AsyncUpdateEmployeeCommandHandler,
+    BulkCreateEmployeesCommand,
+    BulkCreateEmployeesCommandHandler,
+    BulkDeleteEmployeesCommand,
+    BulkDeleteEmployeesCommandHandler,
+    BulkUpdateEmployeesCommand,
+    BulkUpdateEmployeesCommandHandler,
     CreateEmployeeCommand,
     CreateEmployeeCommandHandler,
     DeleteEmployeeCommand,
@@ -22,14 +115,22 @@ from application.commands.employees import (
 )
 from application.mediator.behaviors import (
     CacheBehavior,
+    CommandBehavior,
     CommandInvalidationBehavior,
     CommandLoggingBehavior,
+    GroupCommitBehavior,
     LoggingBehavior,
     OutboxDispatchBehavior,
+    QueryBehavior,
+    ReplicaETagBehavior,
     TimingBehavior,
 )
-from application.mediator.mediator import Mediator
+from application.mediator.mediator import Mediator, MediatorScope
 from application.queries.employees import (
+    AsyncEmployeesReader,
+    AsyncGetEmployeeByIdQueryHandler,
+    AsyncGetEmployeesQueryHandler,
+    EmployeesReader,
     GetEmployeeByIdQuery,
     GetEmployeeByIdQueryHandler,
     GetEmployeesQuery,
@@ -40,59 +141,364 @@ from application.read_models.projectors.employees_projector import EmployeesProj
 logger = logging.getLogger(__name__)
 
 
-def create_mediator(db: Session) -> Mediator:
-    """Create and wire a mediator with all command/query handlers."""
-    cache_provider = _create_cache_provider()
-    invalidation_service = InvalidationService(cache_provider)
-    read_repo = EmployeesReadRepository(db)
-    projector = EmployeesProjector(read_repo)
-    outbox_repository = OutboxRepository(db)
-    outbox_processor = OutboxProcessor(
-        outbox_repository,
+class MediatorContainer:
+    """Process-level composition root: cache, behaviors and handlers are built once.
+
+    With ``inline_dispatch`` every command projects its events and invalidates the
+    cache before returning; otherwise an ``OutboxRelay`` (see ``create_relay``) does
+    both in the background and writes only pay for their own transaction.
+    """
+
+    def __init__(
+        self,
+        cache: CacheBackend,
+        async_cache: AsyncCacheBackend | None = None,
+        redis_pool: ConnectionPool | None = None,
+        async_redis_pool: AsyncConnectionPool | None = None,
+        inline_dispatch: bool = False,
+        broker: InvalidationBroker | None = None,
+        local_cache: CacheProvider | None = None,
+        load_lock: LoadLock | None = None,
+        async_load_lock: AsyncLoadLock | None = None,
+        write_coordinator: GroupCommitWriter | None = None,
+        read_replica: EmployeeReadReplica | None = None,
+    ) -> None:
+        self.cache = cache
+        self.async_cache = async_cache or AsyncCacheAdapter(cache)
+        self.redis_pool = redis_pool
+        self.async_redis_pool = async_redis_pool
+        self.broker = broker
+        # The in-process store (fallback cache or L1) whose expiry sweeper we own.
+        self.local_cache = local_cache
+        self.inline_dispatch = inline_dispatch
+        self.write_coordinator = write_coordinator
+        self.read_replica = read_replica
+        self.invalidation_service = InvalidationService(cache, async_cache=self.async_cache)
+        on_projected = None if inline_dispatch else self.invalidation_service.invalidate_for_events
+        if read_replica is not None:
+            # The replica follows committed projections before any cache eviction runs.
+            on_projected = _chain(read_replica.apply, on_projected)
+        self.outbox_processor = create_outbox_processor(on_projected)
+        self.mediator = create_mediator(
+            cache,
+            self.async_cache,
+            outbox_processor=self.outbox_processor if inline_dispatch else None,
+            invalidation_service=self.invalidation_service,
+            load_lock=load_lock,
+            async_load_lock=async_load_lock,
+            write_coordinator=write_coordinator,
+            read_replica=read_replica,
+        )
+
+    def scope(
+        self,
+        db: Session | None = None,
+        async_db: AsyncSession | None = None,
+        read_db: Session | None = None,
+        async_read_db: AsyncSession | None = None,
+    ) -> MediatorScope:
+        """Cheap per-request view that only binds the SQLAlchemy sessions."""
+        return MediatorScope(self.mediator, db, async_db, read_db, async_read_db)
+
+    def create_relay(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        poll_interval: float = OUTBOX_RELAY_POLL_INTERVAL,
+        batch_size: int = OUTBOX_RELAY_BATCH_SIZE,
+    ) -> OutboxRelay:
+        return OutboxRelay(self.outbox_processor, session_factory, poll_interval, batch_size)
+
+    def create_retention(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_age: timedelta = timedelta(hours=OUTBOX_RETENTION_MAX_AGE_HOURS),
+        chunk_size: int = OUTBOX_RETENTION_CHUNK_SIZE,
+        archive: bool = OUTBOX_RETENTION_ARCHIVE,
+    ) -> OutboxRetention:
+        return OutboxRetention(
+            session_factory,
+            max_age,
+            chunk_size=chunk_size,
+            archive=archive,
+            interval_seconds=OUTBOX_RETENTION_INTERVAL_SECONDS,
+        )
+
+    def check_read_replica(
+        self, session_factory: Callable[[], Session] = ReadSessionLocal
+    ) -> ReplicaDiff:
+        """Compare the in-memory replica with a full scan of ``read_employees``."""
+        if self.read_replica is None:
+            raise RuntimeError("READ_REPLICA_ENABLED is off; there is no replica to check")
+        with session_factory() as db:
+            return self.read_replica.diff(EmployeesReadRepository(db).iter_rows())
+
+    def close(self) -> None:
+        if self.write_coordinator is not None:
+            self.write_coordinator.stop()
+            self.write_coordinator.engine.dispose()
+        if self.local_cache is not None:
+            self.local_cache.stop_sweeper()
+        if self.broker is not None:
+            self.broker.close()
+        if self.redis_pool is not None:
+            self.redis_pool.disconnect()
+
+    async def aclose(self) -> None:
+        self.close()
+        if self.async_redis_pool is not None:
+            await self.async_redis_pool.disconnect()
+
+
+def create_container() -> MediatorContainer:
+    """Build the shared object graph; call once per process (FastAPI lifespan or CLI)."""
+    inline_dispatch = OUTBOX_DISPATCH_MODE == "inline"
+    write_coordinator = _create_write_coordinator() if WRITE_COORDINATOR_ENABLED else None
+    read_replica = _load_read_replica() if _read_replica_wanted(inline_dispatch) else None
+    redis_pool = _create_redis_pool()
+    if redis_pool is None:
+        fallback = CacheProvider(max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES)
+        fallback.start_sweeper(CACHE_SWEEP_INTERVAL_SECONDS)
+        return MediatorContainer(
+            fallback,
+            inline_dispatch=inline_dispatch,
+            local_cache=fallback,
+            write_coordinator=write_coordinator,
+            read_replica=read_replica,
+        )
+    # The sync ping already proved Redis is reachable; the async pool connects lazily.
+    async_redis_pool = AsyncConnectionPool(
+        max_connections=REDIS_MAX_CONNECTIONS, **_redis_connection_kwargs()
+    )
+    client = Redis(connection_pool=redis_pool)
+    async_client = AsyncRedis(connection_pool=async_redis_pool)
+    cache: CacheBackend = RedisCacheProvider(client)
+    async_cache: AsyncCacheBackend = AsyncRedisCacheProvider(async_client)
+    broker = None
+    l1 = None
+    if CACHE_L1_ENABLED:
+        # One L1 per process, shared by the sync and async paths; the broker's
+        # listener thread evicts it when any worker deletes a key.
+        l1 = CacheProvider(max_entries=CACHE_L1_MAX_ENTRIES, max_bytes=CACHE_L1_MAX_BYTES)
+        l1.start_sweeper(CACHE_SWEEP_INTERVAL_SECONDS)
+        broker = RedisInvalidationBroker(client, async_client, CACHE_INVALIDATION_CHANNEL)
+        broker.subscribe(l1)
+        cache = TieredCacheProvider(l1, cache, broker, CACHE_L1_TTL_SECONDS)
+        async_cache = AsyncTieredCacheProvider(l1, async_cache, broker, CACHE_L1_TTL_SECONDS)
+    return MediatorContainer(
+        cache,
+        async_cache,
+        redis_pool,
+        async_redis_pool,
+        inline_dispatch=inline_dispatch,
+        broker=broker,
+        local_cache=l1,
+        load_lock=RedisLoadLock(client) if CACHE_DISTRIBUTED_LOCK else None,
+        async_load_lock=AsyncRedisLoadLock(async_client) if CACHE_DISTRIBUTED_LOCK else None,
+        write_coordinator=write_coordinator,
+        read_replica=read_replica,
+    )
+
+
+def create_outbox_processor(on_projected: ProjectedCallback | None = None) -> OutboxProcessor:
+    """Outbox processor projecting into the read model through ``ScopedSession``."""
+    db = cast(Session, ScopedSession)
+    projector = EmployeesProjector(EmployeesReadRepository(db))
+    return OutboxProcessor(
+        OutboxRepository(db),
         {
             "EmployeeCreated": projector.project_created,
             "EmployeeUpdated": projector.project_updated,
             "EmployeeDeleted": projector.project_deleted,
         },
+        on_projected=on_projected,
+        batch_commit=OUTBOX_BATCH_COMMIT,
+        batch_handler=projector.project_batch,
     )
-    mediator = Mediator(
-        behaviors=[
-            CacheBehavior(cache_provider),
-            LoggingBehavior(),
-            TimingBehavior(),
-        ],
-        command_behaviors=[
-            CommandLoggingBehavior(),
+
+
+def create_mediator(
+    cache_provider: CacheBackend,
+    async_cache_provider: AsyncCacheBackend | None = None,
+    outbox_processor: OutboxProcessor | None = None,
+    invalidation_service: InvalidationService | None = None,
+    load_lock: LoadLock | None = None,
+    async_load_lock: AsyncLoadLock | None = None,
+    write_coordinator: GroupCommitWriter | None = None,
+    read_replica: EmployeeReadReplica | None = None,
+) -> Mediator:
+    """Create and wire a mediator with all command/query handlers.
+
+    Handlers and repositories hold the ``ScopedSession``/``AsyncScopedSession``
+    proxies (query repositories the ``Read*`` ones), so the same graph serves every
+    request once ``MediatorScope`` binds the request's sessions. Sync handlers serve
+    ``send``; async ones ``send_async``. Passing ``outbox_processor`` opts into inline
+    projection plus command-driven cache invalidation; ``load_lock`` extends cache-miss
+    single-flight across workers.
+    With ``write_coordinator`` the sync command handlers are registered on it and
+    both ``send`` and ``send_async`` commit commands through its writer thread.
+    With ``read_replica`` queries are answered from memory and not cached at all.
+    """
+    async_cache_provider = async_cache_provider or AsyncCacheAdapter(cache_provider)
+    db = cast(Session, ScopedSession)
+    async_db = cast(AsyncSession, AsyncScopedSession)
+    # Queries read through the read-only proxies; the projector keeps the write session.
+    read_repo: EmployeesReader = EmployeesReadRepository(cast(Session, ReadScopedSession))
+    async_read_repo: AsyncEmployeesReader = AsyncEmployeesReadRepository(
+        cast(AsyncSession, AsyncReadScopedSession)
+    )
+    query_behaviors: list[QueryBehavior] = [
+        CacheBehavior(
+            cache_provider,
+            async_cache=async_cache_provider,
+            stale_ttl_seconds=CACHE_STALE_TTL_SECONDS,
+            early_expiration_beta=CACHE_EARLY_EXPIRATION_BETA,
+            load_lock=load_lock,
+            async_load_lock=async_load_lock,
+            lock_timeout_seconds=CACHE_LOCK_TIMEOUT_SECONDS,
+        )
+    ]
+    if read_replica is not None:
+        read_repo = MemoryEmployeesReadRepository(read_replica)
+        async_read_repo = AsyncMemoryEmployeesReadRepository(read_replica)
+        query_behaviors = [ReplicaETagBehavior(read_replica)]
+    outbox_repository = OutboxRepository(db)
+    async_outbox_repository = AsyncOutboxRepository(async_db)
+    command_behaviors: list[CommandBehavior] = [CommandLoggingBehavior()]
+    if outbox_processor is not None:
+        invalidation_service = invalidation_service or InvalidationService(
+            cache_provider, async_cache=async_cache_provider
+        )
+        command_behaviors += [
             CommandInvalidationBehavior(invalidation_service),
-            OutboxDispatchBehavior(outbox_processor),
-        ],
+            OutboxDispatchBehavior(outbox_processor, AsyncScopedSession),
+        ]
+    command_handlers: dict[type[Any], Callable[[Any], Any]] = {
+        CreateEmployeeCommand: CreateEmployeeCommandHandler(db, outbox_repository).handle,
+        UpdateEmployeeCommand: UpdateEmployeeCommandHandler(db, outbox_repository).handle,
+        DeleteEmployeeCommand: DeleteEmployeeCommandHandler(db, outbox_repository).handle,
+        BulkCreateEmployeesCommand: BulkCreateEmployeesCommandHandler(db, outbox_repository).handle,
+        BulkUpdateEmployeesCommand: BulkUpdateEmployeesCommandHandler(db, outbox_repository).handle,
+        BulkDeleteEmployeesCommand: BulkDeleteEmployeesCommandHandler(db, outbox_repository).handle,
+    }
+    if write_coordinator is not None:
+        # Must precede register_handler: pipelines are compiled against handles().
+        for command_type, handler in command_handlers.items():
+            write_coordinator.register(command_type, handler)
+        command_behaviors.append(GroupCommitBehavior(write_coordinator))
+    mediator = Mediator(
+        behaviors=[*query_behaviors, LoggingBehavior(), TimingBehavior()],
+        command_behaviors=command_behaviors,
     )
     mediator.register_handler(GetEmployeesQuery, GetEmployeesQueryHandler(read_repo).handle)
     mediator.register_handler(GetEmployeeByIdQuery, GetEmployeeByIdQueryHandler(read_repo).handle)
-    mediator.register_handler(
-        CreateEmployeeCommand, CreateEmployeeCommandHandler(db, outbox_repository).handle
+    for command_type, handler in command_handlers.items():
+        mediator.register_handler(command_type, handler)
+
+    mediator.register_async_handler(
+        GetEmployeesQuery, AsyncGetEmployeesQueryHandler(async_read_repo).handle
     )
-    mediator.register_handler(
-        UpdateEmployeeCommand, UpdateEmployeeCommandHandler(db, outbox_repository).handle
+    mediator.register_async_handler(
+        GetEmployeeByIdQuery, AsyncGetEmployeeByIdQueryHandler(async_read_repo).handle
     )
-    mediator.register_handler(
-        DeleteEmployeeCommand, DeleteEmployeeCommandHandler(db, outbox_repository).handle
+    mediator.register_async_handler(
+        CreateEmployeeCommand,
+        AsyncCreateEmployeeCommandHandler(async_db, async_outbox_repository).handle,
+    )
+    mediator.register_async_handler(
+        UpdateEmployeeCommand,
+        AsyncUpdateEmployeeCommandHandler(async_db, async_outbox_repository).handle,
+    )
+    mediator.register_async_handler(
+        DeleteEmployeeCommand,
+        AsyncDeleteEmployeeCommandHandler(async_db, async_outbox_repository).handle,
+    )
+    mediator.register_async_handler(
+        BulkCreateEmployeesCommand,
+        AsyncBulkCreateEmployeesCommandHandler(async_db, async_outbox_repository).handle,
+    )
+    mediator.register_async_handler(
+        BulkUpdateEmployeesCommand,
+        AsyncBulkUpdateEmployeesCommandHandler(async_db, async_outbox_repository).handle,
+    )
+    mediator.register_async_handler(
+        BulkDeleteEmployeesCommand,
+        AsyncBulkDeleteEmployeesCommandHandler(async_db, async_outbox_repository).handle,
     )
     return mediator
 
 
-def _create_cache_provider() -> CacheBackend:
-    """Create Redis cache provider; fall back to in-memory if Redis is unavailable."""
-    redis_client = Redis(
-        host=REDIS_HOST,
-        port=REDIS_PORT,
-        db=REDIS_DB,
-        password=REDIS_PASSWORD,
-        socket_timeout=1.0,
+def _read_replica_wanted(inline_dispatch: bool) -> bool:
+    """Whether this process can keep a replica complete: it must project every event."""
+    if not READ_REPLICA_ENABLED:
+        return False
+    if API_WORKERS > 1:
+        # Each worker projects only part of the events, so the replicas would diverge.
+        raise RuntimeError(
+            f"READ_REPLICA_ENABLED needs a single API worker, got WEB_CONCURRENCY={API_WORKERS}"
+        )
+    if not inline_dispatch and not OUTBOX_RELAY_IN_PROCESS:
+        logger.warning(
+            "read_replica_skipped reason=events are projected by another process; "
+            "serving reads from read_employees"
+        )
+        return False
+    return True
+
+
+def _load_read_replica() -> EmployeeReadReplica:
+    replica = EmployeeReadReplica()
+    start = time.perf_counter()
+    with ReadSessionLocal() as db:
+        rows = replica.load(EmployeesReadRepository(db).iter_rows())
+    footprint = replica.footprint()
+    logger.info(
+        "read_replica_loaded rows=%s duration_ms=%.1f bytes=%s",
+        rows,
+        (time.perf_counter() - start) * 1000,
+        footprint.total_bytes,
+    )
+    return replica
+
+
+def _chain(first: ProjectedCallback, second: ProjectedCallback | None) -> ProjectedCallback:
+    if second is None:
+        return first
+
+    def _both(events: list[DomainEvent]) -> None:
+        first(events)
+        second(events)
+
+    return _both
+
+
+def _create_write_coordinator() -> GroupCommitWriter:
+    writer = GroupCommitWriter(
+        create_writer_engine(DATABASE_URL),
+        window_seconds=WRITE_COORDINATOR_WINDOW_MS / 1000,
+        max_batch=WRITE_COORDINATOR_MAX_BATCH,
+        result_timeout=WRITE_COORDINATOR_TIMEOUT_SECONDS,
     )
+    writer.start()
+    return writer
+
+
+def _create_redis_pool() -> ConnectionPool | None:
+    """Create the shared Redis pool; return None (in-memory fallback) if Redis is down."""
+    pool = ConnectionPool(max_connections=REDIS_MAX_CONNECTIONS, **_redis_connection_kwargs())
     try:
-        redis_client.ping()
+        Redis(connection_pool=pool).ping()
     except Exception as exc:  # pragma: no cover - best-effort fallback for dev/test
         logger.warning("Redis not reachable, using in-memory cache. error=%s", exc)
-        return CacheProvider()
-    return RedisCacheProvider(redis_client)
+        pool.disconnect()
+        return None
+    return pool
+
+
+def _redis_connection_kwargs() -> dict[str, Any]:
+    return {
+        "host": REDIS_HOST,
+        "port": REDIS_PORT,
+        "db": REDIS_DB,
+        "password": REDIS_PASSWORD,
+        "socket_timeout": REDIS_SOCKET_TIMEOUT,
+    }
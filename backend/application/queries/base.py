@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import ClassVar, Generic, TypeVar
 
 QueryType = TypeVar("QueryType", bound="IQuery")
 ResultType = TypeVar("ResultType")
 
 
 class IQuery:
-    """Marker interface for queries."""
+    """Marker interface for queries.
 
-    pass
+    Set ``plain_result`` when the handler already returns plain dicts, lists and
+    scalars (TypedDict DTOs), so the cache skips its normalization pass.
+    """
+
+    plain_result: ClassVar[bool] = False
 
 
 class IQueryHandler(Generic[QueryType, ResultType], ABC):
@@ -20,3 +24,12 @@ class IQueryHandler(Generic[QueryType, ResultType], ABC):
     def handle(self, query: QueryType) -> ResultType:
         """Handle a query instance."""
         raise NotImplementedError
+
+
+class IAsyncQueryHandler(Generic[QueryType, ResultType], ABC):
+    """Interface for query handlers on the async (``send_async``) path."""
+
+    @abstractmethod
+    async def handle(self, query: QueryType) -> ResultType:
+        """Handle a query instance without blocking the event loop."""
+        raise NotImplementedError
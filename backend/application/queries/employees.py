@@ -1,41 +1,87 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import ClassVar, Protocol
 
-from infrastructure.read_repository.employees_read_repository import EmployeesReadRepository
-
-from application.queries.base import IQuery, IQueryHandler
-from application.read_models.employees import EmployeeListDTO
+from application.queries.base import IAsyncQueryHandler, IQuery, IQueryHandler
+from application.read_models.employees import (
+    DEFAULT_PAGE_SIZE,
+    EmployeeListDTO,
+    EmployeePageDTO,
+)
 from application.read_models.ttl_config import (
-    EMPLOYEE_LIST_CACHE_KEY,
+    EMPLOYEE_LIST_CACHE_NAMESPACE,
     TTL_EMPLOYEE_DETAIL,
     TTL_EMPLOYEE_LIST,
     employee_detail_cache_key,
+    employee_list_cache_key,
 )
 
 
+class EmployeesReader(Protocol):
+    """What the query handlers need from a read repository (SQL or in-memory replica)."""
+
+    def get_page(self, limit: int, after: int | None = None) -> EmployeePageDTO: ...
+
+    def get_by_id(self, employee_id: int) -> EmployeeListDTO | None: ...
+
+
+class AsyncEmployeesReader(Protocol):
+    async def get_page(self, limit: int, after: int | None = None) -> EmployeePageDTO: ...
+
+    async def get_by_id(self, employee_id: int) -> EmployeeListDTO | None: ...
+
+
 @dataclass
 class GetEmployeesQuery(IQuery):
+    """Keyset page of the employee list: ``limit`` rows with ``id > after``.
+
+    Answered with an ``ETaggedDTO`` by ``CacheBehavior`` (``ReplicaETagBehavior``
+    when the in-memory replica is on); ``if_none_match`` is the client's validator
+    and is deliberately not part of the cache key.
+    """
+
+    plain_result: ClassVar[bool] = True
+
+    limit: int = DEFAULT_PAGE_SIZE
+    after: int | None = None
+    if_none_match: str | None = None
+
     @property
     def cache_key(self) -> str:
-        return EMPLOYEE_LIST_CACHE_KEY
+        return employee_list_cache_key(self.after, self.limit)
+
+    @property
+    def cache_namespace(self) -> str:
+        # Every page shares one generation, so a write orphans all pages at once.
+        return EMPLOYEE_LIST_CACHE_NAMESPACE
 
     @property
     def cache_ttl_seconds(self) -> int:
         return TTL_EMPLOYEE_LIST
 
 
-class GetEmployeesQueryHandler(IQueryHandler[GetEmployeesQuery, list[EmployeeListDTO]]):
-    def __init__(self, read_repo: EmployeesReadRepository):
+class GetEmployeesQueryHandler(IQueryHandler[GetEmployeesQuery, EmployeePageDTO]):
+    def __init__(self, read_repo: EmployeesReader):
         self.read_repo = read_repo
 
-    def handle(self, query: GetEmployeesQuery) -> list[EmployeeListDTO]:
+    def handle(self, query: GetEmployeesQuery) -> EmployeePageDTO:
         # Pull lightweight DTOs instead of domain entities to keep reads decoupled.
-        return self.read_repo.get_all()
+        return self.read_repo.get_page(query.limit, query.after)
+
+
+class AsyncGetEmployeesQueryHandler(IAsyncQueryHandler[GetEmployeesQuery, EmployeePageDTO]):
+    def __init__(self, read_repo: AsyncEmployeesReader):
+        self.read_repo = read_repo
+
+    async def handle(self, query: GetEmployeesQuery) -> EmployeePageDTO:
+        return await self.read_repo.get_page(query.limit, query.after)
 
 
 @dataclass
 class GetEmployeeByIdQuery(IQuery):
+    plain_result: ClassVar[bool] = True
+
     employee_id: int
 
     @property
@@ -48,9 +94,19 @@ class GetEmployeeByIdQuery(IQuery):
 
 
 class GetEmployeeByIdQueryHandler(IQueryHandler[GetEmployeeByIdQuery, EmployeeListDTO | None]):
-    def __init__(self, read_repo: EmployeesReadRepository):
+    def __init__(self, read_repo: EmployeesReader):
         self.read_repo = read_repo
 
     def handle(self, query: GetEmployeeByIdQuery) -> EmployeeListDTO | None:
         # Read side stays isolated from the write model to enable future optimizations.
         return self.read_repo.get_by_id(query.employee_id)
+
+
+class AsyncGetEmployeeByIdQueryHandler(
+    IAsyncQueryHandler[GetEmployeeByIdQuery, EmployeeListDTO | None]
+):
+    def __init__(self, read_repo: AsyncEmployeesReader):
+        self.read_repo = read_repo
+
+    async def handle(self, query: GetEmployeeByIdQuery) -> EmployeeListDTO | None:
+        return await self.read_repo.get_by_id(query.employee_id)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, TypedDict
 
 from sqlalchemy.engine import RowMapping
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
 
 class EmployeeListDTO(TypedDict):
     """Lean, serializable DTO used for read-side responses and caching."""
@@ -17,6 +20,13 @@ class EmployeeListDTO(TypedDict):
     in_vacation: bool
 
 
+class EmployeePageDTO(TypedDict):
+    """One keyset page of employees; ``next_cursor`` is the last id, or None at the end."""
+
+    items: list[EmployeeListDTO]
+    next_cursor: int | None
+
+
 def map_to_employee_dto(row: Mapping[str, Any] | RowMapping | Any) -> EmployeeListDTO:
     """Map a row or ORM object to the lean DTO without leaking domain entities."""
 
@@ -33,3 +43,23 @@ def map_to_employee_dto(row: Mapping[str, Any] | RowMapping | Any) -> EmployeeLi
         address=str(_get("address")),
         in_vacation=bool(_get("in_vacation")),
     )
+
+
+def map_employee_rows(rows: Iterable[Sequence[Any]]) -> list[EmployeeListDTO]:
+    """Map ``(id, name, lastname, salary, address, in_vacation)`` rows to DTOs in bulk.
+
+    The read repository's column types already yield Python ints, strs, floats and
+    bools, so each row is unpacked straight into a dict literal: no per-field
+    lookups, ``isinstance`` checks or casts as in ``map_to_employee_dto``.
+    """
+    return [
+        {
+            "id": id_,
+            "name": name,
+            "lastname": lastname,
+            "salary": salary,
+            "address": address,
+            "in_vacation": in_vacation,
+        }
+        for id_, name, lastname, salary, address, in_vacation in rows
+    ]
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, TypedDict
+
+import msgpack
+
+
+class ETaggedDTO(TypedDict):
+    """A cached read result together with the ETag computed when it was filled.
+
+    ``value`` is None when the caller's ``If-None-Match`` already matched: the
+    payload was never fetched or decoded.
+    """
+
+    etag: str
+    value: Any
+
+
+def compute_etag(payload: Any) -> str:
+    packed = msgpack.packb(payload, use_bin_type=True)
+    # BLAKE2b is fast and suitable for non-cryptographic content hashing (ETag).
+    return hashlib.blake2b(packed, digest_size=16).hexdigest()
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
+from domain.events.base import DomainEvent
 from domain.events.employees import EmployeeCreated, EmployeeDeleted, EmployeeUpdated
-from infrastructure.read_repository.employees_read_repository import EmployeesReadRepository
+from infrastructure.read_repository.employees_read_repository import (
+    PROJECTED_FIELDS,
+    EmployeesReadRepository,
+)
 
 
 class EmployeesProjector:
@@ -25,3 +31,41 @@ class EmployeesProjector:
 
     def project_deleted(self, event: EmployeeDeleted) -> None:
         self.read_repo.delete_employee(event.id)
+
+    def project_batch(self, events: Iterable[DomainEvent]) -> None:
+        """Coalesce events per employee id, then apply them with set-based statements.
+
+        Create followed by updates collapses into one full row, updates merge into one
+        patch, and anything followed by a delete becomes one delete.
+        """
+        rows: dict[int, dict[str, object]] = {}
+        patches: dict[int, dict[str, object]] = {}
+        deleted: set[int] = set()
+        for event in events:
+            if isinstance(event, EmployeeCreated):
+                deleted.discard(event.id)
+                patches.pop(event.id, None)
+                rows[event.id] = {
+                    "id": event.id,
+                    "name": event.name,
+                    "lastname": event.lastname,
+                    "salary": event.salary,
+                    "address": event.address,
+                    "in_vacation": event.in_vacation,
+                }
+            elif isinstance(event, EmployeeUpdated):
+                changes = {
+                    field: value
+                    for field, value in event.fields_changed.items()
+                    if field in PROJECTED_FIELDS
+                }
+                if event.id in rows:
+                    rows[event.id].update(changes)
+                elif event.id not in deleted and changes:
+                    patches.setdefault(event.id, {"id": event.id}).update(changes)
+            elif isinstance(event, EmployeeDeleted):
+                rows.pop(event.id, None)
+                patches.pop(event.id, None)
+                deleted.add(event.id)
+
+        self.read_repo.apply_batch(rows.values(), patches.values(), deleted)
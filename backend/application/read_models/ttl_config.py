@@ -4,8 +4,21 @@ TTL_EMPLOYEE_LIST = 5
 TTL_EMPLOYEE_DETAIL = 2
 TTL_SALARY_VIEW = 1
 
-EMPLOYEE_LIST_CACHE_KEY = "employee:list"
+# Generation namespace of every list page: a write bumps it instead of deleting pages.
+EMPLOYEE_LIST_CACHE_NAMESPACE = "employee:list"
+
+
+def employee_list_cache_key(after: int | None, limit: int) -> str:
+    return f"{EMPLOYEE_LIST_CACHE_NAMESPACE}:{after or 0}:{limit}"
 
 
 def employee_detail_cache_key(employee_id: int) -> str:
     return f"employee:detail:{employee_id}"
+
+
+# Encoded HTTP bodies cached next to the query entry they render (opt-in response cache).
+RESPONSE_REPRESENTATIONS = ("json", "json+gzip", "msgpack")
+
+
+def response_cache_key(cache_key: str, representation: str) -> str:
+    return f"resp:{cache_key}:{representation}"
@@ -0,0 +1 @@
+"""Micro-benchmarks for hot paths; run as ``python -m benchmarks.<name>`` from backend/."""
@@ -0,0 +1,81 @@
+"""Importing employees: one ``CreateEmployeeCommand`` per row vs. one bulk command.
+
+Both go through the full sync mediator pipeline in inline mode (write, outbox,
+projection into the read model, cache invalidation) on a temporary SQLite file;
+the bulk command is also timed in relay mode (write and outbox insert only).
+The per-row path runs ``--sample`` rows and is extrapolated to ``--rows``.
+Run from ``backend/``::
+
+    python -m benchmarks.bulk_import --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from app import schemas
+from app.database import bind_session, create_schema
+from app.models import ReadEmployee
+from application.commands.employees import BulkCreateEmployeesCommand, CreateEmployeeCommand
+from application.mediator.registry import create_mediator, create_outbox_processor
+from infrastructure.cache.cache_provider import CacheProvider
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+
+def _payloads(count: int) -> list[schemas.EmployeeCreate]:
+    return [
+        schemas.EmployeeCreate(
+            name=f"Name{i}", lastname="Doe", salary=1000.0 + i, address="123 Main St"
+        )
+        for i in range(count)
+    ]
+
+
+def _import(rows: int, bulk: bool, inline: bool = True) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bulk.db'}")
+        create_schema(engine)
+        session_factory = sessionmaker[Session](autoflush=False, bind=engine)
+        processor = create_outbox_processor() if inline else None
+        mediator = create_mediator(CacheProvider(), outbox_processor=processor)
+        payloads = _payloads(rows)
+        with session_factory() as db, bind_session(db):
+            start = time.perf_counter()
+            if bulk:
+                mediator.send(BulkCreateEmployeesCommand(payloads))
+            else:
+                for payload in payloads:
+                    mediator.send(CreateEmployeeCommand(payload))
+            elapsed = time.perf_counter() - start
+            projected = db.scalar(select(func.count()).select_from(ReadEmployee))
+        engine.dispose()
+        if inline and projected != rows:
+            raise SystemExit(f"read model has {projected} rows, expected {rows}")
+        return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--sample", type=int, default=1_000)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    per_row = _import(args.sample, bulk=False)
+    estimate = per_row / args.sample * args.rows
+    print(
+        f"per-row commands: {args.sample:,} rows in {per_row:6.2f} s"
+        f" ({args.sample / per_row:8.0f} rows/s) -> ~{estimate:8.1f} s for {args.rows:,}"
+    )
+    for label, inline in (("bulk command:", True), ("bulk, relay mode:", False)):
+        bulk = _import(args.rows, bulk=True, inline=inline)
+        print(f"{label:<17} {args.rows:,} rows in {bulk:6.2f} s ({args.rows / bulk:8.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
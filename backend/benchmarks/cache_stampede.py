@@ -0,0 +1,106 @@
+"""Latency around TTL expiry with and without single-flight / stale-while-revalidate.
+
+``--clients`` coroutines loop on one cacheable query whose handler sleeps
+``--load-ms`` (a stand-in for the DB) for several TTL periods. Reports handler
+calls and p50/p99/max latency for the pre-change behavior (every concurrent
+miss hits the handler), single-flight only, and single-flight plus SWR/XFetch.
+Run from ``backend/``::
+
+    python -m benchmarks.cache_stampede --clients 200 --seconds 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from application.mediator.behaviors import AsyncQueryHandler, CacheBehavior
+from application.mediator.mediator import Mediator
+from application.queries.base import IQuery
+from infrastructure.cache.cache_provider import AsyncCacheAdapter, CacheProvider
+
+
+@dataclass
+class _ListQuery(IQuery):
+    cache_key: str = "employee:list:0:100"
+    cache_ttl_seconds: int = 1
+
+
+class _NaiveCacheBehavior:
+    """The pre-change CacheBehavior: check, miss, load, set (no coordination)."""
+
+    def __init__(self, cache: AsyncCacheAdapter) -> None:
+        self.cache = cache
+
+    def applies_to(self, message_type: type[Any]) -> bool:
+        return True
+
+    async def handle_async(self, query: _ListQuery, next_handler: AsyncQueryHandler) -> Any:
+        cached = await self.cache.get(query.cache_key)
+        if cached is not None:
+            return cached
+        result = await next_handler(query)
+        await self.cache.set(query.cache_key, result, query.cache_ttl_seconds)
+        return result
+
+
+async def _run(label: str, behavior: Any, clients: int, seconds: float, load_ms: float) -> None:
+    mediator = Mediator(behaviors=[behavior])
+    loads = 0
+
+    async def handler(query: _ListQuery) -> list[int]:
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(load_ms / 1000)
+        return [1, 2, 3]
+
+    mediator.register_async_handler(_ListQuery, handler)
+    latencies: list[float] = []
+    deadline = time.monotonic() + seconds
+
+    async def client() -> None:
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            await mediator.send_async(_ListQuery())
+            latencies.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(0.05)
+
+    await asyncio.gather(*(client() for _ in range(clients)))
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)]
+    p999 = latencies[int(len(latencies) * 0.999)]
+    print(
+        f"{label:<26} handler calls {loads:5}  p50 {statistics.median(latencies):6.2f} ms"
+        f"  p99 {p99:6.2f} ms  p99.9 {p999:6.2f} ms  requests {len(latencies)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=6.0)
+    parser.add_argument("--load-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    configurations: list[tuple[str, Any]] = [
+        ("naive (before)", _NaiveCacheBehavior(AsyncCacheAdapter(CacheProvider())))
+    ]
+    for label, stale, beta in (("single-flight", 0.0, 0.0), ("single-flight+swr+xfetch", 30, 1.0)):
+        cache = CacheProvider()
+        behavior = CacheBehavior(
+            cache,
+            async_cache=AsyncCacheAdapter(cache),
+            stale_ttl_seconds=stale,
+            early_expiration_beta=beta,
+        )
+        configurations.append((label, behavior))
+    for label, behavior in configurations:
+        asyncio.run(_run(label, behavior, args.clients, args.seconds, args.load_ms))
+
+
+if __name__ == "__main__":
+    main()
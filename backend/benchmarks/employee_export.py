@@ -0,0 +1,107 @@
+"""Time-to-first-byte and peak memory of ``GET /employees/export`` vs. ``get_all``.
+
+Seeds ``--rows`` read-model employees, then drives the export generator directly
+(no HTTP) and compares it with materializing the list the way ``get_all`` does.
+Run from ``backend/``::
+
+    python -m benchmarks.employee_export --rows 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from api.routes.employees import _export_chunks, _ndjson_chunk
+from app.database import create_schema
+from app.models import ReadEmployee
+from infrastructure.read_repository.employees_read_repository import (
+    AsyncEmployeesReadRepository,
+)
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+_INSERT_CHUNK = 50_000
+
+
+def _seed(db: Session, rows: int) -> None:
+    for offset in range(0, rows, _INSERT_CHUNK):
+        db.execute(
+            insert(ReadEmployee),
+            [
+                {
+                    "id": i + 1,
+                    "name": f"Name{i}",
+                    "lastname": "Doe",
+                    "salary": 1000.0 + i,
+                    "address": "123 Main St",
+                    "in_vacation": i % 2 == 0,
+                }
+                for i in range(offset, min(offset + _INSERT_CHUNK, rows))
+            ],
+        )
+    db.commit()
+
+
+async def _measure_export(factory: async_sessionmaker[AsyncSession]) -> tuple[float, float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    first_byte = 0.0
+    total = 0
+    async for chunk in _export_chunks(factory, _ndjson_chunk):
+        if not first_byte:
+            first_byte = time.perf_counter() - start
+        total += len(chunk)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first_byte * 1000, peak / 1024 / 1024, total
+
+
+async def _measure_get_all(factory: async_sessionmaker[AsyncSession]) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    async with factory() as db:
+        await AsyncEmployeesReadRepository(db).get_all()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1000, peak / 1024 / 1024
+
+
+async def _run(db_path: Path, rows: int) -> None:
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    factory = async_sessionmaker(async_engine, expire_on_commit=False)
+    ttfb_ms, export_peak, size = await _measure_export(factory)
+    get_all_ms, get_all_peak = await _measure_get_all(factory)
+    print(
+        f"rows={rows:>8,} export: ttfb {ttfb_ms:7.2f} ms  peak {export_peak:6.1f} MiB"
+        f"  ({size / 1024 / 1024:.1f} MiB streamed) | get_all: first byte after"
+        f" {get_all_ms:8.2f} ms  peak {get_all_peak:6.1f} MiB"
+    )
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "export.db"
+        engine = create_engine(f"sqlite:///{db_path}")
+        create_schema(engine)
+        with Session(engine) as db:
+            for rows in sorted({args.rows // 10, args.rows}):
+                db.execute(text("DELETE FROM read_employees"))
+                _seed(db, rows)
+                asyncio.run(_run(db_path, rows))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Outbox payload cost per event: JSON (``serialize`` + ``json``) vs. generated codecs.
+
+For each event type, times encoding ``--events`` events the way the outbox used to
+(``json.dumps(event.serialize())``; ``asdict`` shows the original deep-copying
+``serialize``) and with ``encode_event``, then decoding them back (``json.loads``
++ ``deserialize`` vs. ``decode_event``), and reports the payload sizes. Each
+figure is the best of ``--repeat`` passes with the GC off, as ``timeit`` does.
+Run from ``backend/``::
+
+    python -m benchmarks.event_codec --events 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from typing import Any
+
+from domain.events.base import DomainEvent
+from domain.events.employees import EmployeeCreated, EmployeeDeleted, EmployeeUpdated
+from infrastructure.outbox.event_codec import decode_event, encode_event
+
+_FACTORIES: dict[str, Callable[[int], DomainEvent]] = {
+    "EmployeeCreated": lambda i: EmployeeCreated(
+        id=i,
+        name=f"Name{i}",
+        lastname="Doe",
+        salary=1000.0 + i,
+        address="123 Main St",
+        in_vacation=False,
+    ),
+    "EmployeeUpdated": lambda i: EmployeeUpdated(
+        id=i, fields_changed={"salary": 2000.0 + i, "in_vacation": True}
+    ),
+    "EmployeeDeleted": lambda i: EmployeeDeleted(id=i),
+}
+
+
+def _per_event_us(call: Callable[[Any], Any], items: list[Any], repeat: int) -> float:
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for item in items:
+                call(item)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best / len(items) * 1_000_000
+
+
+def _asdict_payload(event: DomainEvent) -> str:
+    payload = asdict(event)
+    payload["event_id"] = str(event.event_id)
+    payload["occurred_on"] = event.occurred_on.isoformat()
+    return json.dumps(payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for event_type, factory in _FACTORIES.items():
+        events = [factory(i) for i in range(args.events)]
+        event_class = type(events[0])
+        json_rows = [json.dumps(event.serialize()) for event in events]
+        binary_rows = [encode_event(event) for event in events]
+        if [decode_event(event_type, row) for row in binary_rows[:100]] != events[:100]:
+            raise SystemExit(f"{event_type} does not round-trip through its codec")
+
+        encode_asdict = _per_event_us(_asdict_payload, events, args.repeat)
+        encode_json = _per_event_us(
+            lambda event: json.dumps(event.serialize()), events, args.repeat
+        )
+        encode_binary = _per_event_us(encode_event, events, args.repeat)
+        decode_json = _per_event_us(
+            lambda row: event_class.deserialize(json.loads(row)),  # noqa: B023
+            json_rows,
+            args.repeat,
+        )
+        decode_binary = _per_event_us(
+            lambda row: decode_event(event_type, row),  # noqa: B023
+            binary_rows,
+            args.repeat,
+        )
+        json_size = sum(map(len, json_rows)) / len(json_rows)
+        binary_size = sum(map(len, binary_rows)) / len(binary_rows)
+        print(
+            f"{event_type:<16} encode {encode_asdict:5.2f} (asdict) / {encode_json:5.2f} ->"
+            f" {encode_binary:5.2f} us ({encode_asdict / encode_binary:4.1f}x /"
+            f" {encode_json / encode_binary:4.1f}x) | decode {decode_json:5.2f} ->"
+            f" {decode_binary:5.2f} us ({decode_json / decode_binary:4.1f}x)"
+            f" | {json_size:4.0f} -> {binary_size:3.0f} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Per-``send`` overhead of the mediator: legacy closure chain vs compiled pipelines.
+
+Run from ``backend/``::
+
+    python -m benchmarks.mediator_pipeline
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from application.mediator.behaviors import CacheableQuery, is_cacheable_query_type
+from application.mediator.mediator import Mediator
+from application.queries.base import IQuery
+
+
+@dataclass
+class PlainQuery(IQuery):
+    pass
+
+
+class PassThroughBehavior:
+    def handle(self, query: Any, next_handler: Callable[[Any], Any]) -> Any:
+        return next_handler(query)
+
+
+class CacheCheckBehavior:
+    """Mimics the old ``CacheBehavior`` per-call ``isinstance`` protocol check (cache miss)."""
+
+    def applies_to(self, message_type: type[Any]) -> bool:
+        return is_cacheable_query_type(message_type)
+
+    def handle(self, query: Any, next_handler: Callable[[Any], Any]) -> Any:
+        if not isinstance(query, CacheableQuery):
+            return next_handler(query)
+        return next_handler(query)
+
+
+class LegacyMediator:
+    """Verbatim copy of the pre-compilation dispatch for comparison."""
+
+    def __init__(self, behaviors: list[Any]) -> None:
+        self._query_handlers: dict[type[Any], Callable[[Any], Any]] = {}
+        self._behaviors = behaviors
+
+    def register_handler(self, message_type: type[Any], handler: Callable[[Any], Any]) -> None:
+        self._query_handlers[message_type] = handler
+
+    def send(self, query: Any) -> Any:
+        handler = self._query_handlers.get(type(query))
+        if handler is None:
+            raise ValueError(f"No handler registered for {type(query).__name__}")
+
+        def execute_pipeline(index: int, current_query: Any) -> Any:
+            if index >= len(self._behaviors):
+                return handler(current_query)
+            behavior = self._behaviors[index]
+            return behavior.handle(current_query, lambda q: execute_pipeline(index + 1, q))
+
+        return execute_pipeline(0, query)
+
+
+def _handler(query: Any) -> None:
+    return None
+
+
+def _bench(mediator: Any, number: int) -> float:
+    query = PlainQuery()
+    mediator.register_handler(PlainQuery, _handler)
+    best = min(timeit.repeat(lambda: mediator.send(query), number=number, repeat=5))
+    return best / number * 1e9
+
+
+def main(number: int = 200_000) -> None:
+    behaviors = [CacheCheckBehavior(), PassThroughBehavior(), PassThroughBehavior()]
+    legacy_ns = _bench(LegacyMediator(list(behaviors)), number)
+    compiled_ns = _bench(Mediator(behaviors=list(behaviors)), number)
+    print(f"legacy   send: {legacy_ns:8.1f} ns/op")
+    print(f"compiled send: {compiled_ns:8.1f} ns/op  ({legacy_ns / compiled_ns:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Outbox drain throughput: commit per record vs one transaction per batch.
+
+Run from ``backend/``::
+
+    python -m benchmarks.outbox_drain --events 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from app.database import bind_session, create_schema
+from application.mediator.registry import create_outbox_processor
+from domain.events.employees import EmployeeCreated
+from infrastructure.outbox.outbox_repository import OutboxRepository
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+
+def _drain(events: int, batch_size: int, batch_commit: bool) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        create_schema(engine)
+        session_factory = sessionmaker[Session](autoflush=False, bind=engine)
+        with session_factory() as db:
+            repository = OutboxRepository(db)
+            for i in range(1, events + 1):
+                repository.add_event(
+                    EmployeeCreated(
+                        id=i, name="n", lastname="l", salary=1.0, address="a", in_vacation=False
+                    )
+                )
+            db.commit()
+
+        processor = create_outbox_processor()
+        processor.batch_commit = batch_commit
+        processor.logger.disabled = True
+        start = time.perf_counter()
+        with session_factory() as db, bind_session(db):
+            while processor.process_pending_events(batch_size):
+                pass
+        elapsed = time.perf_counter() - start
+        engine.dispose()
+        return events / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=2000)
+    args = parser.parse_args()
+    for batch_size in (10, 50, 200):
+        per_record = _drain(args.events, batch_size, batch_commit=False)
+        batched = _drain(args.events, batch_size, batch_commit=True)
+        print(
+            f"batch_size={batch_size:<4} per-record: {per_record:8.0f} ev/s"
+            f"  batched: {batched:8.0f} ev/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Pending-scan latency of the outbox as processed history grows.
+
+Seeds ``--rows`` processed events plus a small pending tail, then times
+``OutboxRepository.get_unprocessed_events`` with and without the partial index.
+Run from ``backend/``::
+
+    python -m benchmarks.outbox_pending_scan --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from app.database import Base
+from infrastructure.outbox.outbox_repository import (
+    OutboxRecord,
+    OutboxRepository,
+    ensure_outbox_indexes,
+)
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import Session
+
+_PENDING = 100
+_INSERT_CHUNK = 50_000
+
+
+def _seed(db: Session, rows: int) -> None:
+    start = datetime.now(UTC) - timedelta(days=30)
+    for offset in range(0, rows, _INSERT_CHUNK):
+        db.execute(
+            insert(OutboxRecord),
+            [
+                {
+                    "id": f"done-{i}",
+                    "event_type": "EmployeeUpdated",
+                    "payload": "{}",
+                    "created_at": start + timedelta(milliseconds=i),
+                    "processed_at": start + timedelta(milliseconds=i),
+                }
+                for i in range(offset, min(offset + _INSERT_CHUNK, rows))
+            ],
+        )
+    db.execute(
+        insert(OutboxRecord),
+        [
+            {"id": f"pending-{i}", "event_type": "EmployeeUpdated", "payload": "{}"}
+            for i in range(_PENDING)
+        ],
+    )
+    db.commit()
+
+
+def _time_scan(db: Session, repeat: int = 50) -> float:
+    repository = OutboxRepository(db)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        repository.get_unprocessed_events(50)
+        best = min(best, time.perf_counter() - start)
+        db.expunge_all()
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'outbox.db'}")
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as db:
+            for rows in sorted({args.rows // 100, args.rows // 10, args.rows}):
+                db.execute(text("DELETE FROM outbox_events"))
+                _seed(db, rows)
+                indexed = _time_scan(db)
+                for index in OutboxRecord.__table__.indexes:
+                    db.execute(text(f"DROP INDEX {index.name}"))
+                unindexed = _time_scan(db, repeat=3)
+                db.commit()
+                ensure_outbox_indexes(db.connection())
+                db.commit()
+                print(
+                    f"history={rows:>9,} pending scan: indexed {indexed:7.3f} ms"
+                    f"  unindexed {unindexed:9.3f} ms"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Rebuilding ``read_employees``: shadow table plus swap vs. the per-event projector.
+
+Seeds ``--rows`` employees in a temporary write database, each with its
+``EmployeeCreated`` event in the outbox, and a stale 1,000-row read model in a
+separate file. Then times ``ReadModelRebuilder`` copying the table, and replaying
+the outbox with each ``--workers`` value, while a reader thread counts
+``read_employees`` on a query_only connection the whole time: it must only ever
+see the old row count or the new one. For reference, ``--sample`` events are
+replayed one at a time through ``EmployeesProjector`` and the rate extrapolated.
+Run from ``backend/``::
+
+    python -m benchmarks.read_model_rebuild --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from pathlib import Path
+
+from app.database import configure_sqlite, create_schema, sqlite_pragmas
+from app.models import Employee
+from application.read_models.projectors.employees_projector import EmployeesProjector
+from domain.events.employees import EmployeeCreated
+from infrastructure.outbox.outbox_repository import OutboxRecord, _outbox_rows
+from infrastructure.read_repository.employees_read_repository import EmployeesReadRepository
+from infrastructure.read_repository.rebuild import ReadModelRebuilder, RebuildResult
+from infrastructure.write.group_commit import create_writer_engine
+from sqlalchemy import Engine, create_engine, insert, text
+from sqlalchemy.orm import Session
+
+from benchmarks.employee_export import _seed
+
+_CHUNK = 50_000
+
+
+def _event(i: int) -> EmployeeCreated:
+    return EmployeeCreated(
+        id=i,
+        name=f"Name{i}",
+        lastname="Doe",
+        salary=1000.0 + i,
+        address="Main St",
+        in_vacation=False,
+    )
+
+
+def _seed_write_model(engine: Engine, rows: int) -> None:
+    old = datetime.now(UTC) - timedelta(days=1)
+    with engine.begin() as connection:
+        for start in range(1, rows + 1, _CHUNK):
+            events = [_event(i) for i in range(start, min(start + _CHUNK, rows + 1))]
+            connection.execute(
+                insert(Employee),
+                [
+                    {
+                        "id": event.id,
+                        "name": event.name,
+                        "lastname": event.lastname,
+                        "salary": event.salary,
+                        "address": event.address,
+                        "in_vacation": event.in_vacation,
+                    }
+                    for event in events
+                ],
+            )
+            # Already projected history, older than the rebuild's catch-up margin.
+            outbox = [
+                row | {"created_at": old, "processed_at": old} for row in _outbox_rows(events)
+            ]
+            connection.execute(insert(OutboxRecord), outbox)
+
+
+def _watch(engine: Engine, stop: threading.Event, seen: set[int]) -> None:
+    with engine.connect() as connection:
+        while not stop.is_set():
+            seen.add(connection.scalar(text("SELECT count(*) FROM read_employees")))
+            connection.rollback()
+
+
+def _timed(
+    rebuild: Callable[[], RebuildResult], read_url: str, stale: int
+) -> tuple[RebuildResult, set[int]]:
+    reader = create_engine(read_url)
+    configure_sqlite(reader, sqlite_pragmas(read_only=True))
+    stop = threading.Event()
+    seen: set[int] = set()
+    watcher = threading.Thread(target=_watch, args=(reader, stop, seen))
+    watcher.start()
+    try:
+        result = rebuild()
+    finally:
+        stop.set()
+        watcher.join()
+        reader.dispose()
+    unexpected = seen - {stale, result.rows}
+    if unexpected:
+        raise SystemExit(f"reader saw a partial read model: {sorted(unexpected)[:5]}")
+    return result, seen
+
+
+def _reset(writer: Engine, stale: int) -> None:
+    with writer.connect() as connection, connection.begin():
+        connection.exec_driver_sql("DELETE FROM read_employees")
+    with Session(writer) as db:
+        _seed(db, stale)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--chunk-size", type=int, default=_CHUNK)
+    parser.add_argument("--sample", type=int, default=20_000)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    stale = 1_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_engine = create_engine(f"sqlite:///{Path(tmp) / 'write.db'}")
+        configure_sqlite(write_engine, sqlite_pragmas())
+        read_url = f"sqlite:///{Path(tmp) / 'read.db'}"
+        writer = create_writer_engine(read_url)
+        create_schema(write_engine, writer)
+        start = time.perf_counter()
+        _seed_write_model(write_engine, args.rows)
+        print(f"seeded {args.rows:,} employees + events in {time.perf_counter() - start:5.1f} s")
+
+        runs = [("copy", ReadModelRebuilder.rebuild_from_table, 1)]
+        runs += [(f"replay workers={w}", ReadModelRebuilder.replay_outbox, w) for w in args.workers]
+        for label, run, workers in runs:
+            _reset(writer, stale)
+            rebuilder = ReadModelRebuilder(
+                write_engine, writer, chunk_size=args.chunk_size, workers=workers
+            )
+            result, seen = _timed(partial(run, rebuilder), read_url, stale)
+            print(
+                f"{label:<20} {result.rows:>9,} rows"
+                f" in {result.seconds:6.2f} s ({result.rows / result.seconds:9,.0f} rows/s)"
+                f" | caught up {result.caught_up} | reader saw counts {sorted(seen)}"
+            )
+
+        _reset(writer, 0)
+        events = [_event(i) for i in range(1, args.sample + 1)]
+        with Session(writer) as db:
+            projector = EmployeesProjector(EmployeesReadRepository(db))
+            start = time.perf_counter()
+            for event in events:
+                projector.project_created(event)
+                db.flush()
+            db.commit()
+            elapsed = time.perf_counter() - start
+        print(
+            f"{'per-event projector':<20} {args.sample:>9,} rows in {elapsed:6.2f} s"
+            f" ({args.sample / elapsed:9,.0f} rows/s) | ~{args.rows / args.sample * elapsed:,.0f} s"
+            f" for {args.rows:,}"
+        )
+        write_engine.dispose()
+        writer.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Cost of the uncached read path, from DB rows to JSON bytes, before vs. after.
+
+Seeds ``--rows`` read-model employees, fetches them once, then times only the
+Python work between the driver and the socket:
+
+* before: ``map_to_employee_dto`` per row, ``CacheBehavior._normalize`` over the
+  result, then FastAPI's ``serialize_response`` against ``list[schemas.Employee]``
+  and ``JSONResponse`` rendering;
+* after: ``map_employee_rows`` and one JSON encode (what the routes now do).
+
+Reports the best of ``--repeat`` runs and the peak traced allocation. Run from
+``backend/``::
+
+    python -m benchmarks.read_path --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from api.representations import JSON, encode
+from app import schemas
+from app.database import create_schema
+from application.mediator.behaviors import CacheBehavior
+from application.read_models.employees import map_employee_rows, map_to_employee_dto
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from infrastructure.cache.cache_provider import CacheProvider
+from infrastructure.read_repository.employees_read_repository import _READ_COLUMNS
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session
+
+from benchmarks.employee_export import _seed
+
+_RESPONSE_FIELD = create_response_field(name="response", type_=list[schemas.Employee])
+_normalize = CacheBehavior(CacheProvider())._normalize
+
+
+def _before(rows: list[Any]) -> bytes:
+    items = _normalize([map_to_employee_dto(row) for row in rows])
+    content = asyncio.run(serialize_response(field=_RESPONSE_FIELD, response_content=items))
+    return JSONResponse(content).body
+
+
+def _after(rows: list[Any]) -> bytes:
+    return encode(map_employee_rows(rows), JSON)
+
+
+def _measure(
+    path: Callable[[list[Any]], bytes], rows: list[Any], repeat: int
+) -> tuple[float, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        path(rows)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    path(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'read_path.db'}")
+        create_schema(engine)
+        with Session(engine) as db:
+            for count in sorted({args.rows // 10, args.rows}):
+                db.execute(text("DELETE FROM read_employees"))
+                _seed(db, count)
+                rows = db.execute(select(*_READ_COLUMNS).order_by(_READ_COLUMNS[0])).all()
+                # Same payload; only key order differs (pydantic puts ``id`` last).
+                if json.loads(_before(rows)) != json.loads(_after(rows)):
+                    raise SystemExit("before/after payloads differ")
+                before_ms, before_peak = _measure(_before, rows, args.repeat)
+                after_ms, after_peak = _measure(_after, rows, args.repeat)
+                print(
+                    f"rows={count:>8,} before {before_ms:8.1f} ms  peak {before_peak:6.1f} MiB"
+                    f" | after {after_ms:7.1f} ms  peak {after_peak:6.1f} MiB"
+                    f" | {before_ms / after_ms:4.1f}x faster"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Employee queries answered by the in-memory replica vs. the SQLite read model.
+
+Seeds ``--rows`` read-model employees in a temporary SQLite file, loads an
+``EmployeeReadReplica`` from it (reporting load time and memory footprint), then
+times ``get_page`` at random cursors and ``get_by_id`` on random ids through both
+the SQL repository (uncached) and the replica. Run from ``backend/``::
+
+    python -m benchmarks.read_replica --rows 300000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from app.database import create_schema
+from infrastructure.read_repository.employee_read_replica import EmployeeReadReplica
+from infrastructure.read_repository.employees_read_repository import EmployeesReadRepository
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from benchmarks.employee_export import _seed
+
+
+def _per_call_us(call: Callable[[int], Any], keys: list[int]) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        call(key)
+    return (time.perf_counter() - start) / len(keys) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--calls", type=int, default=2_000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)  # noqa: S311 - reproducible keys, not security
+    keys = [rng.randrange(1, args.rows + 1) for _ in range(args.calls)]
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'replica.db'}")
+        create_schema(engine)
+        with Session(engine) as db:
+            _seed(db, args.rows)
+            repository = EmployeesReadRepository(db)
+            replica = EmployeeReadReplica()
+            start = time.perf_counter()
+            replica.load(repository.iter_rows())
+            load_s = time.perf_counter() - start
+            if not replica.diff(repository.iter_rows()).consistent:
+                raise SystemExit("replica differs from read_employees after load")
+            footprint = replica.footprint()
+            print(
+                f"loaded {len(replica):,} rows in {load_s:5.2f} s;"
+                f" {footprint.total_bytes / 1024 / 1024:6.1f} MiB"
+                f" ({footprint.total_bytes / len(replica):5.0f} B/row,"
+                f" index {footprint.index_bytes / 1024 / 1024:5.1f} MiB)"
+            )
+            cases = (
+                (
+                    f"get_page(limit={args.limit})",
+                    lambda after: repository.get_page(args.limit, after),
+                    lambda after: replica.get_page(args.limit, after),
+                ),
+                ("get_by_id", repository.get_by_id, replica.get_by_id),
+            )
+            for label, sql, memory in cases:
+                sql_us = _per_call_us(sql, keys)
+                memory_us = _per_call_us(memory, keys)
+                print(
+                    f"{label:<20} sqlite {sql_us:8.1f} us | replica {memory_us:7.1f} us"
+                    f" | {sql_us / memory_us:5.1f}x"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
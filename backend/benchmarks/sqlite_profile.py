@@ -0,0 +1,85 @@
+"""SQLite connection profiles under a mixed load: ``default`` vs. ``wal``.
+
+For ``--seconds`` one thread commits single-row writes (insert into ``employees``)
+as fast as it can on the write engine, while another runs read-model page queries
+on the read-only engine. Reports commits/s, reads/s and the worst read latency
+(time spent waiting for the file lock shows up there). Run from ``backend/``::
+
+    python -m benchmarks.sqlite_profile --seconds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from app.database import configure_sqlite, create_schema, sqlite_pragmas
+from app.models import Employee
+from infrastructure.read_repository.employees_read_repository import _page_statement
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from benchmarks.employee_export import _seed
+
+
+def _run(profile: str, seconds: float) -> tuple[float, float, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'profile.db'}"
+        # Both profiles wait up to 30 s for the lock instead of failing outright.
+        write_engine = create_engine(url, connect_args={"timeout": 30})
+        configure_sqlite(write_engine, sqlite_pragmas(profile))
+        read_engine = create_engine(url, connect_args={"timeout": 30})
+        configure_sqlite(read_engine, sqlite_pragmas(profile, read_only=True))
+        create_schema(write_engine)
+        with Session(write_engine) as db:
+            _seed(db, 10_000)
+
+        stop = threading.Event()
+        commits = 0
+
+        def writer() -> None:
+            nonlocal commits
+            row = {"name": "Ada", "lastname": "Doe", "salary": 1.0, "address": "Main St"}
+            with write_engine.connect() as connection:
+                while not stop.is_set():
+                    connection.execute(insert(Employee), row)
+                    connection.commit()
+                    commits += 1
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        reads = 0
+        worst = 0.0
+        deadline = time.perf_counter() + seconds
+        with read_engine.connect() as connection:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                connection.execute(_page_statement(100, reads % 9_000)).all()
+                connection.rollback()
+                worst = max(worst, time.perf_counter() - start)
+                reads += 1
+        stop.set()
+        thread.join()
+        write_engine.dispose()
+        read_engine.dispose()
+        return commits / seconds, reads / seconds, worst * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    for profile in ("default", "wal"):
+        commits, reads, worst = _run(profile, args.seconds)
+        print(
+            f"profile={profile:<8} commits {commits:7.0f}/s | reads {reads:7.0f}/s"
+            f" | worst read {worst:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Write throughput vs. concurrency: one transaction per command vs. group commit.
+
+``--concurrency`` tasks each send ``CreateEmployeeCommand`` through
+``MediatorScope.send_async`` until ``--commands`` have been written to a temporary
+SQLite file (relay mode, so each command is its write plus the outbox insert):
+
+* per-command: every request commits on its own ``AsyncSession`` (the default);
+* group commit: the same commands go through ``GroupCommitWriter``.
+
+Run from ``backend/``::
+
+    python -m benchmarks.write_concurrency --commands 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from app import schemas
+from app.database import create_schema
+from application.commands.employees import CreateEmployeeCommand
+from application.mediator.mediator import MediatorScope
+from application.mediator.registry import create_mediator
+from infrastructure.cache.cache_provider import CacheProvider
+from infrastructure.write.group_commit import GroupCommitWriter, create_writer_engine
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+_PAYLOAD = schemas.EmployeeCreate(name="Ada", lastname="Doe", salary=1000.0, address="Main St")
+
+
+async def _write(path: Path, commands: int, concurrency: int, group_commit: bool) -> float:
+    url = f"sqlite:///{path}"
+    create_schema(create_engine(url))
+    writer = None
+    if group_commit:
+        writer = GroupCommitWriter(create_writer_engine(url))
+        writer.start()
+    mediator = create_mediator(CacheProvider(), write_coordinator=writer)
+    # A generous busy timeout so per-command writers queue on the lock instead of failing.
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", connect_args={"timeout": 60})
+    session_factory = async_sessionmaker[AsyncSession](async_engine, expire_on_commit=False)
+    remaining = iter(range(commands))
+
+    async def worker() -> None:
+        for _ in remaining:
+            async with session_factory() as db:
+                await MediatorScope(mediator, async_db=db).send_async(
+                    CreateEmployeeCommand(_PAYLOAD)
+                )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    if writer is not None:
+        writer.stop()
+        writer.engine.dispose()
+    await async_engine.dispose()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commands", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    for concurrency in args.concurrency:
+        rates = []
+        for group_commit in (False, True):
+            with tempfile.TemporaryDirectory() as tmp:
+                elapsed = asyncio.run(
+                    _write(Path(tmp) / "writes.db", args.commands, concurrency, group_commit)
+                )
+            rates.append(args.commands / elapsed)
+        print(
+            f"concurrency={concurrency:>3}  per-command {rates[0]:7.0f} cmd/s"
+            f" | group commit {rates[1]:7.0f} cmd/s | {rates[1] / rates[0]:4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
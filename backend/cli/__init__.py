@@ -0,0 +1 @@
+"""Operational entry points, run as ``python -m cli.<command>`` from backend/."""
@@ -0,0 +1,48 @@
+"""Standalone outbox relay worker.
+
+Run exactly one per database, next to API processes started with
+``OUTBOX_RELAY_EXTERNAL=true`` (and without ``OUTBOX_RELAY_IN_PROCESS=true``)::
+
+    python -m cli.outbox_relay --poll-interval 0.5 --batch-size 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import signal
+from types import FrameType
+
+from app.database import create_schema, engine, read_model_engine
+from application.mediator.registry import create_container
+from config import OUTBOX_RELAY_BATCH_SIZE, OUTBOX_RELAY_POLL_INTERVAL
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Drain the outbox into the read model.")
+    parser.add_argument("--poll-interval", type=float, default=OUTBOX_RELAY_POLL_INTERVAL)
+    parser.add_argument("--batch-size", type=int, default=OUTBOX_RELAY_BATCH_SIZE)
+    parser.add_argument("--once", action="store_true", help="Drain one batch and exit.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    create_schema(engine, read_model_engine)
+    container = create_container()
+    relay = container.create_relay(poll_interval=args.poll_interval, batch_size=args.batch_size)
+
+    def _shutdown(signum: int, frame: FrameType | None) -> None:
+        relay.stop(timeout=None)
+
+    try:
+        if args.once:
+            relay.run_once()
+            return
+        signal.signal(signal.SIGTERM, _shutdown)
+        signal.signal(signal.SIGINT, _shutdown)
+        relay.run_forever()
+    finally:
+        container.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Archive or purge processed outbox events in small chunks.
+
+Typically scheduled (cron/k8s CronJob)::
+
+    python -m cli.outbox_retention --older-than-hours 168 --archive
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from datetime import timedelta
+
+from app.database import Base, SessionLocal, engine
+from config import (
+    OUTBOX_RETENTION_ARCHIVE,
+    OUTBOX_RETENTION_CHUNK_SIZE,
+    OUTBOX_RETENTION_MAX_AGE_HOURS,
+)
+from infrastructure.outbox.outbox_repository import ensure_outbox_indexes
+from infrastructure.outbox.retention import OutboxRetention
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compact the outbox_events table.")
+    parser.add_argument("--older-than-hours", type=float, default=OUTBOX_RETENTION_MAX_AGE_HOURS)
+    parser.add_argument("--chunk-size", type=int, default=OUTBOX_RETENTION_CHUNK_SIZE)
+    parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between chunks.")
+    parser.add_argument(
+        "--archive",
+        action=argparse.BooleanOptionalAction,
+        default=OUTBOX_RETENTION_ARCHIVE,
+        help="Copy rows to outbox_events_archive before deleting them.",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    Base.metadata.create_all(bind=engine)
+    ensure_outbox_indexes(engine)
+    retention = OutboxRetention(
+        SessionLocal,
+        timedelta(hours=args.older_than_hours),
+        chunk_size=args.chunk_size,
+        archive=args.archive,
+        pause_seconds=args.pause,
+    )
+    retention.run_once()
+
+
+if __name__ == "__main__":
+    main()
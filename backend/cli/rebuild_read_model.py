@@ -0,0 +1,63 @@
+"""Rebuild ``read_employees`` from the write model and swap it in atomically.
+
+Copy the ``employees`` table (default), or replay the archived and pending outbox::
+
+    python -m cli.rebuild_read_model --source employees --chunk-size 50000
+    python -m cli.rebuild_read_model --source outbox --workers 4
+
+Safe to run next to the API and the relay: readers keep the old table until the
+swap commits. Processes serving from the in-memory replica must be restarted to
+pick up the rebuilt rows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+
+from app.database import READ_MODEL_DATABASE_URL, create_schema, engine, read_model_engine
+from config import READ_MODEL_REBUILD_CHUNK_SIZE, READ_MODEL_REBUILD_WORKERS
+from infrastructure.read_repository.rebuild import ReadModelRebuilder
+from infrastructure.write.group_commit import create_writer_engine
+
+
+def _print_progress(stage: str, done: int, total: int) -> None:
+    percent = done / total * 100 if total else 100.0
+    print(f"{stage}: {done:,}/{total:,} ({percent:5.1f}%)", file=sys.stderr, flush=True)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the employees read model.")
+    parser.add_argument("--source", choices=("employees", "outbox"), default="employees")
+    parser.add_argument("--chunk-size", type=int, default=READ_MODEL_REBUILD_CHUNK_SIZE)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=READ_MODEL_REBUILD_WORKERS,
+        help="Processes decoding outbox chunks in parallel (--source outbox).",
+    )
+    parser.add_argument("--quiet", action="store_true", help="Only log the final summary.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    create_schema(engine, read_model_engine)
+    writer_engine = create_writer_engine(READ_MODEL_DATABASE_URL)
+    rebuilder = ReadModelRebuilder(
+        engine,
+        writer_engine,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        progress=None if args.quiet else _print_progress,
+    )
+    try:
+        if args.source == "outbox":
+            rebuilder.replay_outbox()
+        else:
+            rebuilder.rebuild_from_table()
+    finally:
+        writer_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,112 @@ from __future__ import annotations
 import os
 from typing import Final
 
+# SQLite pragmas applied to every new connection: "wal" (WAL journal plus the knobs
+# below) or "default" (driver defaults, rollback journal, synchronous=FULL).
+SQLITE_PROFILE: Final = os.getenv("SQLITE_PROFILE", "wal")
+# NORMAL is durable across application crashes in WAL mode; only an OS crash can
+# lose the last commits.
+SQLITE_SYNCHRONOUS: Final = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_MMAP_SIZE: Final = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+# Negative values are KiB (SQLite convention): -65536 is a 64 MiB page cache per connection.
+SQLITE_CACHE_SIZE: Final = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+SQLITE_BUSY_TIMEOUT_MS: Final = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_TEMP_STORE: Final = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+
+# The read model (read_employees and any other projection) lives in its own SQLite file
+# under data/; point it at "employees.db" to share the write database again.
+READ_MODEL_DB_NAME: Final = os.getenv("READ_MODEL_DB_NAME", "read_model.db")
+# Pools are sized per side so read capacity can grow without touching the writers.
+WRITE_DB_POOL_SIZE: Final = int(os.getenv("WRITE_DB_POOL_SIZE", "5"))
+WRITE_DB_MAX_OVERFLOW: Final = int(os.getenv("WRITE_DB_MAX_OVERFLOW", "10"))
+READ_MODEL_POOL_SIZE: Final = int(os.getenv("READ_MODEL_POOL_SIZE", "10"))
+READ_MODEL_MAX_OVERFLOW: Final = int(os.getenv("READ_MODEL_MAX_OVERFLOW", "20"))
+
 REDIS_HOST: Final = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT: Final = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_DB: Final = int(os.getenv("REDIS_DB", "0"))
 REDIS_PASSWORD: Final | None = os.getenv("REDIS_PASSWORD")
+REDIS_MAX_CONNECTIONS: Final = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_SOCKET_TIMEOUT: Final = float(os.getenv("REDIS_SOCKET_TIMEOUT", "1.0"))
+
+# Bounds for the in-memory cache used when Redis is unreachable.
+CACHE_MAX_ENTRIES: Final = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+CACHE_MAX_BYTES: Final = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# How often in-process caches (fallback and L1) drop expired entries nobody reads.
+CACHE_SWEEP_INTERVAL_SECONDS: Final = float(os.getenv("CACHE_SWEEP_INTERVAL_SECONDS", "30"))
+
+# Opt-in: serve expired entries for this long while a single caller refreshes them.
+# Entries are then kept past their TTL, so a reader can see data this much older than
+# the TTL promises; 0 (default) keeps plain expiry.
+CACHE_STALE_TTL_SECONDS: Final = float(os.getenv("CACHE_STALE_TTL_SECONDS", "0"))
+# Opt-in XFetch early-refresh aggressiveness (1.0 is the usual value); 0 (default) disables
+# probabilistic early expiration.
+CACHE_EARLY_EXPIRATION_BETA: Final = float(os.getenv("CACHE_EARLY_EXPIRATION_BETA", "0"))
+# Also single-flight misses across workers with a Redis lock.
+CACHE_DISTRIBUTED_LOCK: Final = os.getenv("CACHE_DISTRIBUTED_LOCK", "false").lower() == "true"
+CACHE_LOCK_TIMEOUT_SECONDS: Final = float(os.getenv("CACHE_LOCK_TIMEOUT_SECONDS", "5"))
+
+# In-process L1 in front of Redis; deletes are broadcast on CACHE_INVALIDATION_CHANNEL.
+CACHE_L1_ENABLED: Final = os.getenv("CACHE_L1_ENABLED", "true").lower() == "true"
+CACHE_L1_MAX_ENTRIES: Final = int(os.getenv("CACHE_L1_MAX_ENTRIES", "1024"))
+CACHE_L1_MAX_BYTES: Final = int(os.getenv("CACHE_L1_MAX_BYTES", str(16 * 1024 * 1024)))
+CACHE_L1_TTL_SECONDS: Final = float(os.getenv("CACHE_L1_TTL_SECONDS", "1.0"))
+CACHE_INVALIDATION_CHANNEL: Final = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache:invalidate")
+
+# Start the relay inside the API process. Exactly one relay may drain a database: relays
+# do not claim rows, so two would project the same events. Enable it only for a single
+# API worker, or run `python -m cli.outbox_relay` once next to the workers instead.
+OUTBOX_RELAY_IN_PROCESS: Final = os.getenv("OUTBOX_RELAY_IN_PROCESS", "false").lower() == "true"
+# Declares that a `python -m cli.outbox_relay` process drains this database.
+OUTBOX_RELAY_EXTERNAL: Final = os.getenv("OUTBOX_RELAY_EXTERNAL", "false").lower() == "true"
+# "relay": a background worker drains the outbox; "inline": project inside each command.
+# Defaults to relay only when one is configured above, so writes always get projected.
+OUTBOX_DISPATCH_MODE: Final = os.getenv(
+    "OUTBOX_DISPATCH_MODE",
+    "relay" if OUTBOX_RELAY_IN_PROCESS or OUTBOX_RELAY_EXTERNAL else "inline",
+)
+OUTBOX_RELAY_POLL_INTERVAL: Final = float(os.getenv("OUTBOX_RELAY_POLL_INTERVAL", "0.5"))
+OUTBOX_RELAY_BATCH_SIZE: Final = int(os.getenv("OUTBOX_RELAY_BATCH_SIZE", "100"))
+# Commit each relay batch in one transaction (falls back per record on failure).
+OUTBOX_BATCH_COMMIT: Final = os.getenv("OUTBOX_BATCH_COMMIT", "true").lower() == "true"
+
+# Retention for processed outbox events (see `python -m cli.outbox_retention`).
+OUTBOX_RETENTION_IN_PROCESS: Final = (
+    os.getenv("OUTBOX_RETENTION_IN_PROCESS", "false").lower() == "true"
+)
+OUTBOX_RETENTION_MAX_AGE_HOURS: Final = float(os.getenv("OUTBOX_RETENTION_MAX_AGE_HOURS", "168"))
+OUTBOX_RETENTION_CHUNK_SIZE: Final = int(os.getenv("OUTBOX_RETENTION_CHUNK_SIZE", "1000"))
+OUTBOX_RETENTION_ARCHIVE: Final = os.getenv("OUTBOX_RETENTION_ARCHIVE", "false").lower() == "true"
+OUTBOX_RETENTION_INTERVAL_SECONDS: Final = float(
+    os.getenv("OUTBOX_RETENTION_INTERVAL_SECONDS", "3600")
+)
+
+# Rows fetched per server-side cursor round-trip by GET /employees/export.
+EXPORT_CHUNK_SIZE: Final = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))
+
+# Opt-in cache of encoded read responses (JSON bytes, plus gzip when the client accepts it).
+RESPONSE_CACHE_ENABLED: Final = os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+RESPONSE_CACHE_GZIP: Final = os.getenv("RESPONSE_CACHE_GZIP", "true").lower() == "true"
+
+# Opt-in single writer: concurrent commands arriving within the window share one commit.
+WRITE_COORDINATOR_ENABLED: Final = os.getenv("WRITE_COORDINATOR_ENABLED", "false").lower() == "true"
+WRITE_COORDINATOR_WINDOW_MS: Final = float(os.getenv("WRITE_COORDINATOR_WINDOW_MS", "2"))
+WRITE_COORDINATOR_MAX_BATCH: Final = int(os.getenv("WRITE_COORDINATOR_MAX_BATCH", "64"))
+# Longest a command may stay queued; past it, it is cancelled and the request times out.
+WRITE_COORDINATOR_TIMEOUT_SECONDS: Final = float(
+    os.getenv("WRITE_COORDINATOR_TIMEOUT_SECONDS", "30")
+)
+
+# Serve GET /employees and /employees/{id} from an in-process copy of the read model,
+# loaded at startup and kept current by committed projections. Only complete in a
+# process that projects every event, so it needs a single API worker and either inline
+# dispatch or the in-process relay; startup refuses more workers and skips the replica
+# (with a warning) in a process that never projects.
+READ_REPLICA_ENABLED: Final = os.getenv("READ_REPLICA_ENABLED", "false").lower() == "true"
+# API worker processes; uvicorn reads the same variable as its --workers default.
+API_WORKERS: Final = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# Defaults for ``python -m cli.rebuild_read_model``: rows per shadow-table insert
+# transaction, and processes decoding outbox chunks when replaying events.
+READ_MODEL_REBUILD_CHUNK_SIZE: Final = int(os.getenv("READ_MODEL_REBUILD_CHUNK_SIZE", "50000"))
+READ_MODEL_REBUILD_WORKERS: Final = int(os.getenv("READ_MODEL_REBUILD_WORKERS", "1"))
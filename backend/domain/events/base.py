@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID, uuid4
 
 
@@ -10,6 +10,10 @@ from uuid import UUID, uuid4
 class DomainEvent:
     """Base class for immutable domain events."""
 
+    # Version of the binary outbox payload; bump it when fields change and register
+    # an upcaster for the previous one so stored events stay readable.
+    schema_version: ClassVar[int] = 1
+
     event_id: UUID = field(default_factory=uuid4)
     occurred_on: datetime = field(default_factory=lambda: datetime.now(UTC))
 
@@ -19,7 +23,8 @@ class DomainEvent:
 
     def serialize(self) -> dict[str, Any]:
         """Return a JSON-serializable payload to persist in the outbox."""
-        payload = asdict(self)
+        # Shallow copy: asdict() deep-copies every value, which dominates bulk enqueues.
+        payload = dict(vars(self))
         payload["event_id"] = str(self.event_id)
         payload["occurred_on"] = self.occurred_on.isoformat()
         return payload
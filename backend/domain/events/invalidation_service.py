@@ -4,36 +4,107 @@ import logging
 from collections.abc import Iterable
 
 from application.commands.employees import (
+    BulkCreateEmployeesCommand,
+    BulkDeleteEmployeesCommand,
+    BulkUpdateEmployeesCommand,
     CreateEmployeeCommand,
     DeleteEmployeeCommand,
     UpdateEmployeeCommand,
 )
-from application.read_models.ttl_config import EMPLOYEE_LIST_CACHE_KEY, employee_detail_cache_key
-from infrastructure.cache.cache_provider import CacheBackend
+from application.read_models.ttl_config import (
+    EMPLOYEE_LIST_CACHE_NAMESPACE,
+    RESPONSE_REPRESENTATIONS,
+    employee_detail_cache_key,
+    response_cache_key,
+)
+from infrastructure.cache.cache_provider import AsyncCacheBackend, CacheBackend
+
+from domain.events.base import DomainEvent
+from domain.events.employees import EmployeeCreated, EmployeeDeleted, EmployeeUpdated
+
+_EMPLOYEE_COMMANDS = (
+    CreateEmployeeCommand,
+    UpdateEmployeeCommand,
+    DeleteEmployeeCommand,
+    BulkCreateEmployeesCommand,
+    BulkUpdateEmployeesCommand,
+    BulkDeleteEmployeesCommand,
+)
+_EMPLOYEE_EVENTS = (EmployeeCreated, EmployeeUpdated, EmployeeDeleted)
+# Generations bumped by every employee write (see ``CacheableQuery.cache_namespace``).
+_NAMESPACES = (EMPLOYEE_LIST_CACHE_NAMESPACE,)
+# Bulk commands evict thousands of keys; the log line names only the first few.
+_LOGGED_KEYS = 20
 
 
 class InvalidationService:
-    """Centralized cache invalidation keyed by Command type."""
+    """Centralized cache invalidation keyed by Command type.
+
+    List pages are invalidated by bumping the ``employee:list`` generation; detail
+    entries have one key per employee, plus one per cached response representation,
+    and are deleted directly.
+    """
 
-    def __init__(self, cache: CacheBackend, logger: logging.Logger | None = None):
+    def __init__(
+        self,
+        cache: CacheBackend,
+        logger: logging.Logger | None = None,
+        async_cache: AsyncCacheBackend | None = None,
+    ):
         self.cache = cache
+        self.async_cache = async_cache
         self.logger = logger or logging.getLogger("mediator.invalidation")
 
     def invalidate_for(self, command: object) -> None:
+        if not isinstance(command, _EMPLOYEE_COMMANDS):
+            return
+        # One counter bump orphans every list page, however many variants are cached;
+        # it rides in the same round-trip as the exact detail-key deletes.
         keys = list(self._keys_for(command))
-        for key in keys:
-            self.cache.delete(key)
-        if keys:
-            self.logger.info(
-                "cache_invalidate command=%s keys=%s", type(command).__name__, ",".join(keys)
-            )
+        self.cache.delete_many(keys, _NAMESPACES)
+        self._log_eviction(f"command={type(command).__name__}", keys)
+
+    async def invalidate_for_async(self, command: object) -> None:
+        if self.async_cache is None:
+            raise RuntimeError("InvalidationService needs an async_cache for async invalidation")
+        if not isinstance(command, _EMPLOYEE_COMMANDS):
+            return
+        keys = list(self._keys_for(command))
+        await self.async_cache.delete_many(keys, _NAMESPACES)
+        self._log_eviction(f"command={type(command).__name__}", keys)
+
+    def invalidate_for_events(self, events: Iterable[DomainEvent]) -> None:
+        """Evict keys made stale by projected events (relay mode, after the read model moved)."""
+        events = [event for event in events if isinstance(event, _EMPLOYEE_EVENTS)]
+        if not events:
+            return
+        keys = list(dict.fromkeys(key for event in events for key in self._keys_for_event(event)))
+        self.cache.delete_many(keys, _NAMESPACES)
+        self._log_eviction("source=outbox", keys)
+
+    def _log_eviction(self, source: str, keys: list[str]) -> None:
+        self.logger.info(
+            "cache_invalidate %s namespaces=%s keys=%s",
+            source,
+            ",".join(_NAMESPACES),
+            ",".join(keys[:_LOGGED_KEYS])
+            + (f",...(+{len(keys) - _LOGGED_KEYS})" if len(keys) > _LOGGED_KEYS else ""),
+        )
+
+    def _keys_for_event(self, event: DomainEvent) -> Iterable[str]:
+        if isinstance(event, EmployeeUpdated | EmployeeDeleted):
+            yield from _detail_keys(event.id)
 
     def _keys_for(self, command: object) -> Iterable[str]:
-        if isinstance(command, CreateEmployeeCommand):
-            yield EMPLOYEE_LIST_CACHE_KEY
-        elif isinstance(command, UpdateEmployeeCommand):
-            yield EMPLOYEE_LIST_CACHE_KEY
-            yield employee_detail_cache_key(command.employee_id)
-        elif isinstance(command, DeleteEmployeeCommand):
-            yield EMPLOYEE_LIST_CACHE_KEY
-            yield employee_detail_cache_key(command.employee_id)
+        if isinstance(command, UpdateEmployeeCommand | DeleteEmployeeCommand):
+            yield from _detail_keys(command.employee_id)
+        elif isinstance(command, BulkUpdateEmployeesCommand | BulkDeleteEmployeesCommand):
+            for employee_id in command.employee_ids:
+                yield from _detail_keys(employee_id)
+
+
+def _detail_keys(employee_id: int) -> Iterable[str]:
+    key = employee_detail_cache_key(employee_id)
+    yield key
+    # Deleting absent response entries is free: they share the same UNLINK.
+    yield from (response_cache_key(key, rep) for rep in RESPONSE_REPRESENTATIONS)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import sys
 import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
-from threading import Lock
+from threading import Event, Lock, Thread
 from typing import Any, Protocol
 
 
@@ -15,16 +18,27 @@ class CacheMetrics:
     serialization_time_ms: float = 0.0
     deserialization_time_ms: float = 0.0
     dto_size_bytes: int = 0
+    l1_hit_count: int = 0
+    eviction_count: int = 0
+    expired_count: int = 0
+    entry_count: int = 0
+    size_bytes: int = 0
 
 
 @dataclass
 class CacheEntry:
     expires_at: float
     value: Any
+    size: int = 0
 
 
 class CacheBackend(Protocol):
-    """Shared contract implemented by any cache provider (Redis or in-memory)."""
+    """Shared contract implemented by any cache provider (Redis or in-memory).
+
+    The ``*_many`` methods cost one round-trip (or one lock per shard) for the whole
+    batch. ``get_many`` returns only the hits; ``delete_many`` also bumps the given
+    generation ``namespaces`` in that same round-trip.
+    """
 
     metrics: CacheMetrics
 
@@ -36,47 +50,335 @@ class CacheBackend(Protocol):
 
     def exists(self, key: str) -> bool: ...
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]: ...
 
-class CacheProvider:
-    """Minimal in-memory cache with TTL; designed to be swapped with Redis later."""
+    def set_many(self, items: Mapping[str, Any], ttl_seconds: int) -> None: ...
+
+    def delete_many(self, keys: Iterable[str], namespaces: Iterable[str] = ()) -> None: ...
+
+    def get_generation(self, namespace: str) -> int: ...
+
+    def bump_generation(self, namespace: str) -> int: ...
+
+
+class AsyncCacheBackend(Protocol):
+    """Awaitable variant of ``CacheBackend`` used by the async mediator path."""
+
+    metrics: CacheMetrics
+
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def exists(self, key: str) -> bool: ...
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]: ...
+
+    async def set_many(self, items: Mapping[str, Any], ttl_seconds: int) -> None: ...
+
+    async def delete_many(self, keys: Iterable[str], namespaces: Iterable[str] = ()) -> None: ...
+
+    async def get_generation(self, namespace: str) -> int: ...
+
+    async def bump_generation(self, namespace: str) -> int: ...
+
+
+class LoadLock(Protocol):
+    """Cross-process mutex so only one worker recomputes a missing cache entry."""
+
+    def acquire(self, key: str, ttl_seconds: float) -> str | None: ...
+
+    def release(self, key: str, token: str) -> None: ...
+
+
+class AsyncLoadLock(Protocol):
+    async def acquire(self, key: str, ttl_seconds: float) -> str | None: ...
+
+    async def release(self, key: str, token: str) -> None: ...
+
+
+def estimate_size(value: Any) -> int:
+    """Rough deep size in bytes of a cached DTO (dicts, lists, scalars)."""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(key) + estimate_size(item) for key, item in value.items()
+        )
+    if isinstance(value, list | tuple | set | frozenset):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class _Shard:
+    __slots__ = ("entries", "lock", "size_bytes", "hits", "misses", "evictions", "expired")
 
     def __init__(self) -> None:
-        self._store: dict[str, CacheEntry] = {}
-        self._lock = Lock()
-        self.metrics = CacheMetrics()
+        # Insertion order doubles as recency order for LRU eviction.
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.lock = Lock()
+        self.size_bytes = 0
+        # Counters only ever change under ``lock``; ``CacheProvider.metrics`` sums them.
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+
+_SHARD_COUNTERS = (
+    ("cache_hit_count", "hits"),
+    ("cache_miss_count", "misses"),
+    ("eviction_count", "evictions"),
+    ("expired_count", "expired"),
+    ("size_bytes", "size_bytes"),
+)
+
+
+class CacheProvider:
+    """In-memory TTL cache, optionally bounded by entry count and bytes (LRU).
+
+    Keys are spread over ``shards`` independently locked LRU maps so concurrent
+    readers rarely contend; bounds are enforced per shard (``max_entries / shards``),
+    which approximates a global LRU. Expired entries are dropped on access and by
+    ``sweep_expired`` (run periodically via ``start_sweeper``). Each shard counts
+    under its own lock; ``metrics`` folds the shards into one ``CacheMetrics`` when read.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        shards: int = 16,
+    ) -> None:
+        if max_entries is not None:
+            shards = max(1, min(shards, max_entries))
+        self._shards = [_Shard() for _ in range(shards)]
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._shard_max_entries = -(-max_entries // shards) if max_entries is not None else None
+        self._shard_max_bytes = max_bytes // shards if max_bytes is not None else None
+        self._metrics = CacheMetrics()
+        # Shard totals already folded into ``_metrics``; only the difference is added,
+        # so increments made directly on the object (e.g. by a tiered cache) survive.
+        self._published = dict.fromkeys([*(name for name, _ in _SHARD_COUNTERS), "entry_count"], 0)
+        self._publish_lock = Lock()
+        # Kept apart from the entries so eviction can never reset a generation.
+        self._generations: dict[str, int] = {}
+        self._generation_lock = Lock()
+        self._sweep_stop = Event()
+        self._sweeper: Thread | None = None
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        """Shared counters, refreshed from the shards on every read (same object each time)."""
+        with self._publish_lock:
+            totals = {
+                name: sum(getattr(shard, counter) for shard in self._shards)
+                for name, counter in _SHARD_COUNTERS
+            }
+            totals["entry_count"] = len(self)
+            for name, total in totals.items():
+                setattr(
+                    self._metrics,
+                    name,
+                    getattr(self._metrics, name) + total - self._published[name],
+                )
+            self._published = totals
+        return self._metrics
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
 
     def get(self, key: str) -> Any | None:
         """Return cached value if it is still fresh; otherwise drop and miss."""
-        with self._lock:
-            entry = self._store.get(key)
-            if not entry:
-                self.metrics.cache_miss_count += 1
-                return None
-            if entry.expires_at < time.monotonic():
-                self._store.pop(key, None)
-                self.metrics.cache_miss_count += 1
-                return None
-            self.metrics.cache_hit_count += 1
-            return entry.value
-
-    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
-        """Store a value with a short TTL; designed for read-side responses."""
+        shard = self._shard(key)
+        with shard.lock:
+            return self._lookup(shard, key, time.monotonic())
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Store a value with a short TTL, evicting least recently used entries if full."""
         expires_at = time.monotonic() + max(ttl_seconds, 0)
-        with self._lock:
-            self._store[key] = CacheEntry(expires_at=expires_at, value=value)
+        size = self._size_of(key, value)
+        shard = self._shard(key)
+        with shard.lock:
+            self._store(shard, key, value, expires_at, size)
 
     def delete(self, key: str) -> None:
         """Remove a cached entry if present."""
-        with self._lock:
-            self._store.pop(key, None)
+        shard = self._shard(key)
+        with shard.lock:
+            self._remove(shard, key)
 
     def exists(self, key: str) -> bool:
         """Check whether a non-expired entry exists for the given key."""
-        with self._lock:
-            entry = self._store.get(key)
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
             if not entry:
                 return False
             if entry.expires_at < time.monotonic():
-                self._store.pop(key, None)
+                self._remove(shard, key)
+                shard.expired += 1
                 return False
             return True
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Return the fresh values among ``keys``, locking each touched shard once."""
+        found: dict[str, Any] = {}
+        now = time.monotonic()
+        for shard, shard_keys in self._by_shard(keys).items():
+            with shard.lock:
+                for key in shard_keys:
+                    value = self._lookup(shard, key, now)
+                    if value is not None:
+                        found[key] = value
+        return found
+
+    def set_many(self, items: Mapping[str, Any], ttl_seconds: float) -> None:
+        expires_at = time.monotonic() + max(ttl_seconds, 0)
+        sizes = {key: self._size_of(key, value) for key, value in items.items()}
+        for shard, shard_keys in self._by_shard(items).items():
+            with shard.lock:
+                for key in shard_keys:
+                    self._store(shard, key, items[key], expires_at, sizes[key])
+
+    def delete_many(self, keys: Iterable[str], namespaces: Iterable[str] = ()) -> None:
+        for shard, shard_keys in self._by_shard(keys).items():
+            with shard.lock:
+                for key in shard_keys:
+                    self._remove(shard, key)
+        for namespace in namespaces:
+            self.bump_generation(namespace)
+
+    def get_generation(self, namespace: str) -> int:
+        """Current generation of a key family; embedded in its cache keys."""
+        return self._generations.get(namespace, 0)
+
+    def bump_generation(self, namespace: str) -> int:
+        """Orphan every entry of ``namespace`` at once; stale ones age out via TTL/LRU."""
+        with self._generation_lock:
+            generation = self._generations.get(namespace, 0) + 1
+            self._generations[namespace] = generation
+            return generation
+
+    def sweep_expired(self) -> int:
+        """Drop every expired entry, one shard lock at a time; return how many went."""
+        removed = 0
+        for shard in self._shards:
+            now = time.monotonic()
+            with shard.lock:
+                expired = [key for key, entry in shard.entries.items() if entry.expires_at < now]
+                for key in expired:
+                    self._remove(shard, key)
+                shard.expired += len(expired)
+            removed += len(expired)
+        return removed
+
+    def start_sweeper(self, interval_seconds: float) -> None:
+        """Sweep expired entries on a daemon thread every ``interval_seconds``."""
+        if self._sweeper is not None:
+            return
+        self._sweep_stop.clear()
+        self._sweeper = Thread(
+            target=self._sweep_forever, args=(interval_seconds,), name="cache-sweeper", daemon=True
+        )
+        self._sweeper.start()
+
+    def stop_sweeper(self, timeout: float | None = 5.0) -> None:
+        self._sweep_stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join(timeout)
+            self._sweeper = None
+
+    def _sweep_forever(self, interval_seconds: float) -> None:
+        while not self._sweep_stop.wait(interval_seconds):
+            self.sweep_expired()
+
+    def _by_shard(self, keys: Iterable[str]) -> dict[_Shard, list[str]]:
+        grouped: dict[_Shard, list[str]] = {}
+        for key in keys:
+            grouped.setdefault(self._shard(key), []).append(key)
+        return grouped
+
+    def _size_of(self, key: str, value: Any) -> int:
+        return estimate_size(key) + estimate_size(value) if self.max_bytes is not None else 0
+
+    def _lookup(self, shard: _Shard, key: str, now: float) -> Any | None:
+        # Caller holds ``shard.lock``.
+        entry = shard.entries.get(key)
+        if not entry:
+            shard.misses += 1
+            return None
+        if entry.expires_at < now:
+            self._remove(shard, key)
+            shard.expired += 1
+            shard.misses += 1
+            return None
+        shard.entries.move_to_end(key)
+        shard.hits += 1
+        return entry.value
+
+    def _store(self, shard: _Shard, key: str, value: Any, expires_at: float, size: int) -> None:
+        # Caller holds ``shard.lock``.
+        self._remove(shard, key)
+        if self._shard_max_bytes is not None and size > self._shard_max_bytes:
+            shard.evictions += 1  # never fits; refuse rather than flush the shard
+            return
+        shard.entries[key] = CacheEntry(expires_at=expires_at, value=value, size=size)
+        shard.size_bytes += size
+        while (
+            self._shard_max_entries is not None and len(shard.entries) > self._shard_max_entries
+        ) or (self._shard_max_bytes is not None and shard.size_bytes > self._shard_max_bytes):
+            _, oldest = shard.entries.popitem(last=False)
+            shard.size_bytes -= oldest.size
+            shard.evictions += 1
+
+    def _remove(self, shard: _Shard, key: str) -> None:
+        # Caller holds ``shard.lock``.
+        entry = shard.entries.pop(key, None)
+        if entry is not None:
+            shard.size_bytes -= entry.size
+
+
+class AsyncCacheAdapter:
+    """Expose a non-blocking (in-memory) ``CacheBackend`` through the async protocol.
+
+    Wraps the same instance the sync path uses, so both paths see one cache.
+    """
+
+    def __init__(self, cache: CacheBackend) -> None:
+        self.cache = cache
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        return self.cache.metrics
+
+    async def get(self, key: str) -> Any | None:
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        self.cache.set(key, value, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
+    async def exists(self, key: str) -> bool:
+        return self.cache.exists(key)
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        return self.cache.get_many(keys)
+
+    async def set_many(self, items: Mapping[str, Any], ttl_seconds: int) -> None:
+        self.cache.set_many(items, ttl_seconds)
+
+    async def delete_many(self, keys: Iterable[str], namespaces: Iterable[str] = ()) -> None:
+        self.cache.delete_many(keys, namespaces)
+
+    async def get_generation(self, namespace: str) -> int:
+        return self.cache.get_generation(namespace)
+
+    async def bump_generation(self, namespace: str) -> int:
+        return self.cache.bump_generation(namespace)
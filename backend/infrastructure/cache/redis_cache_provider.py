@@ -2,16 +2,31 @@ from __future__ import annotations
 
 import logging
 import time
+import uuid
+from collections.abc import Iterable, Mapping
 from dataclasses import asdict, is_dataclass
 from typing import Any
 
 import msgpack
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.asyncio.client import Pipeline as AsyncPipeline
+from redis.client import Pipeline
 
 from infrastructure.cache.cache_provider import CacheMetrics
 
 logger = logging.getLogger(__name__)
 
+_LOCK_PREFIX = "lock:"
+_GENERATION_PREFIX = "gen:"
+# Delete the lock only if we still own it (it may have expired and been re-taken).
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 def _encode_unknown(value: Any) -> Any:
     """Convert unsupported objects into msgpack-friendly structures."""
@@ -35,6 +50,44 @@ def _deserialize(raw: bytes, metrics: CacheMetrics) -> Any:
     return value
 
 
+def _generation_seed() -> int:
+    # Start counters at the wall clock (ms) so a counter lost to eviction or a flush
+    # never restarts at a generation that old entries were written under.
+    return time.time_ns() // 1_000_000
+
+
+def _decode_many(
+    keys: list[str], raws: list[bytes | None], metrics: CacheMetrics
+) -> dict[str, Any]:
+    found: dict[str, Any] = {}
+    for key, raw in zip(keys, raws, strict=True):
+        if raw is None:
+            metrics.cache_miss_count += 1
+            continue
+        try:
+            found[key] = _deserialize(raw, metrics)
+            metrics.cache_hit_count += 1
+        except Exception as exc:  # pragma: no cover - corrupted cache entries
+            logger.error("redis.deserialize failed for key=%s error=%s", key, exc)
+            metrics.cache_miss_count += 1
+    return found
+
+
+def _queue_invalidation(
+    pipe: Pipeline | AsyncPipeline, keys: Iterable[str], namespaces: Iterable[str]
+) -> bool:
+    """Queue UNLINK for ``keys`` plus generation bumps; return False if nothing to do."""
+    keys = list(keys)
+    namespaces = list(namespaces)
+    if keys:
+        # UNLINK frees values on a background thread instead of blocking Redis.
+        pipe.unlink(*keys)
+    for namespace in namespaces:
+        pipe.set(_GENERATION_PREFIX + namespace, _generation_seed(), nx=True)
+        pipe.incr(_GENERATION_PREFIX + namespace)
+    return bool(keys or namespaces)
+
+
 class RedisCacheProvider:
     """Redis-backed cache provider using fast msgpack serialization."""
 
@@ -79,3 +132,209 @@ class RedisCacheProvider:
         except Exception as exc:  # pragma: no cover - defensive guardrail
             logger.error("redis.exists failed for key=%s error=%s", key, exc)
             return False
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            raws = self.client.mget(keys)
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.mget failed for %s keys error=%s", len(keys), exc)
+            return {}
+        return _decode_many(keys, raws, self.metrics)
+
+    def set_many(self, items: Mapping[str, Any], ttl_seconds: int) -> None:
+        if not items:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(name=key, value=_serialize(value, self.metrics), ex=ttl_seconds)
+            pipe.execute()
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.set_many failed for %s keys error=%s", len(items), exc)
+
+    def delete_many(self, keys: Iterable[str], namespaces: Iterable[str] = ()) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        if not _queue_invalidation(pipe, keys, namespaces):
+            return
+        try:
+            pipe.execute()
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.delete_many failed error=%s", exc)
+
+    def get_generation(self, namespace: str) -> int:
+        key = _GENERATION_PREFIX + namespace
+        try:
+            raw = self.client.get(key)
+            if raw is None:
+                self.client.set(key, _generation_seed(), nx=True)
+                raw = self.client.get(key)
+            return int(raw)
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.get_generation failed for namespace=%s error=%s", namespace, exc)
+            return 0
+
+    def bump_generation(self, namespace: str) -> int:
+        key = _GENERATION_PREFIX + namespace
+        try:
+            pipe = self.client.pipeline()
+            pipe.set(key, _generation_seed(), nx=True)
+            pipe.incr(key)
+            _, generation = pipe.execute()
+            return int(generation)
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.bump_generation failed for namespace=%s error=%s", namespace, exc)
+            return 0
+
+
+class AsyncRedisCacheProvider:
+    """``redis.asyncio`` twin of ``RedisCacheProvider`` sharing the msgpack codec."""
+
+    def __init__(self, client: AsyncRedis):
+        self.client = client
+        self.metrics = CacheMetrics()
+
+    async def get(self, key: str) -> Any | None:
+        try:
+            raw = await self.client.get(key)
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.get failed for key=%s error=%s", key, exc)
+            return None
+        if raw is None:
+            self.metrics.cache_miss_count += 1
+            return None
+        try:
+            value = _deserialize(raw, self.metrics)
+            self.metrics.cache_hit_count += 1
+            return value
+        except Exception as exc:  # pragma: no cover - corrupted cache entries
+            logger.error("redis.deserialize failed for key=%s error=%s", key, exc)
+            self.metrics.cache_miss_count += 1
+            return None
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        try:
+            packed = _serialize(value, self.metrics)
+            await self.client.set(name=key, value=packed, ex=ttl_seconds)
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.set failed for key=%s error=%s", key, exc)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.client.delete(key)
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.delete failed for key=%s error=%s", key, exc)
+
+    async def exists(self, key: str) -> bool:
+        try:
+            return bool(await self.client.exists(key))
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.exists failed for key=%s error=%s", key, exc)
+            return False
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            raws = await self.client.mget(keys)
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.mget failed for %s keys error=%s", len(keys), exc)
+            return {}
+        return _decode_many(keys, raws, self.metrics)
+
+    async def set_many(self, items: Mapping[str, Any], ttl_seconds: int) -> None:
+        if not items:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(name=key, value=_serialize(value, self.metrics), ex=ttl_seconds)
+            await pipe.execute()
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.set_many failed for %s keys error=%s", len(items), exc)
+
+    async def delete_many(self, keys: Iterable[str], namespaces: Iterable[str] = ()) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        if not _queue_invalidation(pipe, keys, namespaces):
+            return
+        try:
+            await pipe.execute()
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.delete_many failed error=%s", exc)
+
+    async def get_generation(self, namespace: str) -> int:
+        key = _GENERATION_PREFIX + namespace
+        try:
+            raw = await self.client.get(key)
+            if raw is None:
+                await self.client.set(key, _generation_seed(), nx=True)
+                raw = await self.client.get(key)
+            return int(raw)
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.get_generation failed for namespace=%s error=%s", namespace, exc)
+            return 0
+
+    async def bump_generation(self, namespace: str) -> int:
+        key = _GENERATION_PREFIX + namespace
+        try:
+            pipe = self.client.pipeline()
+            pipe.set(key, _generation_seed(), nx=True)
+            pipe.incr(key)
+            _, generation = await pipe.execute()
+            return int(generation)
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.bump_generation failed for namespace=%s error=%s", namespace, exc)
+            return 0
+
+
+class RedisLoadLock:
+    """``SET lock:<key> <token> NX PX`` mutex shared by every worker on this Redis."""
+
+    def __init__(self, client: Redis):
+        self.client = client
+        self._release = client.register_script(_RELEASE_SCRIPT)
+
+    def acquire(self, key: str, ttl_seconds: float) -> str | None:
+        token = uuid.uuid4().hex
+        try:
+            acquired = self.client.set(
+                _LOCK_PREFIX + key, token, nx=True, px=int(ttl_seconds * 1000)
+            )
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.lock failed for key=%s error=%s", key, exc)
+            return token  # Redis down: behave as if we own the lock and just load
+        return token if acquired else None
+
+    def release(self, key: str, token: str) -> None:
+        try:
+            self._release(keys=[_LOCK_PREFIX + key], args=[token])
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.unlock failed for key=%s error=%s", key, exc)
+
+
+class AsyncRedisLoadLock:
+    """``redis.asyncio`` twin of ``RedisLoadLock``."""
+
+    def __init__(self, client: AsyncRedis):
+        self.client = client
+        self._release = client.register_script(_RELEASE_SCRIPT)
+
+    async def acquire(self, key: str, ttl_seconds: float) -> str | None:
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.client.set(
+                _LOCK_PREFIX + key, token, nx=True, px=int(ttl_seconds * 1000)
+            )
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.lock failed for key=%s error=%s", key, exc)
+            return token
+        return token if acquired else None
+
+    async def release(self, key: str, token: str) -> None:
+        try:
+            await self._release(keys=[_LOCK_PREFIX + key], args=[token])
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.unlock failed for key=%s error=%s", key, exc)
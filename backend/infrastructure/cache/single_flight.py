@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from threading import Event, Lock
+from typing import Any
+
+# Result handed to followers when the leader did not finish its load (cancelled,
+# interrupted): they retry, and one of them leads the next attempt.
+_ABANDONED = object()
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: Any = _ABANDONED
+        self.error: Exception | None = None
+
+
+class SingleFlight:
+    """Collapse concurrent loads of one key: the first caller runs, the rest wait.
+
+    Followers receive the leader's result (or the exception its load raised), so a
+    cache miss under load costs one handler call instead of one per waiting thread.
+    If the leader is interrupted instead, followers retry rather than inherit it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def is_running(self, key: str) -> bool:
+        return key in self._calls
+
+    def do(self, key: str, load: Callable[[], Any]) -> Any:
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if call is None:
+                    call = self._calls[key] = _Call()
+            if leader:
+                return self._lead(key, call, load)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            if call.result is not _ABANDONED:
+                return call.result
+
+    def _lead(self, key: str, call: _Call, load: Callable[[], Any]) -> Any:
+        try:
+            call.result = load()
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Event-loop counterpart of ``SingleFlight``; followers await the leader's future.
+
+    A leader cancelled mid-load (e.g. its client disconnected) does not cancel its
+    followers: they wake up, and the first one to run starts the load again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future[Any]] = {}
+
+    def is_running(self, key: str) -> bool:
+        return key in self._calls
+
+    async def do(self, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        while (pending := self._calls.get(key)) is not None:
+            # Shield so a cancelled follower does not cancel the shared load.
+            result = await asyncio.shield(pending)
+            if result is not _ABANDONED:
+                return result
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await load()
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when nobody was waiting
+            raise
+        except BaseException:
+            future.set_result(_ABANDONED)
+            raise
+        finally:
+            self._calls.pop(key, None)
+        future.set_result(result)
+        return result
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Protocol
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.client import PubSub, PubSubWorkerThread
+
+from infrastructure.cache.cache_provider import (
+    AsyncCacheBackend,
+    CacheBackend,
+    CacheMetrics,
+    CacheProvider,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INVALIDATION_CHANNEL = "cache:invalidate"
+# Upper bound on how long an L1 copy may outlive a missed invalidation message.
+DEFAULT_L1_TTL_SECONDS = 1.0
+
+# L1 key under which a namespace's generation is cached (evicted on every bump).
+_GENERATION_KEY = "gen:{}"
+
+
+class InvalidationBroker(Protocol):
+    """Fans cache deletes out to every worker's L1 (Redis pub/sub or in-process)."""
+
+    def publish(self, keys: Sequence[str]) -> None: ...
+
+    async def publish_async(self, keys: Sequence[str]) -> None: ...
+
+    def subscribe(self, local: CacheBackend) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def _encode_keys(keys: Sequence[str]) -> str:
+    # One message per batch; cache keys never contain newlines.
+    return "\n".join(keys)
+
+
+class InMemoryInvalidationBroker:
+    """Process-local broker for a single worker and for tests (no network involved)."""
+
+    def __init__(self) -> None:
+        self._subscribers: list[CacheBackend] = []
+
+    def publish(self, keys: Sequence[str]) -> None:
+        for local in self._subscribers:
+            local.delete_many(keys)
+
+    async def publish_async(self, keys: Sequence[str]) -> None:
+        self.publish(keys)
+
+    def subscribe(self, local: CacheBackend) -> None:
+        self._subscribers.append(local)
+
+    def close(self) -> None:
+        self._subscribers.clear()
+
+
+class RedisInvalidationBroker:
+    """Broadcast deleted keys on a Redis channel; a listener thread evicts the local L1.
+
+    Each message carries a whole batch of keys, so ``delete_many`` publishes once.
+
+    Every worker (including the publisher) receives each message. Re-evicting a key
+    the publisher already dropped is harmless, so no origin filtering is needed.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        async_client: AsyncRedis | None = None,
+        channel: str = DEFAULT_INVALIDATION_CHANNEL,
+    ) -> None:
+        self.client = client
+        self.async_client = async_client
+        self.channel = channel
+        self._pubsub: PubSub | None = None
+        self._thread: PubSubWorkerThread | None = None
+
+    def publish(self, keys: Sequence[str]) -> None:
+        try:
+            self.client.publish(self.channel, _encode_keys(keys))
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.publish failed channel=%s error=%s", self.channel, exc)
+
+    async def publish_async(self, keys: Sequence[str]) -> None:
+        if self.async_client is None:
+            self.publish(keys)
+            return
+        try:
+            await self.async_client.publish(self.channel, _encode_keys(keys))
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            logger.error("redis.publish failed channel=%s error=%s", self.channel, exc)
+
+    def subscribe(self, local: CacheBackend) -> None:
+        def _on_message(message: dict[str, Any]) -> None:
+            local.delete_many(message["data"].decode().split("\n"))
+
+        def _on_error(exc: BaseException, pubsub: PubSub, thread: PubSubWorkerThread) -> None:
+            # Keep listening; missed messages are bounded by the L1 TTL.
+            logger.error("cache invalidation listener error=%s", exc)
+
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.channel: _on_message})
+        self._thread = self._pubsub.run_in_thread(
+            sleep_time=1.0, daemon=True, exception_handler=_on_error
+        )
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+
+class TieredCacheProvider:
+    """Bounded in-process L1 of decoded values in front of a shared L2 (Redis).
+
+    Hits on hot keys become a dict lookup instead of a round-trip plus msgpack
+    decode. L1 entries live at most ``l1_ttl_seconds``; deletes go to L2 first and
+    are then broadcast so every worker drops its L1 copy.
+    """
+
+    def __init__(
+        self,
+        l1: CacheProvider,
+        l2: CacheBackend,
+        broker: InvalidationBroker,
+        l1_ttl_seconds: float = DEFAULT_L1_TTL_SECONDS,
+    ) -> None:
+        self.l1 = l1
+        self.l2 = l2
+        self.broker = broker
+        self.l1_ttl_seconds = l1_ttl_seconds
+        # Same object as ``l2.metrics``; L1 hits are counted on it directly.
+        self._metrics = l2.metrics
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        # Read through l2 so an in-memory L2 refreshes its shard totals first.
+        return self.l2.metrics
+
+    def get(self, key: str) -> Any | None:
+        value = self.l1.get(key)
+        if value is not None:
+            self._metrics.cache_hit_count += 1
+            self._metrics.l1_hit_count += 1
+            return value
+        value = self.l2.get(key)
+        if value is not None:
+            self.l1.set(key, value, self.l1_ttl_seconds)
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        self.l2.set(key, value, ttl_seconds)
+        self.l1.set(key, value, min(ttl_seconds, self.l1_ttl_seconds))
+
+    def delete(self, key: str) -> None:
+        self.l2.delete(key)
+        self.l1.delete(key)
+        self.broker.publish([key])
+
+    def exists(self, key: str) -> bool:
+        return self.l1.exists(key) or self.l2.exists(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(keys)
+        found = self.l1.get_many(keys)
+        self._metrics.cache_hit_count += len(found)
+        self._metrics.l1_hit_count += len(found)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            fetched = self.l2.get_many(missing)
+            self.l1.set_many(fetched, self.l1_ttl_seconds)
+            found.update(fetched)
+        return found
+
+    def set_many(self, items: Mapping[str, Any], ttl_seconds: int) -> None:
+        self.l2.set_many(items, ttl_seconds)
+        self.l1.set_many(items, min(ttl_seconds, self.l1_ttl_seconds))
+
+    def delete_many(self, keys: Iterable[str], namespaces: Iterable[str] = ()) -> None:
+        keys, namespaces = list(keys), list(namespaces)
+        self.l2.delete_many(keys, namespaces)
+        evicted = keys + [_GENERATION_KEY.format(namespace) for namespace in namespaces]
+        if evicted:
+            self.l1.delete_many(evicted)
+            self.broker.publish(evicted)
+
+    def get_generation(self, namespace: str) -> int:
+        # Read on every cacheable query, so it is the hottest L1 entry of all.
+        key = _GENERATION_KEY.format(namespace)
+        generation = self.l1.get(key)
+        if generation is None:
+            generation = self.l2.get_generation(namespace)
+            self.l1.set(key, generation, self.l1_ttl_seconds)
+        return generation
+
+    def bump_generation(self, namespace: str) -> int:
+        generation = self.l2.bump_generation(namespace)
+        key = _GENERATION_KEY.format(namespace)
+        self.l1.delete(key)
+        self.broker.publish([key])
+        return generation
+
+
+class AsyncTieredCacheProvider:
+    """Async twin of ``TieredCacheProvider``; shares the same L1 and broker."""
+
+    def __init__(
+        self,
+        l1: CacheProvider,
+        l2: AsyncCacheBackend,
+        broker: InvalidationBroker,
+        l1_ttl_seconds: float = DEFAULT_L1_TTL_SECONDS,
+    ) -> None:
+        self.l1 = l1
+        self.l2 = l2
+        self.broker = broker
+        self.l1_ttl_seconds = l1_ttl_seconds
+        # Same object as ``l2.metrics``; L1 hits are counted on it directly.
+        self._metrics = l2.metrics
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        return self.l2.metrics
+
+    async def get(self, key: str) -> Any | None:
+        value = self.l1.get(key)
+        if value is not None:
+            self._metrics.cache_hit_count += 1
+            self._metrics.l1_hit_count += 1
+            return value
+        value = await self.l2.get(key)
+        if value is not None:
+            self.l1.set(key, value, self.l1_ttl_seconds)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        await self.l2.set(key, value, ttl_seconds)
+        self.l1.set(key, value, min(ttl_seconds, self.l1_ttl_seconds))
+
+    async def delete(self, key: str) -> None:
+        await self.l2.delete(key)
+        self.l1.delete(key)
+        await self.broker.publish_async([key])
+
+    async def exists(self, key: str) -> bool:
+        return self.l1.exists(key) or await self.l2.exists(key)
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(keys)
+        found = self.l1.get_many(keys)
+        self._metrics.cache_hit_count += len(found)
+        self._metrics.l1_hit_count += len(found)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            fetched = await self.l2.get_many(missing)
+            self.l1.set_many(fetched, self.l1_ttl_seconds)
+            found.update(fetched)
+        return found
+
+    async def set_many(self, items: Mapping[str, Any], ttl_seconds: int) -> None:
+        await self.l2.set_many(items, ttl_seconds)
+        self.l1.set_many(items, min(ttl_seconds, self.l1_ttl_seconds))
+
+    async def delete_many(self, keys: Iterable[str], namespaces: Iterable[str] = ()) -> None:
+        keys, namespaces = list(keys), list(namespaces)
+        await self.l2.delete_many(keys, namespaces)
+        evicted = keys + [_GENERATION_KEY.format(namespace) for namespace in namespaces]
+        if evicted:
+            self.l1.delete_many(evicted)
+            await self.broker.publish_async(evicted)
+
+    async def get_generation(self, namespace: str) -> int:
+        key = _GENERATION_KEY.format(namespace)
+        generation = self.l1.get(key)
+        if generation is None:
+            generation = await self.l2.get_generation(namespace)
+            self.l1.set(key, generation, self.l1_ttl_seconds)
+        return generation
+
+    async def bump_generation(self, namespace: str) -> int:
+        generation = await self.l2.bump_generation(namespace)
+        key = _GENERATION_KEY.format(namespace)
+        self.l1.delete(key)
+        await self.broker.publish_async([key])
+        return generation
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import fields
+from typing import Any, get_type_hints
+from uuid import UUID, SafeUUID
+
+import msgpack
+from domain.events.base import DomainEvent
+from domain.events.employees import EmployeeCreated, EmployeeDeleted, EmployeeUpdated
+
+EVENT_CLASS_REGISTRY: Mapping[str, type[DomainEvent]] = {
+    EmployeeCreated.__name__: EmployeeCreated,
+    EmployeeUpdated.__name__: EmployeeUpdated,
+    EmployeeDeleted.__name__: EmployeeDeleted,
+}
+
+# Turns a version ``v`` value list (without the version itself) into a ``v + 1`` one.
+Upcaster = Callable[[list[Any]], list[Any]]
+
+# ``msgpack.packb`` builds a Packer per call, about half the cost of a small event;
+# a Packer is not thread-safe, so each thread keeps its own.
+_packers = threading.local()
+
+
+def _pack(values: tuple[Any, ...]) -> bytes:
+    try:
+        pack = _packers.pack
+    except AttributeError:
+        pack = _packers.pack = msgpack.Packer(datetime=True).pack
+    return pack(values)
+
+
+def _uuid_from_bytes(
+    raw: bytes,
+    new: Callable[..., Any] = object.__new__,
+    set_: Callable[..., None] = object.__setattr__,
+    from_bytes: Callable[[bytes], int] = int.from_bytes,
+    unknown: SafeUUID = SafeUUID.unknown,
+) -> UUID:
+    # ``UUID(bytes=...)`` re-validates what ``UUID.bytes`` produced; set the slots
+    # directly (helpers bound as defaults: this runs once per decoded event).
+    uuid = new(UUID)
+    set_(uuid, "int", from_bytes(raw))
+    set_(uuid, "is_safe", unknown)
+    return uuid
+
+
+def _field_expressions(event_class: type[DomainEvent]) -> list[tuple[str, str, str]]:
+    """(name, encode expression on ``e``, decode expression on ``v[i]``) per field."""
+    hints = get_type_hints(event_class)
+    expressions = []
+    for index, field in enumerate(fields(event_class), start=1):
+        value = f"v[{index}]"
+        if hints.get(field.name) is UUID:
+            # 16 raw bytes instead of a 36-character string, and no hex parsing back.
+            expressions.append((field.name, f"e.{field.name}.bytes", f"uuid({value})"))
+        else:
+            # Aware datetimes pack as msgpack timestamps; everything else is native.
+            expressions.append((field.name, f"e.{field.name}", value))
+    return expressions
+
+
+class EventCodec:
+    """Binary payload codec for one event class, generated once from its fields.
+
+    A payload is the msgpack array ``[version, *values]`` in dataclass field order:
+    no field names, UUIDs as raw bytes, datetimes as msgpack timestamps. ``encode``
+    and ``decode`` are compiled per class, so no per-event reflection, ``asdict``
+    copy or string parsing is left. Decoding fills the instance dict directly instead
+    of going through the frozen ``__init__``, as payloads only ever come from valid
+    events. Payloads of an older ``version`` are run through ``upcasters`` first.
+    """
+
+    def __init__(
+        self,
+        event_class: type[DomainEvent],
+        version: int | None = None,
+        upcasters: Mapping[int, Upcaster] | None = None,
+    ):
+        self.event_class = event_class
+        self.version = event_class.schema_version if version is None else version
+        self.upcasters = dict(upcasters or {})
+        expressions = _field_expressions(event_class)
+        encoded = ", ".join(expression for _, expression, _ in expressions)
+        decoded = ", ".join(f"{name!r}: {expression}" for name, _, expression in expressions)
+        source = (
+            "def encode(e):\n"
+            f"    return pack(({self.version}, {encoded}))\n"
+            "def decode(payload):\n"
+            "    v = unpackb(payload, timestamp=3)\n"
+            f"    if v[0] != {self.version}:\n"
+            "        v = upcast(v)\n"
+            "    event = new(cls)\n"
+            f"    set_(event, '__dict__', {{{decoded}}})\n"
+            "    return event\n"
+        )
+        namespace: dict[str, Any] = {
+            "pack": _pack,
+            "unpackb": msgpack.unpackb,
+            "uuid": _uuid_from_bytes,
+            "new": object.__new__,
+            "set_": object.__setattr__,
+            "cls": event_class,
+            "upcast": self._upcast,
+        }
+        exec(compile(source, f"<codec {event_class.__name__}>", "exec"), namespace)  # noqa: S102
+        self.encode: Callable[[DomainEvent], bytes] = namespace["encode"]
+        self.decode: Callable[[bytes], DomainEvent] = namespace["decode"]
+
+    def _upcast(self, values: list[Any]) -> list[Any]:
+        version, rest = values[0], values[1:]
+        while version < self.version:
+            upcaster = self.upcasters.get(version)
+            if upcaster is None:
+                break
+            rest, version = upcaster(rest), version + 1
+        if version != self.version:
+            raise ValueError(
+                f"No upcaster from {self.event_class.__name__} payload version {version}"
+                f" to {self.version}"
+            )
+        return [version, *rest]
+
+
+_CODECS: dict[type[DomainEvent], EventCodec] = {}
+
+
+def register_codec(codec: EventCodec) -> None:
+    """Replace the generated codec of ``codec.event_class`` (e.g. to add upcasters)."""
+    _CODECS[codec.event_class] = codec
+
+
+def codec_for(event_class: type[DomainEvent]) -> EventCodec:
+    codec = _CODECS.get(event_class)
+    if codec is None:
+        codec = _CODECS[event_class] = EventCodec(event_class)
+    return codec
+
+
+def encode_event(event: DomainEvent) -> bytes:
+    return codec_for(type(event)).encode(event)
+
+
+def decode_event(event_type: str, payload: bytes | str) -> DomainEvent | None:
+    """Rebuild an outbox event; None for unknown types, raises on a corrupt payload.
+
+    ``str`` payloads are JSON rows written before the binary codecs and go through
+    ``DomainEvent.deserialize`` as they always did.
+    """
+    event_class = EVENT_CLASS_REGISTRY.get(event_type)
+    if event_class is None:
+        return None
+    if isinstance(payload, str):
+        return event_class.deserialize(json.loads(payload))
+    return codec_for(event_class).decode(payload)
@@ -1,20 +1,16 @@
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import Callable, Mapping
 
 from domain.events.base import DomainEvent
-from domain.events.employees import EmployeeCreated, EmployeeDeleted, EmployeeUpdated
 
+from infrastructure.outbox.event_codec import EVENT_CLASS_REGISTRY, decode_event
 from infrastructure.outbox.outbox_repository import OutboxRecord, OutboxRepository
 
 EventHandler = Callable[[DomainEvent], None]
-EVENT_CLASS_REGISTRY: Mapping[str, type[DomainEvent]] = {
-    EmployeeCreated.__name__: EmployeeCreated,
-    EmployeeUpdated.__name__: EmployeeUpdated,
-    EmployeeDeleted.__name__: EmployeeDeleted,
-}
+BatchEventHandler = Callable[[list[DomainEvent]], None]
+ProjectedCallback = Callable[[list[DomainEvent]], None]
 
 
 class OutboxProcessor:
@@ -25,22 +21,83 @@ class OutboxProcessor:
         repository: OutboxRepository,
         handlers: Mapping[str, EventHandler],
         logger: logging.Logger | None = None,
+        on_projected: ProjectedCallback | None = None,
+        batch_commit: bool = True,
+        batch_handler: BatchEventHandler | None = None,
     ):
         self.repository = repository
         self.handlers = handlers
         self.logger = logger or logging.getLogger("outbox.processor")
+        # Called with the events whose projections were committed (e.g. cache invalidation).
+        self.on_projected = on_projected
+        self.batch_commit = batch_commit
+        # Set-based projector for whole batches; ``handlers`` still route per-record replays.
+        self.batch_handler = batch_handler
 
-    def process_pending_events(self, limit: int = 50) -> None:
+    def process_pending_events(self, limit: int = 50) -> int:
+        """Project up to ``limit`` pending events; return how many were marked processed.
+
+        In ``batch_commit`` mode the whole batch is projected and marked processed in
+        one transaction (one commit/fsync). If any event fails, the batch is rolled
+        back and replayed record by record so one bad event cannot block the rest.
+        Failed records stay pending, so a count below ``limit`` means "stop for now":
+        draining again right away would only replay the same failures.
+        """
         pending = self.repository.get_unprocessed_events(limit)
         if not pending:
-            return
+            return 0
 
         self.logger.info("outbox_batch size=%s", len(pending))
+        projected = self._process_batch(pending) if self.batch_commit else None
+        marked = len(pending)
+        if projected is None:
+            projected, marked = self._process_individually(pending)
+
+        if projected and self.on_projected is not None:
+            self.on_projected(projected)
+        return marked
+
+    def _process_batch(self, pending: list[OutboxRecord]) -> list[DomainEvent] | None:
+        projected: list[DomainEvent] = []
+        try:
+            for record in pending:
+                event = self._deserialize_event(record)
+                if not event:
+                    continue
+                handler = self.handlers.get(record.event_type)
+                if not handler:
+                    self.logger.warning(
+                        "No projector registered for event_type=%s", record.event_type
+                    )
+                    continue
+                if self.batch_handler is None:
+                    handler(event)
+                    # Later events may read rows this one wrote (autoflush is off).
+                    self.repository.flush()
+                projected.append(event)
+            if self.batch_handler is not None and projected:
+                self.batch_handler(projected)
+            self.repository.mark_many_as_processed([record.id for record in pending])
+            self.repository.commit()
+        except Exception as exc:
+            self.repository.rollback()
+            self.logger.warning(
+                "outbox_batch_failed size=%s error=%s; retrying per record", len(pending), exc
+            )
+            return None
+        self.logger.info("outbox_batch_committed size=%s", len(pending))
+        return projected
+
+    def _process_individually(self, pending: list[OutboxRecord]) -> tuple[list[DomainEvent], int]:
+        """Project record by record; return the projected events and how many were marked."""
+        projected: list[DomainEvent] = []
+        marked = 0
         for record in pending:
             event = self._deserialize_event(record)
             if not event:
                 self.repository.mark_as_processed(record)
                 self.repository.commit()
+                marked += 1
                 continue
 
             handler = self.handlers.get(record.event_type)
@@ -48,12 +105,15 @@ class OutboxProcessor:
                 self.logger.warning("No projector registered for event_type=%s", record.event_type)
                 self.repository.mark_as_processed(record)
                 self.repository.commit()
+                marked += 1
                 continue
 
             try:
                 handler(event)
                 self.repository.mark_as_processed(record)
                 self.repository.commit()
+                marked += 1
+                projected.append(event)
                 self.logger.info(
                     "outbox_processed event_type=%s event_id=%s", record.event_type, record.id
                 )
@@ -65,26 +125,20 @@ class OutboxProcessor:
                     record.event_type,
                     exc,
                 )
+        return projected, marked
 
     def _deserialize_event(self, record: OutboxRecord) -> DomainEvent | None:
-        event_class = EVENT_CLASS_REGISTRY.get(record.event_type)
-        if not event_class:
-            self.logger.error("Unknown event_type=%s payload=%s", record.event_type, record.payload)
-            return None
-
-        try:
-            payload = json.loads(record.payload)
-        except json.JSONDecodeError as exc:
-            self.logger.error("Failed to decode payload for event_id=%s error=%s", record.id, exc)
+        if record.event_type not in EVENT_CLASS_REGISTRY:
+            self.logger.error("Unknown event_type=%s payload=%r", record.event_type, record.payload)
             return None
 
         try:
-            return event_class.deserialize(payload)
-        except Exception as exc:  # pragma: no cover - defensive guardrail
+            return decode_event(record.event_type, record.payload)
+        except Exception as exc:
             self.logger.error(
-                "Failed to deserialize event type=%s error=%s payload=%s",
+                "Failed to decode payload for event_id=%s type=%s error=%s",
+                record.id,
                 record.event_type,
                 exc,
-                payload,
             )
             return None
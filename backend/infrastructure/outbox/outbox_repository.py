@@ -1,23 +1,149 @@
 from __future__ import annotations
 
-import json
-from datetime import UTC, datetime
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from threading import Lock
+from typing import Any
 
 from app.database import Base
 from domain.events.base import DomainEvent
-from sqlalchemy import Column, DateTime, String, Text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    LargeBinary,
+    String,
+    TypeDecorator,
+    insert,
+    text,
+    update,
+)
+from sqlalchemy.engine import Connection, Dialect, Engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from infrastructure.outbox.event_codec import encode_event
+
+
+class EventPayload(TypeDecorator[bytes | str]):
+    """``LargeBinary`` column that also round-trips the JSON text of older rows.
+
+    New rows hold ``encode_event`` bytes; rows written before the binary codecs are
+    ``str`` and stay that way (SQLite keeps each value's own type), which is how
+    ``decode_event`` tells the two formats apart.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def bind_processor(self, dialect: Dialect) -> None:
+        return None
+
+    def result_processor(self, dialect: Dialect, coltype: Any) -> None:
+        return None
+
+
+_TICK = timedelta(microseconds=1)
+_clock_lock = Lock()
+_last_created_at = datetime.min.replace(tzinfo=UTC)
+
+
+def _created_at(count: int = 1) -> datetime:
+    """Reserve ``count`` strictly increasing ``created_at`` values, one tick apart.
+
+    Rows of one process then replay in the order they were inserted, even several per
+    clock tick (bulk commands); ids are random and only break cross-process ties.
+    """
+    global _last_created_at
+    with _clock_lock:
+        first = max(datetime.now(UTC), _last_created_at + _TICK)
+        _last_created_at = first + (count - 1) * _TICK
+    return first
+
 
 class OutboxRecord(Base):
     __tablename__ = "outbox_events"
 
     id = Column(String(36), primary_key=True)
     event_type = Column(String(150), nullable=False)
-    payload = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
+    payload = Column(EventPayload, nullable=False)
+    created_at = Column(DateTime, default=_created_at, nullable=False)
     processed_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        # Partial index: only pending rows are indexed, so the relay's
+        # "processed_at IS NULL ORDER BY created_at, id LIMIT n" scan stays flat as history
+        # grows and needs no sort step.
+        Index(
+            "ix_outbox_events_pending_order",
+            "created_at",
+            "id",
+            sqlite_where=processed_at.is_(None),
+            postgresql_where=processed_at.is_(None),
+        ),
+        # Lets the retention job find old processed rows without a full scan; partial so
+        # the planner never picks it for the pending scan above.
+        Index(
+            "ix_outbox_events_processed_at",
+            "processed_at",
+            sqlite_where=processed_at.is_not(None),
+            postgresql_where=processed_at.is_not(None),
+        ),
+    )
+
+
+class OutboxArchiveRecord(Base):
+    """Processed events moved out of the hot table by the retention job."""
+
+    __tablename__ = "outbox_events_archive"
+
+    id = Column(String(36), primary_key=True)
+    event_type = Column(String(150), nullable=False)
+    payload = Column(EventPayload, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    processed_at = Column(DateTime, nullable=False)
+
+
+# Superseded by ``ix_outbox_events_pending_order`` (no ``id`` tiebreak).
+_LEGACY_INDEXES = ("ix_outbox_events_pending",)
+
+
+def ensure_outbox_indexes(bind: Engine | Connection) -> None:
+    """Create outbox indexes on databases whose table predates them (create_all skips it)."""
+    for index in OutboxRecord.__table__.indexes:
+        index.create(bind=bind, checkfirst=True)
+    if isinstance(bind, Engine):
+        with bind.begin() as connection:
+            _drop_legacy_indexes(connection)
+    else:
+        _drop_legacy_indexes(bind)
+
+
+def _drop_legacy_indexes(connection: Connection) -> None:
+    for name in _LEGACY_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+def build_outbox_record(event: DomainEvent) -> OutboxRecord:
+    return OutboxRecord(
+        id=str(event.event_id),
+        event_type=event.event_type,
+        payload=encode_event(event),
+    )
+
+
+def _outbox_rows(events: Sequence[DomainEvent]) -> list[dict[str, object]]:
+    created_at = _created_at(len(events))
+    return [
+        {
+            "id": str(event.event_id),
+            "event_type": event.event_type,
+            "payload": encode_event(event),
+            "created_at": created_at + index * _TICK,
+        }
+        for index, event in enumerate(events)
+    ]
+
 
 class OutboxRepository:
     """Persist domain events inside the write transaction for guaranteed delivery."""
@@ -26,18 +152,18 @@ class OutboxRepository:
         self.db: Session = db
 
     def add_event(self, event: DomainEvent) -> None:
-        record = OutboxRecord(
-            id=str(event.event_id),
-            event_type=event.event_type,
-            payload=json.dumps(event.serialize()),
-        )
-        self.db.add(record)
+        self.db.add(build_outbox_record(event))
+
+    def add_events(self, events: Sequence[DomainEvent]) -> None:
+        """Enqueue a whole batch with one executemany ``INSERT`` (no ORM unit of work)."""
+        if events:
+            self.db.execute(insert(OutboxRecord.__table__), _outbox_rows(events))
 
     def get_unprocessed_events(self, limit: int = 50) -> list[OutboxRecord]:
         return (
             self.db.query(OutboxRecord)
             .filter(OutboxRecord.processed_at.is_(None))
-            .order_by(OutboxRecord.created_at)
+            .order_by(OutboxRecord.created_at, OutboxRecord.id)
             .limit(limit)
             .all()
         )
@@ -45,8 +171,36 @@ class OutboxRepository:
     def mark_as_processed(self, record: OutboxRecord) -> None:
         record.processed_at = datetime.now(UTC)
 
+    def mark_many_as_processed(self, record_ids: list[str]) -> None:
+        """Flag a whole batch with a single ``UPDATE ... WHERE id IN (...)``."""
+        if not record_ids:
+            return
+        self.db.execute(
+            update(OutboxRecord)
+            .where(OutboxRecord.id.in_(record_ids))
+            .values(processed_at=datetime.now(UTC))
+            .execution_options(synchronize_session=False)
+        )
+
+    def flush(self) -> None:
+        self.db.flush()
+
     def commit(self) -> None:
         self.db.commit()
 
     def rollback(self) -> None:
         self.db.rollback()
+
+
+class AsyncOutboxRepository:
+    """Enqueue events on an ``AsyncSession``; draining stays on the sync processor."""
+
+    def __init__(self, db: AsyncSession):
+        self.db: AsyncSession = db
+
+    def add_event(self, event: DomainEvent) -> None:
+        self.db.add(build_outbox_record(event))
+
+    async def add_events(self, events: Sequence[DomainEvent]) -> None:
+        if events:
+            await self.db.execute(insert(OutboxRecord.__table__), _outbox_rows(events))
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+
+from app.database import bind_session
+from sqlalchemy.orm import Session
+
+from infrastructure.outbox.outbox_processor import OutboxProcessor
+
+
+class OutboxRelay:
+    """Drain the outbox outside the request path, in batches, until asked to stop.
+
+    The processor is the shared one wired to ``ScopedSession``; every batch opens a
+    fresh session from ``session_factory`` and binds it for the duration of the batch.
+    """
+
+    def __init__(
+        self,
+        processor: OutboxProcessor,
+        session_factory: Callable[[], Session],
+        poll_interval: float = 0.5,
+        batch_size: int = 100,
+        logger: logging.Logger | None = None,
+    ):
+        self.processor = processor
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.logger = logger or logging.getLogger("outbox.relay")
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> int:
+        """Process a single batch; return how many outbox records were marked processed."""
+        with self.session_factory() as db, bind_session(db):
+            return self.processor.process_pending_events(self.batch_size)
+
+    def run_forever(self) -> None:
+        """Poll until ``stop()``; only batches fully marked processed skip the wait.
+
+        A batch with failing records counts below ``batch_size`` (failures stay pending),
+        so the relay backs off instead of re-running the same failures in a hot loop.
+        """
+        self.logger.info(
+            "outbox_relay_started poll_interval=%s batch_size=%s",
+            self.poll_interval,
+            self.batch_size,
+        )
+        while not self._stop.is_set():
+            try:
+                processed = self.run_once()
+            except Exception as exc:  # pragma: no cover - keep the relay alive
+                self.logger.error("outbox_relay_batch_failed error=%s", exc)
+                processed = 0
+            if processed < self.batch_size:
+                self._stop.wait(self.poll_interval)
+        self.logger.info("outbox_relay_stopped")
+
+    def start(self) -> None:
+        """Run the relay on a background thread (in-process mode)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="outbox-relay", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        """Signal shutdown and wait for the in-flight batch to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from infrastructure.outbox.outbox_repository import OutboxArchiveRecord, OutboxRecord
+
+
+class OutboxRetention:
+    """Archive or purge processed outbox events older than ``max_age``.
+
+    Works in small chunks, each in its own short transaction, so the relay and
+    command writers never wait behind one long delete on the SQLite write lock.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_age: timedelta,
+        chunk_size: int = 1000,
+        archive: bool = False,
+        pause_seconds: float = 0.0,
+        interval_seconds: float = 3600.0,
+        logger: logging.Logger | None = None,
+    ):
+        self.session_factory = session_factory
+        self.max_age = max_age
+        self.chunk_size = chunk_size
+        self.archive = archive
+        self.pause_seconds = pause_seconds
+        self.interval_seconds = interval_seconds
+        self.logger = logger or logging.getLogger("outbox.retention")
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> int:
+        """Compact everything older than the cutoff; return how many rows were removed."""
+        cutoff = datetime.now(UTC) - self.max_age
+        removed = 0
+        while not self._stop.is_set():
+            with self.session_factory() as db:
+                chunk = self._compact_chunk(db, cutoff)
+            removed += chunk
+            if chunk < self.chunk_size:
+                break
+            if self.pause_seconds:
+                time.sleep(self.pause_seconds)
+        self.logger.info(
+            "outbox_retention removed=%s archive=%s cutoff=%s", removed, self.archive, cutoff
+        )
+        return removed
+
+    def _compact_chunk(self, db: Session, cutoff: datetime) -> int:
+        ids = list(
+            db.scalars(
+                select(OutboxRecord.id)
+                .where(OutboxRecord.processed_at.is_not(None))
+                .where(OutboxRecord.processed_at < cutoff)
+                .order_by(OutboxRecord.processed_at)
+                .limit(self.chunk_size)
+            )
+        )
+        if not ids:
+            return 0
+        if self.archive:
+            columns = [column.name for column in OutboxRecord.__table__.columns]
+            db.execute(
+                insert(OutboxArchiveRecord)
+                .from_select(columns, select(OutboxRecord).where(OutboxRecord.id.in_(ids)))
+                .prefix_with("OR IGNORE")
+            )
+        db.execute(delete(OutboxRecord).where(OutboxRecord.id.in_(ids)))
+        db.commit()
+        return len(ids)
+
+    def run_forever(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as exc:  # pragma: no cover - keep the job alive
+                self.logger.error("outbox_retention_failed error=%s", exc)
+            self._stop.wait(self.interval_seconds)
+
+    def start(self) -> None:
+        """Run periodically on a background thread (optional in-process mode)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run_forever, name="outbox-retention", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
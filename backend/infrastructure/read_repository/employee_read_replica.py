@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from application.read_models.employees import (
+    EmployeeListDTO,
+    EmployeePageDTO,
+    map_employee_rows,
+)
+from domain.events.base import DomainEvent
+from domain.events.employees import EmployeeCreated, EmployeeDeleted, EmployeeUpdated
+
+from infrastructure.read_repository.employees_read_repository import (
+    PROJECTED_FIELDS,
+    READ_COLUMN_INDEX,
+)
+
+EmployeeRow = tuple[int, str, str, float, str, bool]
+
+
+def _compact(row: Sequence[Any]) -> EmployeeRow:
+    # Interning shares the many repeated last names and addresses between rows.
+    employee_id, name, lastname, salary, address, in_vacation = row
+    return (
+        int(employee_id),
+        sys.intern(str(name)),
+        sys.intern(str(lastname)),
+        float(salary),
+        sys.intern(str(address)),
+        bool(in_vacation),
+    )
+
+
+@dataclass
+class ReplicaDiff:
+    """Differences between the replica and the ``read_employees`` table."""
+
+    missing: list[int] = field(default_factory=list)  # in the table, not in memory
+    unexpected: list[int] = field(default_factory=list)  # in memory, not in the table
+    mismatched: list[int] = field(default_factory=list)  # present in both, values differ
+
+    @property
+    def consistent(self) -> bool:
+        return not (self.missing or self.unexpected or self.mismatched)
+
+
+@dataclass
+class ReplicaFootprint:
+    rows: int
+    index_bytes: int  # id dict plus the sorted id array
+    row_bytes: int  # row tuples, floats and (deduplicated) strings
+
+    @property
+    def total_bytes(self) -> int:
+        return self.index_bytes + self.row_bytes
+
+
+class EmployeeReadReplica:
+    """Whole employee read model held in process memory, indexed for the two queries.
+
+    Rows are compact tuples in a dict keyed by id, next to a sorted ``array('q')``
+    of ids for keyset pages (one bisect plus a slice). It is loaded once from
+    ``read_employees`` and then follows committed projections via ``apply``, which
+    the outbox processor calls from ``on_projected``; so it is only complete in the
+    process that projects every event. ``create_container`` enforces that: it refuses
+    more than one API worker and skips the replica when another process projects.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[int, EmployeeRow] = {}
+        self._ids = array("q")
+        self._lock = threading.Lock()
+        self._version = 0
+        # Distinguishes ETags across loads and processes that reached the same version.
+        self._epoch = os.urandom(8).hex()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def load(self, rows: Iterable[Sequence[Any]]) -> int:
+        """Replace the contents with ``rows`` (``_READ_COLUMNS`` order); return the count."""
+        loaded = {row[0]: row for row in map(_compact, rows)}
+        ids = array("q", sorted(loaded))
+        with self._lock:
+            self._rows, self._ids = loaded, ids
+            self._epoch = os.urandom(8).hex()
+            self._version = 0
+        return len(loaded)
+
+    def get_page(self, limit: int, after: int | None = None) -> EmployeePageDTO:
+        with self._lock:
+            start = 0 if after is None else bisect_right(self._ids, after)
+            page_ids = self._ids[start : start + limit + 1]
+            rows = [self._rows[employee_id] for employee_id in page_ids[:limit]]
+        items = map_employee_rows(rows)
+        next_cursor = items[-1]["id"] if len(page_ids) > limit else None
+        return EmployeePageDTO(items=items, next_cursor=next_cursor)
+
+    def get_by_id(self, employee_id: int) -> EmployeeListDTO | None:
+        row = self._rows.get(employee_id)
+        return None if row is None else map_employee_rows([row])[0]
+
+    def etag(self, key: str) -> str:
+        """Validator for a query result: changes whenever any row does (coarse, cheap)."""
+        token = f"{self._epoch}:{self._version}:{key}".encode()
+        return hashlib.blake2b(token, digest_size=16).hexdigest()
+
+    def apply(self, events: Iterable[DomainEvent]) -> None:
+        """Follow committed projections; mirrors ``EmployeesProjector``."""
+        with self._lock:
+            for event in events:
+                if isinstance(event, EmployeeCreated):
+                    self._upsert(
+                        (
+                            event.id,
+                            event.name,
+                            event.lastname,
+                            event.salary,
+                            event.address,
+                            event.in_vacation,
+                        )
+                    )
+                elif isinstance(event, EmployeeUpdated):
+                    self._patch(event.id, event.fields_changed)
+                elif isinstance(event, EmployeeDeleted):
+                    self._delete(event.id)
+            self._version += 1
+
+    def diff(self, rows: Iterable[Sequence[Any]]) -> ReplicaDiff:
+        """Compare against a full scan of ``read_employees`` (``_READ_COLUMNS`` order)."""
+        result = ReplicaDiff()
+        with self._lock:
+            snapshot = dict(self._rows)
+        for row in map(_compact, rows):
+            stored = snapshot.pop(row[0], None)
+            if stored is None:
+                result.missing.append(row[0])
+            elif stored != row:
+                result.mismatched.append(row[0])
+        result.unexpected = sorted(snapshot)
+        return result
+
+    def footprint(self) -> ReplicaFootprint:
+        with self._lock:
+            rows = list(self._rows.values())
+            index_bytes = sys.getsizeof(self._rows) + sys.getsizeof(self._ids)
+        row_bytes = 0
+        seen: set[int] = set()
+        for row in rows:
+            row_bytes += sys.getsizeof(row) + sys.getsizeof(row[3])
+            for value in (row[1], row[2], row[4]):
+                if id(value) not in seen:
+                    seen.add(id(value))
+                    row_bytes += sys.getsizeof(value)
+        return ReplicaFootprint(rows=len(rows), index_bytes=index_bytes, row_bytes=row_bytes)
+
+    def _upsert(self, row: Sequence[Any]) -> None:
+        compact = _compact(row)
+        employee_id = compact[0]
+        if employee_id not in self._rows:
+            if not self._ids or self._ids[-1] < employee_id:
+                self._ids.append(employee_id)  # new ids are almost always the largest
+            else:
+                self._ids.insert(bisect_right(self._ids, employee_id), employee_id)
+        self._rows[employee_id] = compact
+
+    def _patch(self, employee_id: int, fields_changed: dict[str, object]) -> None:
+        row = self._rows.get(employee_id)
+        if row is None:
+            return
+        values = list(row)
+        for name, value in fields_changed.items():
+            if name in PROJECTED_FIELDS:
+                values[READ_COLUMN_INDEX[name]] = value
+        self._rows[employee_id] = _compact(values)
+
+    def _delete(self, employee_id: int) -> None:
+        if self._rows.pop(employee_id, None) is None:
+            return
+        index = bisect_right(self._ids, employee_id) - 1
+        del self._ids[index]
+
+
+class MemoryEmployeesReadRepository:
+    """Query-side repository answered from an ``EmployeeReadReplica``."""
+
+    def __init__(self, replica: EmployeeReadReplica):
+        self.replica = replica
+
+    def get_page(self, limit: int, after: int | None = None) -> EmployeePageDTO:
+        return self.replica.get_page(limit, after)
+
+    def get_by_id(self, employee_id: int) -> EmployeeListDTO | None:
+        return self.replica.get_by_id(employee_id)
+
+
+class AsyncMemoryEmployeesReadRepository:
+    """Async face of ``MemoryEmployeesReadRepository``; nothing here ever awaits I/O."""
+
+    def __init__(self, replica: EmployeeReadReplica):
+        self.replica = replica
+
+    async def get_page(self, limit: int, after: int | None = None) -> EmployeePageDTO:
+        return self.replica.get_page(limit, after)
+
+    async def get_by_id(self, employee_id: int) -> EmployeeListDTO | None:
+        return self.replica.get_by_id(employee_id)
@@ -1,9 +1,60 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from itertools import groupby
+from typing import Any
+
 from app.models import ReadEmployee
-from application.read_models.employees import EmployeeListDTO, map_to_employee_dto
+from application.read_models.employees import (
+    EmployeeListDTO,
+    EmployeePageDTO,
+    map_employee_rows,
+)
+from sqlalchemy import Row, Select, bindparam, delete, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+# Order matters: ``map_employee_rows`` unpacks rows positionally.
+_READ_COLUMNS = (
+    ReadEmployee.id,
+    ReadEmployee.name,
+    ReadEmployee.lastname,
+    ReadEmployee.salary,
+    ReadEmployee.address,
+    ReadEmployee.in_vacation,
+)
+# Columns an EmployeeUpdated event may patch; anything else in fields_changed is ignored.
+PROJECTED_FIELDS = frozenset({"name", "lastname", "salary", "address", "in_vacation"})
+# Position of each projected field in a ``_READ_COLUMNS`` row, for code patching row tuples.
+READ_COLUMN_INDEX = {
+    column.key: index
+    for index, column in enumerate(_READ_COLUMNS)
+    if column.key in PROJECTED_FIELDS
+}
+# Rows per multi-VALUES statement; keeps bound parameters well under SQLite's limit.
+_BULK_CHUNK_SIZE = 500
+
+
+def _chunks(items: list[Any], size: int = _BULK_CHUNK_SIZE) -> Iterator[list[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _page_statement(limit: int, after: int | None) -> Select:
+    # Seek on the primary key and fetch one extra row to learn whether a next page exists,
+    # so cost stays O(limit) regardless of how deep the cursor is or how big the table gets.
+    statement = select(*_READ_COLUMNS).order_by(ReadEmployee.id).limit(limit + 1)
+    if after is not None:
+        statement = statement.where(ReadEmployee.id > after)
+    return statement
+
+
+def _to_page(rows: list[Any], limit: int) -> EmployeePageDTO:
+    items = map_employee_rows(rows[:limit])
+    next_cursor = items[-1]["id"] if len(rows) > limit else None
+    return EmployeePageDTO(items=items, next_cursor=next_cursor)
+
 
 class EmployeesReadRepository:
     """Read-model access so queries stay decoupled and projectors can update the view."""
@@ -13,37 +64,23 @@ class EmployeesReadRepository:
 
     def get_all(self) -> list[EmployeeListDTO]:
         """Return lightweight employees for listings using the read-model table."""
-        employees = (
-            self.db.query(
-                ReadEmployee.id,
-                ReadEmployee.name,
-                ReadEmployee.lastname,
-                ReadEmployee.salary,
-                ReadEmployee.address,
-                ReadEmployee.in_vacation,
-            )
-            .order_by(ReadEmployee.id)
-            .all()
-        )
-        return [map_to_employee_dto(employee) for employee in employees]
+        return map_employee_rows(self.db.execute(select(*_READ_COLUMNS).order_by(ReadEmployee.id)))
+
+    def get_page(self, limit: int, after: int | None = None) -> EmployeePageDTO:
+        """Return up to ``limit`` employees with ``id > after`` plus the next cursor."""
+        return _to_page(self.db.execute(_page_statement(limit, after)).all(), limit)
+
+    def iter_rows(self, chunk_size: int = 10_000) -> Iterator[Row[Any]]:
+        """Yield every row in id order (``_READ_COLUMNS`` layout), ``chunk_size`` per fetch."""
+        statement = select(*_READ_COLUMNS).order_by(ReadEmployee.id)
+        return iter(self.db.execute(statement.execution_options(yield_per=chunk_size)))
 
     def get_by_id(self, employee_id: int) -> EmployeeListDTO | None:
         """Return a single employee DTO or None; mirrors the API payload shape."""
-        employee = (
-            self.db.query(
-                ReadEmployee.id,
-                ReadEmployee.name,
-                ReadEmployee.lastname,
-                ReadEmployee.salary,
-                ReadEmployee.address,
-                ReadEmployee.in_vacation,
-            )
-            .filter(ReadEmployee.id == employee_id)
-            .first()
-        )
+        employee = self.db.query(*_READ_COLUMNS).filter(ReadEmployee.id == employee_id).first()
         if not employee:
             return None
-        return map_to_employee_dto(employee)
+        return map_employee_rows([employee])[0]
 
     def upsert_employee(
         self,
@@ -80,9 +117,8 @@ class EmployeesReadRepository:
         if not employee:
             return
 
-        allowed_fields = {"name", "lastname", "salary", "address", "in_vacation"}
         for field, value in fields_changed.items():
-            if field in allowed_fields:
+            if field in PROJECTED_FIELDS:
                 setattr(employee, field, value)
 
     def delete_employee(self, employee_id: int) -> None:
@@ -90,3 +126,78 @@ class EmployeesReadRepository:
         if not employee:
             return
         self.db.delete(employee)
+
+    def apply_batch(
+        self,
+        rows: Iterable[Mapping[str, object]] = (),
+        patches: Iterable[Mapping[str, object]] = (),
+        deleted_ids: Iterable[int] = (),
+    ) -> None:
+        """Apply coalesced projections with set-based statements (no per-row ORM loads).
+
+        ``rows`` are complete employees (``id`` plus every projected field) written
+        with one ``INSERT ... ON CONFLICT DO UPDATE``; ``patches`` carry ``id`` plus
+        the changed fields and run as one executemany ``UPDATE`` per field set;
+        ``deleted_ids`` go out in a single ``DELETE ... WHERE id IN (...)``.
+        """
+        table = ReadEmployee.__table__
+        for ids in _chunks(list(deleted_ids)):
+            self.db.execute(delete(table).where(table.c.id.in_(ids)))
+
+        rows = list(rows)
+        if rows:
+            # executemany of one cached statement; insertmanyvalues batches the VALUES.
+            statement = insert(table)
+            self.db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[table.c.id],
+                    set_={field: statement.excluded[field] for field in PROJECTED_FIELDS},
+                ),
+                rows,
+            )
+
+        by_field_set = sorted(patches, key=lambda patch: sorted(patch))
+        for fields, group in groupby(by_field_set, key=lambda patch: sorted(patch)):
+            changed = [field for field in fields if field != "id"]
+            if not changed:
+                continue
+            self.db.execute(
+                update(table)
+                .where(table.c.id == bindparam("_id"))
+                .values({field: bindparam(f"_{field}") for field in changed}),
+                [{f"_{key}": value for key, value in patch.items()} for patch in group],
+            )
+
+
+class AsyncEmployeesReadRepository:
+    """Non-blocking read-model queries on the aiosqlite engine (read side only)."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_all(self) -> list[EmployeeListDTO]:
+        result = await self.db.execute(select(*_READ_COLUMNS).order_by(ReadEmployee.id))
+        return map_employee_rows(result)
+
+    async def get_page(self, limit: int, after: int | None = None) -> EmployeePageDTO:
+        result = await self.db.execute(_page_statement(limit, after))
+        return _to_page(result.all(), limit)
+
+    async def stream_rows(self, chunk_size: int) -> AsyncIterator[Sequence[Row[Any]]]:
+        """Yield the whole read model in id order, ``chunk_size`` raw rows at a time.
+
+        Uses a server-side cursor, so at most one chunk is buffered no matter how
+        large the table is; rows are left as tuples for the caller to encode.
+        """
+        result = await self.db.stream(
+            select(*_READ_COLUMNS).order_by(ReadEmployee.id).execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.partitions():
+            yield rows
+
+    async def get_by_id(self, employee_id: int) -> EmployeeListDTO | None:
+        result = await self.db.execute(select(*_READ_COLUMNS).where(ReadEmployee.id == employee_id))
+        employee = result.first()
+        if not employee:
+            return None
+        return map_employee_rows([employee])[0]
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, TypeVar
+
+from app.models import Employee, ReadEmployee
+from application.read_models.projectors.employees_projector import EmployeesProjector
+from domain.events.base import DomainEvent
+from domain.events.employees import EmployeeCreated, EmployeeDeleted, EmployeeUpdated
+from sqlalchemy import Column, Connection, Engine, MetaData, Table, func, literal_column, select
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable
+
+from infrastructure.outbox.event_codec import decode_event
+from infrastructure.outbox.outbox_repository import OutboxRecord
+from infrastructure.read_repository.employees_read_repository import (
+    PROJECTED_FIELDS,
+    READ_COLUMN_INDEX,
+    EmployeesReadRepository,
+)
+
+# Called with (stage, done, total) after every chunk.
+ProgressCallback = Callable[[str, int, int], None]
+T = TypeVar("T")
+
+_COLUMNS = tuple(column.name for column in ReadEmployee.__table__.columns)
+_SOURCE_SCHEMA = "rebuild_source"
+_COPY_RANGE = (
+    "INSERT INTO main.{shadow} ({columns}) SELECT {columns}"
+    " FROM {schema}.{source} WHERE id >= ? AND id < ? ORDER BY id"
+)
+_INSERT_ROWS = "INSERT INTO {shadow} ({columns}) VALUES ({marks})"
+# Archived events are older than any still in the hot table; rowid keeps the insert
+# order of events that share a ``created_at`` (bulk commands stamp them all at once).
+_SELECT_EVENTS = """
+SELECT event_type, payload FROM (
+    SELECT created_at, 0 AS source, rowid AS seq, event_type, payload FROM outbox_events_archive
+    UNION ALL
+    SELECT created_at, 1 AS source, rowid AS seq, event_type, payload FROM outbox_events
+) ORDER BY created_at, source, seq
+"""
+
+
+@dataclass
+class RebuildResult:
+    source: str
+    rows: int  # rows loaded into the shadow table
+    events: int  # outbox events replayed to build it (0 when copied from the write table)
+    caught_up: int  # events re-applied at swap time for writes that raced the rebuild
+    seconds: float
+
+
+def _shadow_table(name: str) -> Table:
+    # Only the columns and primary key: secondary indexes are created after the swap,
+    # once the old table (and its index names) is gone, instead of during the load.
+    return Table(
+        name,
+        MetaData(),
+        *(
+            Column(
+                column.name, column.type, primary_key=column.primary_key, nullable=column.nullable
+            )
+            for column in ReadEmployee.__table__.columns
+        ),
+    )
+
+
+# Per-employee change left by a chunk of events, coalesced like ``project_batch``.
+_ROW, _PATCH, _DELETE = range(3)
+Changes = dict[int, tuple[int, Any]]
+
+
+def _fold_chunk(records: list[tuple[str, bytes | str]]) -> tuple[int, Changes]:
+    """Decode a chunk of outbox records and coalesce it per employee id.
+
+    A module-level function so process workers can run it; returns the number of
+    records read with the changes, to be merged in chunk order by ``_merge``.
+    """
+    changes: Changes = {}
+    for event_type, payload in records:
+        event = decode_event(event_type, payload)
+        if isinstance(event, EmployeeCreated):
+            row = [event.id, event.name, event.lastname, event.salary, event.address]
+            changes[event.id] = (_ROW, [*row, event.in_vacation])
+        elif isinstance(event, EmployeeUpdated):
+            patch = {
+                name: value
+                for name, value in event.fields_changed.items()
+                if name in PROJECTED_FIELDS
+            }
+            kind, value = changes.get(event.id, (_PATCH, {}))
+            if kind == _ROW:
+                for name, field_value in patch.items():
+                    value[READ_COLUMN_INDEX[name]] = field_value
+            elif kind == _PATCH:
+                changes[event.id] = (_PATCH, {**value, **patch})
+            # After a delete there is no row left to patch.
+        elif isinstance(event, EmployeeDeleted):
+            changes[event.id] = (_DELETE, None)
+    return len(records), changes
+
+
+def _merge(state: dict[int, list[Any]], changes: Changes) -> None:
+    for employee_id, (kind, value) in changes.items():
+        if kind == _ROW:
+            state[employee_id] = value
+        elif kind == _PATCH:
+            row = state.get(employee_id)
+            if row is not None:
+                for name, field_value in value.items():
+                    row[READ_COLUMN_INDEX[name]] = field_value
+        else:
+            state.pop(employee_id, None)
+
+
+class ReadModelRebuilder:
+    """Rebuild ``read_employees`` off to the side, then swap it in atomically.
+
+    Rows are bulk-inserted into a shadow table in ``chunk_size`` batches, each its
+    own short transaction, so projections keep committing to the live table during
+    the load. The swap (drop the live table, rename the shadow, recreate indexes)
+    runs in one ``BEGIN IMMEDIATE`` transaction: readers see the old table or the
+    new one, never a partial one. Events created since the rebuild started (minus
+    ``catch_up_margin`` for commands that were in flight) are re-applied inside that
+    transaction, so projections that raced the load are not lost; replaying them
+    twice is harmless as projections are idempotent in order.
+
+    ``read_model_engine`` must come from ``create_writer_engine``: pysqlite's own
+    transaction handling would autocommit each DDL statement of the swap. Copying
+    the write table attaches its file and runs ``INSERT ... SELECT`` per id range,
+    so rows never pass through Python. The outbox replay is bound by decoding; with
+    ``workers > 1`` chunks are decoded and coalesced on that many processes while
+    earlier ones are merged, in order, here.
+    """
+
+    shadow_name = "read_employees_rebuild"
+
+    def __init__(
+        self,
+        source_engine: Engine,
+        read_model_engine: Engine,
+        chunk_size: int = 50_000,
+        workers: int = 1,
+        catch_up_margin: timedelta = timedelta(seconds=30),
+        progress: ProgressCallback | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        self.source_engine = source_engine
+        self.read_model_engine = read_model_engine
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.catch_up_margin = catch_up_margin
+        self.progress = progress
+        self.logger = logger or logging.getLogger("read_model.rebuild")
+        self._shadow = _shadow_table(self.shadow_name)
+
+    def rebuild_from_table(self) -> RebuildResult:
+        """Copy the current ``employees`` rows into a fresh read model."""
+        started, clock = datetime.now(UTC), time.perf_counter()
+        table = Employee.__table__
+        with self.source_engine.connect() as connection:
+            low, high, total = connection.execute(
+                select(func.min(table.c.id), func.max(table.c.id), func.count())
+            ).one()
+        columns = ", ".join(_COLUMNS)
+        rows = 0
+        with self._shadow_load() as connection, self._attached_source(connection) as schema:
+            copy = _COPY_RANGE.format(
+                shadow=self.shadow_name, columns=columns, schema=schema, source=table.name
+            )
+            for start in [] if low is None else range(low, high + 1, self.chunk_size):
+                with connection.begin():
+                    rows += connection.exec_driver_sql(
+                        copy, (start, start + self.chunk_size)
+                    ).rowcount
+                self._report("copy", rows, total)
+        caught_up = self._swap(started)
+        return self._finish("employees", rows, 0, caught_up, clock)
+
+    def replay_outbox(self) -> RebuildResult:
+        """Fold every archived and pending outbox event into a fresh read model."""
+        started, clock = datetime.now(UTC), time.perf_counter()
+        state: dict[int, list[Any]] = {}
+        events = 0
+        with self.source_engine.connect() as connection:
+            total = connection.exec_driver_sql(
+                "SELECT (SELECT count(*) FROM outbox_events_archive)"
+                " + (SELECT count(*) FROM outbox_events)"
+            ).scalar_one()
+            # Driver cursor: chunks of plain tuples, cheap to hand to worker processes.
+            cursor = connection.connection.dbapi_connection.cursor()
+            cursor.execute(_SELECT_EVENTS)
+            chunks = iter(lambda: cursor.fetchmany(self.chunk_size), [])
+            for read, changes in self._map(_fold_chunk, chunks):
+                _merge(state, changes)
+                events += read
+                self._report("replay", events, total)
+            cursor.close()
+
+        ordered = sorted(state)
+        insert = _INSERT_ROWS.format(
+            shadow=self.shadow_name,
+            columns=", ".join(_COLUMNS),
+            marks=", ".join("?" * len(_COLUMNS)),
+        )
+        with self._shadow_load() as connection:
+            for start in range(0, len(ordered), self.chunk_size):
+                ids = ordered[start : start + self.chunk_size]
+                with connection.begin():
+                    connection.exec_driver_sql(insert, [tuple(state[i]) for i in ids])
+                self._report("load", start + len(ids), len(ordered))
+        caught_up = self._swap(started)
+        return self._finish("outbox", len(ordered), events, caught_up, clock)
+
+    def _map(self, fn: Callable[[Any], T], items: Iterable[Any]) -> Iterator[T]:
+        """``map`` on ``workers`` processes, in order, a few chunks ahead."""
+        if self.workers <= 1:
+            yield from map(fn, items)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            in_flight: deque[Future[T]] = deque()
+            for item in items:
+                in_flight.append(pool.submit(fn, item))
+                if len(in_flight) >= 2 * self.workers:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+
+    @contextmanager
+    def _shadow_load(self) -> Iterator[Connection]:
+        """Recreate the empty shadow table; yield its connection for chunked inserts."""
+        with self.read_model_engine.connect() as connection:
+            with connection.begin():
+                connection.exec_driver_sql(f"DROP TABLE IF EXISTS {self.shadow_name}")
+                connection.execute(CreateTable(self._shadow))
+            yield connection
+
+    @contextmanager
+    def _attached_source(self, connection: Connection) -> Iterator[str]:
+        """Schema name under which ``connection`` sees the write database."""
+        source = self.source_engine.url.database
+        target = self.read_model_engine.url.database
+        if not source or source == ":memory:":
+            raise ValueError("Rebuilding from the employees table needs a file-backed database")
+        if target and os.path.abspath(source) == os.path.abspath(target):
+            yield "main"
+            return
+        # ATTACH is refused inside a transaction; the writer engine's driver connection
+        # runs in autocommit mode between the chunk transactions.
+        raw = connection.connection.dbapi_connection
+        raw.execute(f"ATTACH DATABASE ? AS {_SOURCE_SCHEMA}", (source,))
+        try:
+            yield _SOURCE_SCHEMA
+        finally:
+            raw.execute(f"DETACH DATABASE {_SOURCE_SCHEMA}")
+
+    def _swap(self, started: datetime) -> int:
+        """Replace the live table with the shadow and catch up; return events re-applied."""
+        live = ReadEmployee.__table__
+        with self.read_model_engine.connect() as connection, connection.begin():
+            connection.exec_driver_sql(f"DROP TABLE IF EXISTS {live.name}")
+            connection.exec_driver_sql(f"ALTER TABLE {self.shadow_name} RENAME TO {live.name}")
+            for index in live.indexes:
+                index.create(connection)
+            # Read inside the write lock: anything projected after it lands on the new
+            # table, so no later event can be missing from it.
+            events = self._events_since(started - self.catch_up_margin)
+            self._catch_up(connection, events)
+        return len(events)
+
+    def _events_since(self, since: datetime) -> list[DomainEvent]:
+        outbox = OutboxRecord.__table__
+        statement = (
+            select(outbox.c.event_type, outbox.c.payload)
+            .where(outbox.c.created_at >= since)
+            .order_by(outbox.c.created_at, literal_column("rowid"))
+        )
+        with self.source_engine.connect() as connection:
+            decoded = (decode_event(*row) for row in connection.execute(statement))
+            return [event for event in decoded if event is not None]
+
+    def _catch_up(self, connection: Connection, events: list[DomainEvent]) -> None:
+        if not events:
+            return
+        # Joins the swap transaction; the projector's statements commit with it.
+        with Session(bind=connection) as db:
+            EmployeesProjector(EmployeesReadRepository(db)).project_batch(events)
+
+    def _report(self, stage: str, done: int, total: int) -> None:
+        if self.progress is not None:
+            self.progress(stage, done, total)
+
+    def _finish(
+        self, source: str, rows: int, events: int, caught_up: int, clock: float
+    ) -> RebuildResult:
+        result = RebuildResult(source, rows, events, caught_up, time.perf_counter() - clock)
+        self.logger.info(
+            "read_model_rebuilt source=%s rows=%s events=%s caught_up=%s seconds=%.2f",
+            result.source,
+            result.rows,
+            result.events,
+            result.caught_up,
+            result.seconds,
+        )
+        return result
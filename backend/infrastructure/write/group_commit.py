@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.database import bind_session, configure_sqlite, sqlite_pragmas
+from sqlalchemy import Connection, Engine, create_engine, event
+from sqlalchemy.orm import Session
+
+CommandHandler = Callable[[Any], Any]
+
+
+def create_writer_engine(url: str) -> Engine:
+    """Engine for the single writer: one connection, explicit ``BEGIN IMMEDIATE``.
+
+    pysqlite's own transaction handling breaks SAVEPOINT, which the writer needs to
+    isolate commands inside a group; taking the write lock up front also keeps a
+    group from failing halfway on a deferred lock upgrade.
+    """
+    engine = create_engine(url, connect_args={"check_same_thread": False}, pool_size=1)
+    configure_sqlite(engine, sqlite_pragmas())
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection: Any, _record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin_immediate(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+
+@dataclass
+class _Pending:
+    command: Any
+    future: Future[Any] = field(default_factory=Future)
+
+
+class GroupCommitWriter:
+    """Single writer thread that commits concurrent commands in groups.
+
+    Commands queue up while the previous group commits; the writer takes whatever
+    arrives within ``window_seconds`` of the first one (up to ``max_batch``) and
+    runs each through its registered sync handler on one shared transaction. Every
+    command gets its own session on a SAVEPOINT, so a handler's ``commit()`` only
+    releases it and a failing command rolls back alone; callers' futures resolve
+    with their own result or error once the group's single commit is durable.
+    Commands not started within ``result_timeout`` seconds are cancelled (see
+    ``GroupCommitBehavior``).
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        window_seconds: float = 0.002,
+        max_batch: int = 64,
+        result_timeout: float = 30.0,
+        logger: logging.Logger | None = None,
+    ):
+        self.engine = engine
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self.result_timeout = result_timeout
+        self.logger = logger or logging.getLogger("write.group_commit")
+        self._handlers: dict[type[Any], CommandHandler] = {}
+        self._queue: queue.SimpleQueue[_Pending | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        # Orders submit() against stop(): nothing is queued behind the stop sentinel.
+        self._lock = threading.Lock()
+
+    def register(self, command_type: type[Any], handler: CommandHandler) -> None:
+        """Route ``command_type`` through the writer; ``handler`` uses ``ScopedSession``."""
+        self._handlers[command_type] = handler
+
+    def handles(self, command_type: type[Any]) -> bool:
+        return command_type in self._handlers
+
+    def submit(self, command: Any) -> Future[Any]:
+        pending = _Pending(command)
+        with self._lock:
+            if self._thread is None:
+                raise RuntimeError("GroupCommitWriter is not running; call start() first")
+            self._queue.put(pending)
+        return pending.future
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            # A fresh queue per run: a previous thread still draining never sees new work.
+            self._queue = queue.SimpleQueue()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._queue,), name="group-commit-writer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Commit what is already queued, then stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._queue.put(None)
+        thread.join(timeout)
+
+    def _run(self, work: queue.SimpleQueue[_Pending | None]) -> None:
+        self.logger.info(
+            "group_commit_started window_ms=%.1f max_batch=%s",
+            self.window_seconds * 1000,
+            self.max_batch,
+        )
+        try:
+            running = True
+            while running:
+                first = work.get()
+                if first is None:
+                    break
+                batch, running = self._collect(work, first)
+                self._commit(batch)
+        finally:
+            self._fail_pending(work)
+        self.logger.info("group_commit_stopped")
+
+    def _fail_pending(self, work: queue.SimpleQueue[_Pending | None]) -> None:
+        """Resolve whatever the loop left queued, so no caller waits on a dead writer."""
+        error = RuntimeError("GroupCommitWriter stopped before running the command")
+        while True:
+            try:
+                pending = work.get_nowait()
+            except queue.Empty:
+                return
+            if pending is not None and not pending.future.done():
+                pending.future.set_exception(error)
+
+    def _collect(
+        self, work: queue.SimpleQueue[_Pending | None], first: _Pending
+    ) -> tuple[list[_Pending], bool]:
+        """Gather the group started by ``first``; False once the stop sentinel shows up."""
+        batch = [first]
+        deadline = time.monotonic() + self.window_seconds
+        while len(batch) < self.max_batch:
+            try:
+                pending = work.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if pending is None:
+                return batch, False
+            batch.append(pending)
+        return batch, True
+
+    def _commit(self, batch: list[_Pending]) -> None:
+        # Drop commands whose caller gave up (timed out or cancelled) before the group
+        # started; the rest can no longer be cancelled, so setting their result is safe.
+        batch = [pending for pending in batch if pending.future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        outcomes: list[tuple[Any, BaseException | None]] = []
+        try:
+            with self.engine.connect() as connection, connection.begin():
+                for pending in batch:
+                    outcomes.append(self._apply(connection, pending.command))
+        except Exception as exc:
+            # The group's commit itself failed: nothing in it was written.
+            self.logger.error("group_commit_failed size=%s error=%s", len(batch), exc)
+            for pending in batch:
+                pending.future.set_exception(exc)
+            return
+        self.logger.debug("group_commit size=%s", len(batch))
+        for pending, (result, error) in zip(batch, outcomes, strict=True):
+            if error is None:
+                pending.future.set_result(result)
+            else:
+                pending.future.set_exception(error)
+
+    def _apply(self, connection: Connection, command: Any) -> tuple[Any, BaseException | None]:
+        handler = self._handlers[type(command)]
+        with (
+            Session(
+                bind=connection,
+                join_transaction_mode="create_savepoint",
+                autoflush=False,
+                expire_on_commit=False,
+            ) as db,
+            bind_session(db),
+        ):
+            try:
+                return handler(command), None
+            except Exception as exc:
+                db.rollback()
+                return None, exc
@@ -0,0 +1,4 @@
+import os
+
+# The API tests read their own writes: pin inline dispatch unless a mode is set explicitly.
+os.environ.setdefault("OUTBOX_DISPATCH_MODE", "inline")
@@ -0,0 +1,253 @@
+import asyncio
+import time
+
+from api.response_cache import ResponseCache
+from application.mediator.behaviors import CacheBehavior
+from application.queries.employees import GetEmployeesQuery
+from application.read_models.employees import EmployeePageDTO
+from application.read_models.ttl_config import EMPLOYEE_LIST_CACHE_NAMESPACE
+from infrastructure.cache.cache_provider import AsyncCacheAdapter, CacheProvider
+from infrastructure.cache.single_flight import AsyncSingleFlight
+from infrastructure.cache.tiered_cache_provider import (
+    AsyncTieredCacheProvider,
+    InMemoryInvalidationBroker,
+    TieredCacheProvider,
+)
+
+
+def test_cache_provider_evicts_least_recently_used_within_entry_and_byte_budgets() -> None:
+    cache = CacheProvider(max_entries=2, shards=1)
+    cache.set("a", "a", 5)
+    cache.set("b", "b", 5)
+    assert cache.get("a") == "a"  # "a" becomes most recently used
+    cache.set("c", "c", 5)
+    assert not cache.exists("b")
+    assert cache.exists("a") and cache.exists("c")
+    assert cache.metrics.eviction_count == 1
+    assert cache.metrics.entry_count == len(cache) == 2
+
+    sized = CacheProvider(max_bytes=2_000, shards=1)
+    for index in range(10):
+        sized.set(f"page:{index}", ["x" * 100] * 2, 5)
+    assert 0 < len(sized) < 10
+    assert sized.metrics.size_bytes <= 2_000
+    sized.set("huge", "x" * 10_000, 5)
+    assert not sized.exists("huge")
+
+
+def test_cache_provider_metrics_fold_per_shard_counters_into_one_shared_object() -> None:
+    cache = CacheProvider(shards=16)
+    metrics = cache.metrics
+    for index in range(100):
+        cache.set(f"k{index}", index, 5)
+        cache.get(f"k{index}")
+        cache.get(f"missing{index}")
+    # Counted per shard without a shared lock, summed into the same object on read.
+    assert cache.metrics is metrics
+    assert (metrics.cache_hit_count, metrics.cache_miss_count) == (100, 100)
+    assert metrics.entry_count == len(cache) == 100
+
+    # Increments made on the object itself (a tiered cache's L1 hits) are kept.
+    metrics.cache_hit_count += 5
+    cache.get("k0")
+    assert cache.metrics.cache_hit_count == 106
+    assert AsyncCacheAdapter(cache).metrics is metrics
+
+
+def test_generation_bump_orphans_a_whole_key_family_through_cache_behavior() -> None:
+    cache = CacheProvider()
+    behavior = CacheBehavior(cache)
+    loads: list[int] = []
+
+    def handler(query: GetEmployeesQuery) -> EmployeePageDTO:
+        loads.append(1)
+        return EmployeePageDTO(items=[], next_cursor=None)
+
+    pages = [GetEmployeesQuery(limit=10, after=after) for after in (None, 10, 20)]
+    for query in pages * 2:
+        behavior.handle(query, handler)
+    assert len(loads) == 3
+
+    cache.bump_generation(EMPLOYEE_LIST_CACHE_NAMESPACE)
+    for query in pages:
+        behavior.handle(query, handler)
+    assert len(loads) == 6
+    # Orphaned entries (and their ETag side keys) stay until TTL or LRU eviction drops them.
+    assert len(cache) == 12
+
+
+def test_conditional_hit_is_answered_from_the_stored_etag_alone() -> None:
+    cache = CacheProvider()
+    behavior = CacheBehavior(cache, stale_ttl_seconds=30)
+    loads: list[int] = []
+
+    def handler(query: GetEmployeesQuery) -> EmployeePageDTO:
+        loads.append(1)
+        return EmployeePageDTO(items=[], next_cursor=None)
+
+    first = behavior.handle(GetEmployeesQuery(limit=10), handler)
+    assert first["value"] == {"items": [], "next_cursor": None}
+    assert behavior.handle(GetEmployeesQuery(limit=10), handler) == first
+
+    # Drop the payload: a matching validator must not need it.
+    key = f"employee:list:0:10:g{cache.get_generation(EMPLOYEE_LIST_CACHE_NAMESPACE)}"
+    cache.delete(key)
+    not_modified = behavior.handle(
+        GetEmployeesQuery(limit=10, if_none_match=first["etag"]), handler
+    )
+    assert not_modified == {"etag": first["etag"], "value": None}
+    assert len(loads) == 1
+
+    mismatch = behavior.handle(GetEmployeesQuery(limit=10, if_none_match="other"), handler)
+    assert mismatch == first
+    assert len(loads) == 2
+
+
+def test_response_cache_entries_never_outlive_the_freshness_of_their_source() -> None:
+    cache = CacheProvider()
+    async_cache = AsyncCacheAdapter(cache)
+    behavior = CacheBehavior(cache, async_cache=async_cache, stale_ttl_seconds=30)
+    responses = ResponseCache(async_cache, follow_source_freshness=True)
+
+    async def handler(query: GetEmployeesQuery) -> EmployeePageDTO:
+        return EmployeePageDTO(items=[], next_cursor=None)
+
+    async def cache_response(query: GetEmployeesQuery, expired: bool) -> tuple[int, bool]:
+        page = await behavior.handle_async(query, handler)
+        key = await responses.key_for(query)
+        if expired:
+            # Past its TTL: the source is only served stale while it refreshes.
+            cache.get(key)["fresh_until"] = time.time() - 1
+        ttl = await responses.ttl_for(key, query.cache_ttl_seconds)
+        await responses.put(key, page["value"]["items"], {"ETag": page["etag"]}, ttl)
+        return ttl, await responses.get(key, "json") is not None
+
+    fresh = GetEmployeesQuery(limit=10)
+    assert asyncio.run(cache_response(fresh, expired=False)) == (fresh.cache_ttl_seconds, True)
+    # Its encoded bodies must not be kept for another full TTL.
+    assert asyncio.run(cache_response(GetEmployeesQuery(limit=20), expired=True)) == (0, False)
+
+
+def test_cache_provider_sweeps_expired_entries_without_reads() -> None:
+    cache = CacheProvider(shards=4)
+    for index in range(20):
+        cache.set(f"detail:{index}", index, 0 if index % 2 else 60)
+    time.sleep(0.01)
+    assert cache.sweep_expired() == 10
+    assert len(cache) == cache.metrics.entry_count == 10
+    assert cache.metrics.expired_count == 10
+
+    cache.set("short", 1, 0)
+    cache.start_sweeper(0.01)
+    deadline = time.monotonic() + 1
+    while len(cache) > 10 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    cache.stop_sweeper()
+    assert len(cache) == 10
+
+
+def test_tiered_cache_serves_l1_and_broadcasts_deletes_to_every_worker() -> None:
+    # A shared in-memory "L2" and broker stand in for Redis and its pub/sub channel.
+    l2 = CacheProvider()
+    broker = InMemoryInvalidationBroker()
+    workers = []
+    for _ in range(2):
+        l1 = CacheProvider(max_entries=2, shards=1)
+        broker.subscribe(l1)
+        workers.append(TieredCacheProvider(l1, l2, broker, l1_ttl_seconds=60))
+    first, second = workers
+
+    first.set("employee:detail:1", {"id": 1}, 5)
+    assert second.get("employee:detail:1") == {"id": 1}  # L2 hit fills second's L1
+    assert second.get("employee:detail:1") == {"id": 1}
+    assert second.metrics.l1_hit_count == 1
+    assert second.l1.exists("employee:detail:1")
+
+    first.delete("employee:detail:1")
+    assert not second.l1.exists("employee:detail:1")
+    assert second.get("employee:detail:1") is None
+
+    # Generations are cached in L1 too, and a bump anywhere evicts every copy.
+    assert second.get_generation("employee:list") == 0
+    assert first.bump_generation("employee:list") == 1
+    assert second.get_generation("employee:list") == 1
+
+
+def test_async_tiered_cache_shares_l1_with_the_sync_path() -> None:
+    l1 = CacheProvider(max_entries=8)
+    l2 = CacheProvider()
+    broker = InMemoryInvalidationBroker()
+    broker.subscribe(l1)
+    sync_cache = TieredCacheProvider(l1, l2, broker)
+    async_cache = AsyncTieredCacheProvider(l1, AsyncCacheAdapter(l2), broker)
+
+    async def scenario() -> None:
+        await async_cache.set("employee:detail:1", {"id": 1}, 2)
+        assert sync_cache.get("employee:detail:1") == {"id": 1}
+        await async_cache.delete("employee:detail:1")
+        assert sync_cache.get("employee:detail:1") is None
+
+    asyncio.run(scenario())
+
+
+def test_batch_operations_round_trip_through_both_tiers() -> None:
+    l2 = CacheProvider()
+    broker = InMemoryInvalidationBroker()
+    peer_l1 = CacheProvider()
+    broker.subscribe(peer_l1)
+    cache = TieredCacheProvider(CacheProvider(), l2, broker)
+    peer = TieredCacheProvider(peer_l1, l2, broker)
+
+    cache.set_many({f"employee:detail:{i}": {"id": i} for i in range(5)}, 5)
+    assert peer.get_many(["employee:detail:1", "employee:detail:3", "missing"]) == {
+        "employee:detail:1": {"id": 1},
+        "employee:detail:3": {"id": 3},
+    }
+    assert peer_l1.exists("employee:detail:1")
+    generation = peer.get_generation("employee:list")
+
+    cache.delete_many(["employee:detail:1", "employee:detail:2"], ["employee:list"])
+    assert not peer_l1.exists("employee:detail:1")
+    assert sorted(l2.get_many(f"employee:detail:{i}" for i in range(5))) == [
+        "employee:detail:0",
+        "employee:detail:3",
+        "employee:detail:4",
+    ]
+    assert peer.get_generation("employee:list") == generation + 1
+
+
+def test_cancelled_single_flight_leader_hands_the_load_to_a_follower() -> None:
+    flights = AsyncSingleFlight()
+    loads: list[int] = []
+    started = asyncio.Event()
+
+    async def load() -> int:
+        loads.append(len(loads))
+        started.set()
+        await asyncio.sleep(0.05)
+        return len(loads)
+
+    async def failing_load() -> int:
+        raise ValueError("boom")
+
+    async def main() -> tuple[list[object], list[object]]:
+        leader = asyncio.create_task(flights.do("k", load))
+        await started.wait()
+        followers = [asyncio.create_task(flights.do("k", load)) for _ in range(5)]
+        await asyncio.sleep(0)
+        # The client behind the leader disconnects mid-load.
+        leader.cancel()
+        cancelled = await asyncio.gather(leader, return_exceptions=True)
+        results = await asyncio.gather(*followers, return_exceptions=True)
+        errors = await asyncio.gather(
+            flights.do("e", failing_load), flights.do("e", failing_load), return_exceptions=True
+        )
+        return cancelled + results, errors
+
+    (cancelled, *results), errors = asyncio.run(main())
+    assert isinstance(cancelled, asyncio.CancelledError)
+    # One follower re-ran the load and the others shared its result.
+    assert results == [2] * 5
+    assert len(loads) == 2
+    # Real load failures are still shared.
+    assert all(isinstance(error, ValueError) for error in errors)
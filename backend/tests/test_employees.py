@@ -1,13 +1,23 @@
+import json
+import struct
 import warnings
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
 
+import msgpack
 import pytest
-from app.database import Base
+from api.response_cache import ResponseCache
+from app import main
+from app.database import Base, ReadBase, configure_sqlite, create_schema, sqlite_pragmas
+from app.dependencies import get_async_db, get_async_read_db, get_async_session_factory
 from app.main import app, get_db
+from application.mediator import registry
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 warnings.filterwarnings(
     "ignore",
@@ -15,29 +25,53 @@ warnings.filterwarnings(
     category=PendingDeprecationWarning,
 )
 
-engine = create_engine(
-    "sqlite:///:memory:",
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestingSessionLocal = sessionmaker[Session](autocommit=False, autoflush=False, bind=engine)
+MSGPACK_ACCEPT = {"Accept": "application/x-msgpack"}
 
 
 @pytest.fixture(autouse=True)
-def override_get_db() -> Generator[None, None, None]:
-    Base.metadata.create_all(bind=engine)
+def override_get_db(tmp_path: Path) -> Generator[None, None, None]:
+    # Async routes and sync helpers must see the same database, so use a temp file
+    # instead of a per-connection in-memory DB. NullPool keeps aiosqlite connections
+    # from outliving the TestClient's event loop.
+    db_path = tmp_path / "employees.db"
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    testing_session_local = sessionmaker[Session](autocommit=False, autoflush=False, bind=engine)
+    testing_async_session_local = async_sessionmaker[AsyncSession](
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+    # Queries go through query_only connections, as in production.
+    async_read_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    configure_sqlite(async_read_engine, sqlite_pragmas(read_only=True))
+    testing_async_read_session_local = async_sessionmaker[AsyncSession](
+        async_read_engine, autoflush=False, expire_on_commit=False
+    )
+    create_schema(engine)
 
     def _get_db() -> Generator[Session, None, None]:
-        db = TestingSessionLocal()
+        db = testing_session_local()
         try:
             yield db
         finally:
             db.close()
 
+    async def _get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with testing_async_session_local() as db:
+            yield db
+
+    async def _get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+        async with testing_async_read_session_local() as db:
+            yield db
+
     app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_async_db] = _get_async_db
+    app.dependency_overrides[get_async_read_db] = _get_async_read_db
+    app.dependency_overrides[get_async_session_factory] = lambda: testing_async_read_session_local
     yield
     app.dependency_overrides.clear()
     Base.metadata.drop_all(bind=engine)
+    ReadBase.metadata.drop_all(bind=engine)
+    engine.dispose()
 
 
 @pytest.fixture()
@@ -96,3 +130,242 @@ def test_full_employee_crud_flow(client: TestClient) -> None:
     final_list = client.get("/employees")
     assert final_list.status_code == 200
     assert final_list.json() == []
+
+
+def test_response_cache_serves_encoded_bodies_and_follows_writes(client: TestClient) -> None:
+    container = client.app.state.container  # type: ignore[attr-defined]
+    client.app.state.response_cache = ResponseCache(container.async_cache)  # type: ignore[attr-defined]
+    payload = {
+        "name": "Jane",
+        "lastname": "Doe",
+        "salary": 1000.0,
+        "address": "Main St",
+        "in_vacation": False,
+    }
+    for _ in range(3):
+        assert client.post("/employees", json=payload).status_code == 201
+
+    identity = {"Accept-Encoding": "identity"}
+    first = client.get("/employees", params={"limit": 2}, headers=identity)
+    assert "content-encoding" not in first.headers
+    assert first.headers["x-next-cursor"] == "2"
+    assert 'rel="next"' in first.headers["link"]
+    cached = client.get("/employees", params={"limit": 2}, headers=identity)
+    assert cached.content == first.content
+    assert cached.headers["etag"] == first.headers["etag"]
+    assert 'rel="next"' in cached.headers["link"]
+
+    zipped = client.get("/employees", params={"limit": 2}, headers={"Accept-Encoding": "gzip"})
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert zipped.json() == first.json()
+    packed = client.get("/employees", params={"limit": 2}, headers=MSGPACK_ACCEPT)
+    assert packed.headers["content-type"] == "application/x-msgpack"
+    assert msgpack.unpackb(packed.content) == first.json()
+    # q=0 rules a representation out, and a higher q elsewhere outranks it.
+    for encoding in ("gzip;q=0", "identity, gzip;q=0", "gzip;q=0.5, identity"):
+        plain = client.get("/employees", params={"limit": 2}, headers={"Accept-Encoding": encoding})
+        assert "content-encoding" not in plain.headers
+        assert plain.content == first.content
+    for accept in ("application/msgpack;q=0, application/json", "application/x-msgpack;q=0"):
+        as_json = client.get(
+            "/employees", params={"limit": 2}, headers={"Accept": accept, **identity}
+        )
+        assert as_json.headers["content-type"] == "application/json"
+        assert as_json.content == first.content
+    not_modified = client.get(
+        "/employees", params={"limit": 2}, headers={"If-None-Match": first.headers["etag"]}
+    )
+    assert not_modified.status_code == 304
+
+    assert client.get("/employees/1", headers=identity).json()["in_vacation"] is False
+    assert client.get("/employees/1").json()["in_vacation"] is False
+    assert client.put("/employees/1", json={**payload, "in_vacation": True}).status_code == 200
+    assert client.get("/employees/1", headers=identity).json()["in_vacation"] is True
+    assert client.get("/employees/1").json()["in_vacation"] is True
+    assert client.get("/employees", params={"limit": 2}).json()[0]["in_vacation"] is True
+    assert client.get("/employees/99").status_code == 404
+
+
+def test_read_endpoints_negotiate_msgpack(client: TestClient) -> None:
+    payload = {
+        "name": "Jane",
+        "lastname": "Doe",
+        "salary": 1000.0,
+        "address": "Main St",
+        "in_vacation": False,
+    }
+    assert client.post("/employees", json=payload).status_code == 201
+
+    as_json = client.get("/employees")
+    assert as_json.headers["content-type"] == "application/json"
+    for path in ("/employees", "/employees/1"):
+        packed = client.get(path, headers=MSGPACK_ACCEPT)
+        assert packed.status_code == 200
+        assert packed.headers["content-type"] == "application/x-msgpack"
+        assert "Accept" in packed.headers["vary"]
+        assert msgpack.unpackb(packed.content) == client.get(path).json()
+    assert (
+        client.get("/employees", headers=MSGPACK_ACCEPT).headers["etag"] == as_json.headers["etag"]
+    )
+    ranked_below_json = {"Accept": "application/x-msgpack;q=0.5, application/json"}
+    assert client.get("/employees", headers=ranked_below_json).content == as_json.content
+    only_msgpack = {"Accept": "application/msgpack;q=0.5"}
+    assert client.get("/employees", headers=only_msgpack).headers["content-type"] == (
+        "application/x-msgpack"
+    )
+
+
+def test_bulk_endpoints_write_project_and_invalidate_once(client: TestClient) -> None:
+    payloads = [
+        {
+            "name": f"Employee{index}",
+            "lastname": "Doe",
+            "salary": 1000.0 + index,
+            "address": "Main St",
+            "in_vacation": False,
+        }
+        for index in range(1200)
+    ]
+    assert client.get("/employees", params={"limit": 5}).json() == []  # cache the empty page
+
+    created = client.post("/employees/bulk", json=payloads)
+    assert created.status_code == 201
+    assert [employee["id"] for employee in created.json()] == list(range(1, 1201))
+    # Inline dispatch projects every event of the batch, not only the first outbox page.
+    assert client.get("/employees", params={"limit": 1, "after": 1199}).json()[0]["id"] == 1200
+    assert client.get("/employees/7").json()["salary"] == 1006.0
+
+    updates = [
+        {**payloads[0], "id": 1, "in_vacation": True},
+        {**payloads[6], "id": 7, "salary": 1.0},
+        {**payloads[0], "id": 9999},
+    ]
+    updated = client.put("/employees/bulk", json=updates)
+    assert updated.status_code == 200
+    assert [employee["id"] for employee in updated.json()] == [1, 7]
+    assert client.get("/employees/1").json()["in_vacation"] is True
+    assert client.get("/employees/7").json()["salary"] == 1.0
+
+    deleted = client.request("DELETE", "/employees/bulk", json={"ids": [2, 3, 9999]})
+    assert deleted.json() == {"deleted": [2, 3]}
+    assert client.get("/employees/2").status_code == 404
+    assert [
+        employee["id"] for employee in client.get("/employees", params={"limit": 3}).json()
+    ] == [
+        1,
+        4,
+        5,
+    ]
+
+
+def test_list_employees_pages_by_cursor(client: TestClient) -> None:
+    for index in range(5):
+        payload = {
+            "name": f"Employee{index}",
+            "lastname": "Doe",
+            "salary": 1000.0 + index,
+            "address": "Main St",
+            "in_vacation": False,
+        }
+        assert client.post("/employees", json=payload).status_code == 201
+
+    first_page = client.get("/employees", params={"limit": 2})
+    assert [employee["id"] for employee in first_page.json()] == [1, 2]
+    assert first_page.headers["x-next-cursor"] == "2"
+    assert 'rel="next"' in first_page.headers["link"]
+
+    second_page = client.get("/employees", params={"limit": 2, "after": 2})
+    assert [employee["id"] for employee in second_page.json()] == [3, 4]
+    assert second_page.headers["etag"] != first_page.headers["etag"]
+
+    last_page = client.get("/employees", params={"limit": 2, "after": 4})
+    assert [employee["id"] for employee in last_page.json()] == [5]
+    assert "x-next-cursor" not in last_page.headers
+    assert "link" not in last_page.headers
+
+    # Any write evicts every cached page, not only the first one.
+    client.delete("/employees/3")
+    assert [
+        employee["id"]
+        for employee in client.get("/employees", params={"limit": 2, "after": 2}).json()
+    ] == [4, 5]
+
+    assert client.get("/employees", params={"limit": 0}).status_code == 422
+
+
+def test_export_streams_ndjson_and_msgpack_frames(client: TestClient) -> None:
+    for index in range(3):
+        payload = {
+            "name": f"Employee{index}",
+            "lastname": "Doe",
+            "salary": 1000.0,
+            "address": "Main St",
+            "in_vacation": index == 1,
+        }
+        assert client.post("/employees", json=payload).status_code == 201
+
+    ndjson = client.get("/employees/export")
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [row["id"] for row in rows] == [1, 2, 3]
+    assert rows[1]["in_vacation"] is True
+
+    framed = client.get("/employees/export", params={"format": "msgpack"}).content
+    decoded: list[dict[str, object]] = []
+    while framed:
+        (length,) = struct.unpack(">I", framed[:4])
+        decoded += msgpack.unpackb(framed[4 : 4 + length], raw=False)
+        framed = framed[4 + length :]
+    assert decoded == rows
+
+
+def test_sqlite_profile_enables_wal_and_read_engine_refuses_writes(tmp_path: Path) -> None:
+    url = f"sqlite:///{tmp_path / 'profile.db'}"
+    write_engine = create_engine(url)
+    configure_sqlite(write_engine, sqlite_pragmas("wal"))
+    read_engine = create_engine(url)
+    configure_sqlite(read_engine, sqlite_pragmas("wal", read_only=True))
+    create_schema(write_engine)
+
+    with write_engine.connect() as connection:
+        assert connection.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert connection.scalar(text("PRAGMA synchronous")) == 1  # NORMAL
+        assert connection.scalar(text("PRAGMA busy_timeout")) == 5000
+    with read_engine.connect() as connection:
+        assert connection.scalar(text("SELECT count(*) FROM read_employees")) == 0
+        with pytest.raises(OperationalError, match="readonly"):
+            connection.execute(text("DELETE FROM read_employees"))
+    with pytest.raises(ValueError):
+        sqlite_pragmas("turbo")
+    read_engine.dispose()
+    write_engine.dispose()
+
+
+def test_api_refuses_relay_mode_when_no_relay_drains_the_outbox(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(registry, "OUTBOX_DISPATCH_MODE", "relay")
+    with pytest.raises(RuntimeError, match="OUTBOX_RELAY_EXTERNAL"), TestClient(app):
+        pass
+
+
+def test_api_keeps_the_read_replica_to_a_single_projecting_process(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(registry, "READ_REPLICA_ENABLED", True)
+    monkeypatch.setattr(registry, "API_WORKERS", 2)
+    with pytest.raises(RuntimeError, match="single API worker"), TestClient(app):
+        pass
+
+    # An external relay projects the events, so this process would serve a frozen copy.
+    monkeypatch.setattr(registry, "API_WORKERS", 1)
+    monkeypatch.setattr(registry, "OUTBOX_DISPATCH_MODE", "relay")
+    monkeypatch.setattr(main, "OUTBOX_RELAY_EXTERNAL", True)
+    with TestClient(app) as client:
+        assert app.state.container.read_replica is None
+        assert client.get("/employees/").status_code == 200
+    assert "read_replica_skipped" in caplog.text
+
+    monkeypatch.setattr(registry, "OUTBOX_DISPATCH_MODE", "inline")
+    with TestClient(app):
+        assert app.state.container.read_replica is not None
@@ -0,0 +1,250 @@
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+from app import models, schemas
+from app.database import ScopedSession, bind_session, create_schema
+from application.commands.employees import CreateEmployeeCommand
+from application.mediator.behaviors import CacheBehavior, GroupCommitBehavior
+from application.mediator.mediator import Mediator
+from application.mediator.registry import MediatorContainer, create_mediator
+from application.queries.base import IQuery
+from infrastructure.cache.cache_provider import AsyncCacheAdapter, CacheProvider
+from infrastructure.outbox.outbox_repository import OutboxRecord
+from infrastructure.write.group_commit import GroupCommitWriter, create_writer_engine
+from sqlalchemy import Connection, create_engine, event, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+
+def test_container_scopes_share_one_mediator() -> None:
+    container = MediatorContainer(CacheProvider())
+    engine = create_engine("sqlite:///:memory:")
+    with Session(engine) as first, Session(engine) as second:
+        assert container.scope(first)._mediator is container.scope(second)._mediator
+
+        with bind_session(first):
+            assert ScopedSession() is first
+            with bind_session(second):
+                assert ScopedSession() is second
+            assert ScopedSession() is first
+
+    with pytest.raises(RuntimeError):
+        ScopedSession()
+
+
+@dataclass
+class _PlainQuery(IQuery):
+    pass
+
+
+@dataclass
+class _CachedQuery(IQuery):
+    cache_key: str = "k"
+    cache_ttl_seconds: int = 5
+
+
+class _RecordingBehavior:
+    def __init__(self, name: str, calls: list[str]) -> None:
+        self.name = name
+        self.calls = calls
+
+    def handle(self, query: Any, next_handler: Callable[[Any], Any]) -> Any:
+        self.calls.append(self.name)
+        return next_handler(query)
+
+    async def handle_async(self, query: Any, next_handler: Callable[[Any], Awaitable[Any]]) -> Any:
+        self.calls.append(f"{self.name}_async")
+        return await next_handler(query)
+
+
+def test_compiled_pipeline_runs_behaviors_in_order_and_skips_non_applicable() -> None:
+    calls: list[str] = []
+    cache = CacheProvider()
+    mediator = Mediator(
+        behaviors=[
+            CacheBehavior(cache),
+            _RecordingBehavior("outer", calls),
+            _RecordingBehavior("inner", calls),
+        ]
+    )
+    mediator.register_handler(_PlainQuery, lambda q: calls.append("handler") or "plain")
+    mediator.register_handler(_CachedQuery, lambda q: "cached")
+
+    assert mediator.send(_PlainQuery()) == "plain"
+    assert calls == ["outer", "inner", "handler"]
+    assert cache.metrics.cache_miss_count == 0
+
+    assert mediator.send(_CachedQuery()) == "cached"
+    assert cache.get("k") == "cached"
+
+    with pytest.raises(ValueError, match="Unsupported message type"):
+        mediator.send(object())
+
+
+def test_send_async_uses_async_pipeline_and_shared_cache() -> None:
+    calls: list[str] = []
+    cache = CacheProvider()
+    mediator = Mediator(
+        behaviors=[
+            CacheBehavior(cache, async_cache=AsyncCacheAdapter(cache)),
+            _RecordingBehavior("outer", calls),
+        ]
+    )
+
+    async def handler(query: _CachedQuery) -> str:
+        calls.append("handler")
+        return "value"
+
+    mediator.register_async_handler(_CachedQuery, handler)
+
+    assert asyncio.run(mediator.send_async(_CachedQuery())) == "value"
+    assert asyncio.run(mediator.send_async(_CachedQuery())) == "value"
+    assert calls == ["outer_async", "handler"]
+    assert cache.get("k") == "value"
+
+
+def test_cache_misses_are_single_flighted_and_stale_entries_are_served_while_refreshing() -> None:
+    cache = CacheProvider()
+    mediator = Mediator(
+        behaviors=[
+            CacheBehavior(cache, async_cache=AsyncCacheAdapter(cache), stale_ttl_seconds=30),
+        ]
+    )
+    loads: list[int] = []
+
+    async def handler(query: _CachedQuery) -> int:
+        loads.append(len(loads))
+        await asyncio.sleep(0.05)
+        return len(loads)
+
+    mediator.register_async_handler(_CachedQuery, handler)
+
+    async def burst() -> list[Any]:
+        return await asyncio.gather(*(mediator.send_async(_CachedQuery()) for _ in range(20)))
+
+    assert asyncio.run(burst()) == [1] * 20
+    assert len(loads) == 1
+
+    # Past its TTL but inside the stale window: one caller refreshes, the rest get
+    # the old value immediately instead of queueing on the database.
+    cache.get("k")["fresh_until"] = 0
+    results = asyncio.run(burst())
+    assert len(loads) == 2
+    assert sorted(results) == [1] * 19 + [2]
+    assert asyncio.run(mediator.send_async(_CachedQuery())) == 2
+
+
+def test_group_commit_writer_shares_one_transaction_and_isolates_failures(tmp_path: Path) -> None:
+    engine = create_writer_engine(f"sqlite:///{tmp_path / 'group.db'}")
+    create_schema(engine)
+    transactions: list[Connection] = []
+    event.listen(engine, "begin", transactions.append)
+    writer = GroupCommitWriter(engine, window_seconds=0.2)
+    writer.start()
+    mediator = create_mediator(CacheProvider(), write_coordinator=writer)
+    payloads = [
+        schemas.EmployeeCreate(name=f"N{i}", lastname="Doe", salary=1000.0, address="Main St")
+        for i in range(5)
+    ]
+    # Skips validation so the INSERT itself fails (NOT NULL) inside the group.
+    invalid = schemas.EmployeeCreate.construct(name=None, lastname="Doe", salary=1.0, address="x")
+
+    async def burst() -> list[Any]:
+        commands = [CreateEmployeeCommand(payload) for payload in [*payloads, invalid]]
+        return await asyncio.gather(
+            *(mediator.send_async(command) for command in commands), return_exceptions=True
+        )
+
+    try:
+        *created, failed = asyncio.run(burst())
+    finally:
+        writer.stop()
+    assert len(transactions) == 1
+    assert isinstance(failed, IntegrityError)
+    assert sorted(employee.name for employee in created) == [f"N{i}" for i in range(5)]
+    with Session(engine) as db:
+        assert db.scalar(select(func.count()).select_from(models.Employee)) == 5
+        assert db.scalar(select(func.count()).select_from(OutboxRecord)) == 5
+    engine.dispose()
+
+
+def test_group_commit_writer_resolves_every_command_submitted_while_stopping(
+    tmp_path: Path,
+) -> None:
+    engine = create_writer_engine(f"sqlite:///{tmp_path / 'stop.db'}")
+    writer = GroupCommitWriter(engine, window_seconds=0.001)
+    writer.register(int, lambda command: command)
+    futures: list[Future[Any]] = []
+    start = threading.Barrier(5)
+
+    def submit_until_refused() -> None:
+        start.wait()
+        while True:
+            try:
+                futures.append(writer.submit(len(futures)))
+            except RuntimeError:
+                return
+
+    writer.start()
+    threads = [threading.Thread(target=submit_until_refused) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    time.sleep(0.05)
+    writer.stop()
+    for thread in threads:
+        thread.join(5)
+        assert not thread.is_alive()
+
+    # Every accepted command either ran or was failed on shutdown; none is left hanging.
+    assert futures
+    for future in futures:
+        error = future.exception(timeout=5)
+        assert error is None or isinstance(error, RuntimeError)
+    engine.dispose()
+
+
+def test_group_commit_timeout_waits_for_a_running_command_and_drops_a_queued_one(
+    tmp_path: Path,
+) -> None:
+    engine = create_writer_engine(f"sqlite:///{tmp_path / 'timeout.db'}")
+    writer = GroupCommitWriter(engine, window_seconds=0.001, result_timeout=0.05)
+    ran: list[int] = []
+    started = threading.Event()
+
+    def slow(command: int) -> int:
+        started.set()
+        time.sleep(0.2)
+        ran.append(command)
+        return command
+
+    writer.register(int, slow)
+    writer.start()
+    behavior = GroupCommitBehavior(writer)
+    try:
+        # Already running when the wait expires: the caller gets the committed result.
+        assert behavior.handle(1, lambda command: None) == 1
+
+        async def unused(command: Any) -> None:
+            return None
+
+        assert asyncio.run(behavior.handle_async(2, unused)) == 2
+
+        # Still queued behind a running group: cancelled, so it never commits later.
+        started.clear()
+        blocker = writer.submit(3)
+        assert started.wait(1)
+        with pytest.raises(TimeoutError):
+            behavior.handle(4, lambda command: None)
+        assert blocker.result(1) == 3
+    finally:
+        writer.stop()
+    assert ran == [1, 2, 3]
+    engine.dispose()
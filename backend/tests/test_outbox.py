@@ -0,0 +1,424 @@
+import json
+from collections.abc import Generator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import ClassVar
+
+import msgpack
+import pytest
+from app.database import PartitionedSession, create_schema
+from app.models import Employee, ReadEmployee
+from application.mediator.behaviors import OutboxDispatchBehavior
+from application.mediator.registry import MediatorContainer
+from application.queries.employees import GetEmployeeByIdQuery, GetEmployeesQuery
+from application.read_models.projectors.employees_projector import EmployeesProjector
+from application.read_models.ttl_config import (
+    EMPLOYEE_LIST_CACHE_NAMESPACE,
+    employee_detail_cache_key,
+)
+from domain.events.base import DomainEvent
+from domain.events.employees import EmployeeCreated, EmployeeDeleted, EmployeeUpdated
+from infrastructure.cache.cache_provider import CacheProvider
+from infrastructure.outbox.event_codec import EventCodec, decode_event
+from infrastructure.outbox.outbox_processor import OutboxProcessor
+from infrastructure.outbox.outbox_repository import (
+    OutboxArchiveRecord,
+    OutboxRecord,
+    OutboxRepository,
+)
+from infrastructure.outbox.relay import OutboxRelay
+from infrastructure.outbox.retention import OutboxRetention
+from infrastructure.read_repository.employee_read_replica import EmployeeReadReplica
+from infrastructure.read_repository.employees_read_repository import EmployeesReadRepository
+from infrastructure.read_repository.rebuild import ReadModelRebuilder
+from infrastructure.write.group_commit import create_writer_engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.event import listen
+from sqlalchemy.orm import Session, sessionmaker
+
+
+@pytest.fixture()
+def session_factory(tmp_path: Path) -> Generator[sessionmaker[Session], None, None]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}")
+    create_schema(engine)
+    yield sessionmaker[Session](autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def _enqueue(session_factory: sessionmaker[Session], *events: DomainEvent) -> None:
+    with session_factory() as db:
+        repository = OutboxRepository(db)
+        for event in events:
+            repository.add_event(event)
+        db.commit()
+
+
+def test_relay_projects_pending_events_and_invalidates_cache(
+    session_factory: sessionmaker[Session],
+) -> None:
+    container = MediatorContainer(CacheProvider())
+    list_generation = container.cache.get_generation(EMPLOYEE_LIST_CACHE_NAMESPACE)
+    container.cache.set(employee_detail_cache_key(1), {"stale": True}, 60)
+    _enqueue(
+        session_factory,
+        EmployeeCreated(id=1, name="Ada", lastname="L", salary=1.0, address="x", in_vacation=False),
+        EmployeeUpdated(id=1, fields_changed={"salary": 2.0}),
+    )
+
+    relay = container.create_relay(session_factory, poll_interval=0.01, batch_size=10)
+    assert relay.run_once() == 2
+    assert relay.run_once() == 0
+
+    with session_factory() as db:
+        employee = db.get(ReadEmployee, 1)
+        assert employee is not None and employee.salary == 2.0
+        assert db.query(OutboxRecord).filter(OutboxRecord.processed_at.is_(None)).count() == 0
+    # One generation bump per batch orphans every list page; details go by key.
+    assert container.cache.get_generation(EMPLOYEE_LIST_CACHE_NAMESPACE) == list_generation + 1
+    assert container.cache.get(employee_detail_cache_key(1)) is None
+
+    relay.start()
+    relay.stop(timeout=1.0)
+
+
+def test_outbox_stores_binary_payloads_and_still_projects_legacy_json_rows(
+    session_factory: sessionmaker[Session],
+) -> None:
+    created = EmployeeCreated(
+        id=1, name="Ada", lastname="L", salary=1.0, address="x", in_vacation=False
+    )
+    with session_factory() as db:
+        db.add(
+            OutboxRecord(
+                id=str(created.event_id),
+                event_type=created.event_type,
+                payload=json.dumps(created.serialize()),
+            )
+        )
+        db.commit()
+    updated = EmployeeUpdated(id=1, fields_changed={"salary": 2.0})
+    _enqueue(session_factory, updated)
+
+    with session_factory() as db:
+        legacy, binary = [
+            record.payload for record in db.query(OutboxRecord).order_by(OutboxRecord.created_at)
+        ]
+    assert isinstance(legacy, str) and isinstance(binary, bytes)
+    assert decode_event(created.event_type, legacy) == created
+    assert decode_event(updated.event_type, binary) == updated
+
+    relay = MediatorContainer(CacheProvider()).create_relay(session_factory, batch_size=10)
+    assert relay.run_once() == 2
+    with session_factory() as db:
+        employee = db.get(ReadEmployee, 1)
+        assert employee is not None and employee.salary == 2.0
+
+
+@dataclass(frozen=True)
+class _Tagged(DomainEvent):
+    schema_version: ClassVar[int] = 2
+
+    id: int
+    tag: str
+
+
+def test_event_codec_upcasts_payloads_written_by_an_older_schema_version() -> None:
+    event = _Tagged(id=7, tag="none")
+    # Version 1 of the event had no ``tag``.
+    old = msgpack.packb([1, event.event_id.bytes, event.occurred_on, 7], datetime=True)
+
+    with pytest.raises(ValueError, match="No upcaster"):
+        EventCodec(_Tagged).decode(old)
+    codec = EventCodec(_Tagged, upcasters={1: lambda values: [*values, "none"]})
+    assert codec.decode(old) == event
+    assert codec.decode(codec.encode(event)) == event
+
+
+def test_pending_events_of_one_batch_come_back_in_insertion_order(
+    session_factory: sessionmaker[Session],
+) -> None:
+    events: list[DomainEvent] = []
+    for i in range(1, 51):
+        events += [
+            EmployeeCreated(
+                id=i, name="N", lastname="Doe", salary=1.0, address="x", in_vacation=False
+            ),
+            EmployeeUpdated(id=i, fields_changed={"salary": 2.0}),
+            EmployeeDeleted(id=i),
+        ]
+    with session_factory() as db:
+        repository = OutboxRepository(db)
+        repository.add_events(events)
+        db.commit()
+        pending = repository.get_unprocessed_events(limit=len(events))
+    assert [record.id for record in pending] == [str(event.event_id) for event in events]
+
+
+def test_relay_writes_across_separate_write_and_read_model_databases(tmp_path: Path) -> None:
+    write_engine = create_engine(f"sqlite:///{tmp_path / 'write.db'}")
+    read_model_engine = create_engine(f"sqlite:///{tmp_path / 'read.db'}")
+    create_schema(write_engine, read_model_engine)
+    session_factory = sessionmaker[Session](
+        autoflush=False,
+        bind=write_engine,
+        class_=PartitionedSession,
+        read_model_bind=read_model_engine,
+    )
+    _enqueue(
+        session_factory,
+        EmployeeCreated(id=1, name="Ada", lastname="L", salary=1.0, address="x", in_vacation=False),
+        EmployeeCreated(id=2, name="Bob", lastname="L", salary=1.0, address="x", in_vacation=False),
+        EmployeeDeleted(id=2),
+    )
+
+    relay = MediatorContainer(CacheProvider()).create_relay(session_factory, batch_size=10)
+    assert relay.run_once() == 3
+
+    assert "read_employees" not in inspect(write_engine).get_table_names()
+    assert "outbox_events" not in inspect(read_model_engine).get_table_names()
+    with read_model_engine.connect() as connection:
+        assert connection.execute(text("SELECT id, name FROM read_employees")).all() == [(1, "Ada")]
+    with write_engine.connect() as connection:
+        pending = "SELECT count(*) FROM outbox_events WHERE processed_at IS NULL"
+        assert connection.scalar(text(pending)) == 0
+    write_engine.dispose()
+    read_model_engine.dispose()
+
+
+def test_rebuild_swaps_in_read_model_copied_from_table_or_replayed_from_outbox(
+    tmp_path: Path,
+) -> None:
+    write_engine = create_engine(f"sqlite:///{tmp_path / 'write.db'}")
+    read_model_engine = create_writer_engine(f"sqlite:///{tmp_path / 'read.db'}")
+    create_schema(write_engine, read_model_engine)
+    with Session(write_engine) as db:
+        for i in (1, 2, 3, 7, 8):
+            db.add(Employee(id=i, name=f"E{i}", lastname="L", salary=float(i), address="x"))
+        db.commit()
+    with Session(read_model_engine) as db:
+        db.add(ReadEmployee(id=1, name="stale", lastname="L", salary=0.0, address="x"))
+        db.add(ReadEmployee(id=99, name="orphan", lastname="L", salary=0.0, address="x"))
+        db.commit()
+
+    stages: list[tuple[str, int, int]] = []
+    rebuilder = ReadModelRebuilder(
+        write_engine,
+        read_model_engine,
+        chunk_size=2,
+        workers=2,
+        progress=lambda stage, done, total: stages.append((stage, done, total)),
+    )
+    result = rebuilder.rebuild_from_table()
+
+    assert (result.rows, result.events, result.caught_up) == (5, 0, 0)
+    assert stages[-1] == ("copy", 5, 5)
+    with read_model_engine.connect() as connection:
+        rows = connection.execute(text("SELECT id, name FROM read_employees")).all()
+    assert rows == [(1, "E1"), (2, "E2"), (3, "E3"), (7, "E7"), (8, "E8")]
+    inspector = inspect(read_model_engine)
+    assert "read_employees_rebuild" not in inspector.get_table_names()
+    assert [index["name"] for index in inspector.get_indexes("read_employees")] == [
+        "ix_read_employees_id"
+    ]
+
+    old = datetime.now(UTC) - timedelta(days=1)
+    created = EmployeeCreated(
+        id=1, name="Ada", lastname="L", salary=1.0, address="x", in_vacation=False
+    )
+    with Session(write_engine) as db:
+        db.add(
+            OutboxArchiveRecord(
+                id=str(created.event_id),
+                event_type=created.event_type,
+                payload=json.dumps(created.serialize()),
+                created_at=old,
+                processed_at=old,
+            )
+        )
+        db.commit()
+    _enqueue(
+        sessionmaker[Session](bind=write_engine),
+        EmployeeUpdated(id=1, fields_changed={"name": "Ann"}),
+        EmployeeCreated(id=2, name="Bob", lastname="L", salary=1.0, address="x", in_vacation=False),
+        EmployeeDeleted(id=2),
+    )
+
+    result = rebuilder.replay_outbox()
+
+    # The three recent events are replayed again at swap time; the result is the same.
+    assert (result.rows, result.events, result.caught_up) == (1, 4, 3)
+    with read_model_engine.connect() as connection:
+        rows = connection.execute(text("SELECT id, name FROM read_employees")).all()
+    assert rows == [(1, "Ann")]
+    write_engine.dispose()
+    read_model_engine.dispose()
+
+
+def test_read_replica_follows_committed_projections_and_answers_queries(
+    session_factory: sessionmaker[Session],
+) -> None:
+    with session_factory() as db:
+        db.add(ReadEmployee(id=5, name="Eve", lastname="L", salary=1.0, address="x"))
+        db.commit()
+    replica = EmployeeReadReplica()
+    with session_factory() as db:
+        assert replica.load(EmployeesReadRepository(db).iter_rows()) == 1
+    container = MediatorContainer(CacheProvider(), read_replica=replica)
+    _enqueue(
+        session_factory,
+        EmployeeCreated(id=1, name="Ada", lastname="L", salary=1.0, address="x", in_vacation=False),
+        EmployeeCreated(id=9, name="Ivy", lastname="L", salary=1.0, address="x", in_vacation=False),
+        EmployeeUpdated(id=1, fields_changed={"salary": 2.0}),
+        EmployeeDeleted(id=5),
+    )
+    first = container.mediator.send(GetEmployeesQuery(limit=1))
+    assert container.create_relay(session_factory, batch_size=10).run_once() == 4
+
+    # No session is bound here: both queries are answered from memory.
+    page = container.mediator.send(GetEmployeesQuery(limit=1))
+    assert page["etag"] != first["etag"]
+    assert page["value"] == {
+        "items": [
+            {
+                "id": 1,
+                "name": "Ada",
+                "lastname": "L",
+                "salary": 2.0,
+                "address": "x",
+                "in_vacation": False,
+            }
+        ],
+        "next_cursor": 1,
+    }
+    last = container.mediator.send(GetEmployeesQuery(limit=1, after=1))
+    assert [item["id"] for item in last["value"]["items"]] == [9]
+    assert last["value"]["next_cursor"] is None
+    assert container.mediator.send(GetEmployeesQuery(limit=1, if_none_match=page["etag"])) == {
+        "etag": page["etag"],
+        "value": None,
+    }
+    assert container.mediator.send(GetEmployeeByIdQuery(5)) is None
+
+    assert container.check_read_replica(session_factory).consistent
+    replica.apply([EmployeeDeleted(id=9)])
+    diff = container.check_read_replica(session_factory)
+    assert (diff.missing, diff.unexpected, diff.mismatched) == ([9], [], [])
+    footprint = replica.footprint()
+    assert footprint.rows == 1 and footprint.total_bytes > 0
+
+
+def test_failed_batch_falls_back_to_per_record_isolation(
+    session_factory: sessionmaker[Session],
+) -> None:
+    projected: list[int] = []
+
+    def project(event: DomainEvent) -> None:
+        assert isinstance(event, EmployeeDeleted)
+        if event.id == 2:
+            raise RuntimeError("boom")
+        projected.append(event.id)
+
+    events = [EmployeeDeleted(id=i) for i in (1, 2, 3)]
+    _enqueue(session_factory, *events)
+    with session_factory() as db:
+        processor = OutboxProcessor(OutboxRepository(db), {"EmployeeDeleted": project})
+        # Progress, not fetched rows: the poisoned event stays pending and is not counted.
+        assert processor.process_pending_events(limit=10) == 2
+        pending = db.query(OutboxRecord.id).filter(OutboxRecord.processed_at.is_(None)).all()
+
+    # First pass (batched) rolls back after projecting 1; the per-record replay then
+    # projects 1 and 3 on their own and leaves only the poisoned event pending.
+    assert projected == [1, 1, 3]
+    assert [row.id for row in pending] == [str(events[1].event_id)]
+
+
+def test_drain_and_relay_stop_on_a_full_batch_that_keeps_failing(
+    session_factory: sessionmaker[Session],
+) -> None:
+    attempts: list[int] = []
+
+    def project(event: DomainEvent) -> None:
+        assert isinstance(event, EmployeeDeleted)
+        attempts.append(event.id)
+        raise RuntimeError("boom")
+
+    _enqueue(session_factory, *(EmployeeDeleted(id=i) for i in (1, 2)))
+    with session_factory() as db:
+        processor = OutboxProcessor(OutboxRepository(db), {"EmployeeDeleted": project})
+        behavior = OutboxDispatchBehavior(processor, batch_size=2)
+        assert behavior.handle(object(), lambda command: "done") == "done"
+        # One batched attempt plus one per-record replay, then the drain gives up.
+        assert attempts == [1, 1, 2]
+
+        relay = OutboxRelay(processor, session_factory, poll_interval=0.01, batch_size=2)
+        # Nothing marked means run_forever waits out poll_interval instead of re-polling.
+        assert relay.run_once() == 0
+
+
+def test_project_batch_coalesces_events_into_set_based_statements(
+    session_factory: sessionmaker[Session],
+) -> None:
+    with session_factory() as db:
+        db.add(ReadEmployee(id=2, name="B", lastname="L", salary=1.0, address="x"))
+        db.add(ReadEmployee(id=3, name="C", lastname="L", salary=1.0, address="x"))
+        db.commit()
+
+    def created(employee_id: int) -> EmployeeCreated:
+        return EmployeeCreated(
+            id=employee_id, name="A", lastname="L", salary=1.0, address="x", in_vacation=False
+        )
+
+    events: list[DomainEvent] = [
+        created(1),
+        EmployeeUpdated(id=1, fields_changed={"salary": 5.0}),
+        EmployeeUpdated(id=2, fields_changed={"name": "Bee"}),
+        EmployeeUpdated(id=2, fields_changed={"salary": 9.0, "unknown": 1}),
+        EmployeeUpdated(id=3, fields_changed={"name": "Cee"}),
+        EmployeeDeleted(id=3),
+        created(4),
+        EmployeeDeleted(id=4),
+    ]
+    statements: list[str] = []
+    with session_factory() as db:
+        bind = db.get_bind()
+        listen(bind, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        EmployeesProjector(EmployeesReadRepository(db)).project_batch(events)
+        db.commit()
+        statement_count = len(statements)
+        rows = {row.id: (row.name, row.salary) for row in db.query(ReadEmployee).all()}
+
+    assert rows == {1: ("A", 5.0), 2: ("Bee", 9.0)}
+    assert statement_count == 3  # one DELETE, one upsert, one UPDATE
+
+
+def test_retention_archives_old_processed_events_in_chunks(
+    session_factory: sessionmaker[Session],
+) -> None:
+    old = datetime.now(UTC) - timedelta(days=30)
+    with session_factory() as db:
+        for i in range(5):
+            db.add(
+                OutboxRecord(
+                    id=f"old-{i}", event_type="E", payload="{}", created_at=old, processed_at=old
+                )
+            )
+        db.add(OutboxRecord(id="fresh", event_type="E", payload="{}", processed_at=datetime.now()))
+        db.add(OutboxRecord(id="pending", event_type="E", payload="{}", created_at=old))
+        db.commit()
+
+        plan = db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM outbox_events "
+                "WHERE processed_at IS NULL ORDER BY created_at, id LIMIT 50"
+            )
+        ).all()
+        assert "ix_outbox_events_pending_order" in str(plan)
+        assert "TEMP B-TREE" not in str(plan)
+
+    retention = OutboxRetention(session_factory, timedelta(days=7), chunk_size=2, archive=True)
+    assert retention.run_once() == 5
+
+    with session_factory() as db:
+        assert {row.id for row in db.query(OutboxRecord.id)} == {"fresh", "pending"}
+        assert db.query(OutboxArchiveRecord).count() == 5
@@ -34,12 +34,19 @@ export default function Home() {
     setLoading(true);
     setError(null);
     try {
-      const res = await fetch(`${API_URL}/employees`);
-      if (!res.ok) {
-        throw new Error('Could not load employees');
-      }
-      const data = await res.json();
-      setEmployees(data);
+      // The list is paginated by cursor; follow X-Next-Cursor until the last page.
+      const all: Employee[] = [];
+      let cursor: string | null = null;
+      do {
+        const query: string = cursor ? `?after=${cursor}` : '';
+        const res: Response = await fetch(`${API_URL}/employees${query}`);
+        if (!res.ok) {
+          throw new Error('Could not load employees');
+        }
+        all.push(...(await res.json()));
+        cursor = res.headers.get('X-Next-Cursor');
+      } while (cursor);
+      setEmployees(all);
     } catch (err) {
       setError((err as Error).message);
     } finally {